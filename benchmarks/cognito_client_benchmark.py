@@ -0,0 +1,69 @@
+"""
+Compares creating a new boto3 Cognito client per call with the shared, pooled client of AwsCognitoClient.
+
+Usage: python -m benchmarks.cognito_client_benchmark [--calls 200]
+"""
+import argparse
+import statistics
+import time
+
+from benchmarks.cognito_stub import CognitoStubServer
+from benchmarks.environment import configure_cognito
+
+
+def measure(call, calls: int) -> list[float]:
+    durations = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        durations.append(time.perf_counter() - start)
+
+    return durations
+
+
+def report(name: str, durations: list[float]) -> None:
+    durations = sorted(durations)
+    p95 = durations[int(len(durations) * 0.95) - 1]
+    print(f"{name:<22} mean {statistics.mean(durations) * 1000:8.2f} ms    p95 {p95 * 1000:8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    server = CognitoStubServer().start()
+    configure_cognito(server.endpoint_url)
+
+    import boto3
+
+    from accounts.services.aws_cognito_client import AwsCognitoClient
+
+    cognito_client = AwsCognitoClient()
+
+    def client_per_call():
+        # Behaviour before the client was shared, a new client (and connection) on every call
+        client = boto3.client(
+            "cognito-idp",
+            aws_access_key_id=cognito_client.aws_access_key,
+            aws_secret_access_key=cognito_client.aws_secret_access_key,
+            region_name=cognito_client.region_name,
+            endpoint_url=cognito_client.endpoint_url,
+        )
+        client.global_sign_out(AccessToken="access-token")
+
+    def shared_client():
+        cognito_client.get_client().global_sign_out(AccessToken="access-token")
+
+    # Warm up both paths, so the first shared call does not include the client creation
+    client_per_call()
+    shared_client()
+
+    report("client per call", measure(client_per_call, args.calls))
+    report("shared pooled client", measure(shared_client, args.calls))
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Local stand-in for the AWS Cognito API, used by the benchmarks.
+
+The server speaks the JSON protocol used by boto3 and answers every supported operation with a minimal valid
+response after an optional artificial latency.
+"""
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+RESPONSES = {
+    "SignUp": lambda: {"UserConfirmed": False, "UserSub": str(uuid.uuid4())},
+    "InitiateAuth": lambda: {
+        "AuthenticationResult": {
+            "AccessToken": "access-token",
+            "RefreshToken": "refresh-token",
+            "ExpiresIn": 3600,
+            "TokenType": "Bearer",
+        }
+    },
+}
+
+
+class CognitoStubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        operation = self.headers.get("X-Amz-Target", "").split(".")[-1]
+
+        self.server.request_count += 1
+        time.sleep(self.server.latency)
+
+        body = json.dumps(RESPONSES.get(operation, dict)()).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-amz-json-1.1")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class CognitoStubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, latency: float = 0.0):
+        super().__init__(("127.0.0.1", 0), CognitoStubHandler)
+        self.latency = latency
+        self.request_count = 0
+
+    @property
+    def endpoint_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def start(self) -> "CognitoStubServer":
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
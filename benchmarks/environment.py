@@ -0,0 +1,38 @@
+"""
+Environment setup shared by the benchmarks, which run outside the Django server.
+"""
+import os
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def configure_cognito(endpoint_url: str) -> None:
+    """
+    Points the Cognito settings at a local stand-in and makes the project sources importable.
+
+    :param endpoint_url: URL of the running stand-in server.
+    """
+    for name in ["AWS_ACCESS_KEY", "AWS_SECRET_ACCESS_KEY", "COGNITO_CLIENT_ID", "COGNITO_CLIENT_SECRET",
+                 "COGNITO_USER_POOL_ID"]:
+        os.environ.setdefault(name, "benchmark")
+    os.environ.setdefault("COGNITO_REGION_NAME", "us-east-1")
+    os.environ["COGNITO_ENDPOINT_URL"] = endpoint_url
+
+    if str(BASE_DIR / "src") not in sys.path:
+        sys.path.insert(0, str(BASE_DIR / "src"))
+
+
+def setup_django() -> None:
+    """
+    Configures Django with the project settings, which are read from the environment or the .env file.
+    """
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+    for path in [BASE_DIR, BASE_DIR / "src"]:
+        if str(path) not in sys.path:
+            sys.path.insert(0, str(path))
+
+    import django
+    django.setup()
@@ -0,0 +1,94 @@
+"""
+Measures the latency of PostSearchService.search on a seeded dataset.
+
+--posts posts of random English words are inserted by the database itself, then every query is run --calls times
+for the first page and for a page deep into the results. The seeded posts are removed afterwards unless --keep
+is given.
+
+Usage: python -m benchmarks.post_search_benchmark [--posts 2000000] [--calls 50] [--keep]
+Requires the Django settings environment (.env) and PostgreSQL to be available.
+"""
+import argparse
+import statistics
+import time
+import uuid
+
+from benchmarks.environment import setup_django
+
+WORDS = [
+    "coffee", "morning", "river", "music", "football", "weekend", "travel", "garden", "pizza", "sunset",
+    "python", "django", "database", "holiday", "mountain", "concert", "recipe", "winter", "summer", "friends",
+    "movie", "book", "city", "train", "beach", "rain", "running", "dinner", "school", "office",
+    "market", "election", "weather", "festival", "museum", "bicycle", "camera", "library", "ocean", "forest",
+]
+QUERIES = ["coffee", "mountain sunset", '"summer holiday"', "python -django", "ra", "festival or concert"]
+
+
+def measure(call, calls: int) -> list[float]:
+    durations = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        durations.append(time.perf_counter() - start)
+
+    return sorted(durations)
+
+
+def report(name: str, durations: list[float]) -> None:
+    p95 = durations[max(int(len(durations) * 0.95) - 1, 0)]
+    print(f"{name:<32} mean {statistics.mean(durations) * 1000:8.2f} ms    p95 {p95 * 1000:8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--posts", type=int, default=2_000_000)
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--keep", action="store_true", help="Keep the seeded posts.")
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.db import connection
+
+    from accounts.models import User
+    from posts.models import Post
+    from posts.services.post_search_service import PostSearchService
+
+    name = f"bench{uuid.uuid4().hex[:8]}"
+    user = User.objects.create(username=name, email=f"{name}@email.com", cognito_id=name)
+
+    start = time.perf_counter()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {Post._meta.db_table} (user_id, content, timestamp, like_count)
+            SELECT %(user_id)s,
+                   array_to_string(ARRAY(
+                       SELECT (%(words)s::text[])[1 + floor(random() * %(word_count)s)::int]
+                       FROM generate_series(1, 8 + (post %% 8))
+                   ), ' '),
+                   now() - post * interval '1 second',
+                   0
+            FROM generate_series(1, %(posts)s) AS post
+            """,
+            {"user_id": user.id, "words": WORDS, "word_count": len(WORDS), "posts": args.posts},
+        )
+        cursor.execute(f"ANALYZE {Post._meta.db_table}")
+    print(f"Seeded {args.posts} posts in {time.perf_counter() - start:.1f} s")
+
+    service = PostSearchService()
+    for query in QUERIES:
+        report(f"{query!r} first page", measure(lambda: service.search(query), args.calls))
+
+        _, cursor = service.search(query, limit=1000)
+        if cursor:
+            report(f"{query!r} after 1000", measure(lambda: service.search(query, cursor), args.calls))
+
+    if not args.keep:
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {Post._meta.db_table} WHERE user_id = %s", [user.id])
+        user.delete()
+
+
+if __name__ == "__main__":
+    main()
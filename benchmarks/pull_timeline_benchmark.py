@@ -0,0 +1,104 @@
+"""
+Measures how long PullTimelineService takes to assemble the first page of a home timeline for users following
+10, 1,000 and 10,000 authors.
+
+For every size a user following that many authors is created, every author with --posts posts. Three cases are
+measured: cold (the recent posts of the authors are loaded from the database), warm (the recent posts are in Redis,
+only the page cache is cleared) and cached (the page comes from the page cache). The created rows and Redis keys are
+removed afterwards.
+
+Usage: python -m benchmarks.pull_timeline_benchmark [--calls 20] [--posts 5] [--sizes 10 1000 10000]
+Requires the Django settings environment (.env), PostgreSQL and Redis to be available.
+"""
+import argparse
+import statistics
+import time
+import uuid
+from datetime import timedelta
+
+from benchmarks.environment import setup_django
+
+
+def measure(call, calls: int) -> list[float]:
+    durations = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        durations.append(time.perf_counter() - start)
+
+    return sorted(durations)
+
+
+def report(name: str, durations: list[float]) -> None:
+    p99 = durations[max(int(len(durations) * 0.99) - 1, 0)]
+    print(f"{name:<22} mean {statistics.mean(durations) * 1000:8.2f} ms    p99 {p99 * 1000:8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--posts", type=int, default=5, help="Posts created per followed author.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 10000])
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.utils import timezone
+
+    from accounts.models import User
+    from followers.models import Follow
+    from posts.models import Post
+    from timelines.services.author_posts_cache import AuthorPostsCache
+    from timelines.services.pull_timeline_service import PullTimelineService
+    from timelines.settings.timeline_settings import TIMELINE_PAGE_SIZE
+    from utils.redis_client import get_redis_client
+
+    service = PullTimelineService()
+    redis_client = get_redis_client()
+    now = timezone.now()
+
+    for size in args.sizes:
+        prefix = f"bench{uuid.uuid4().hex[:8]}"
+        reader = User.objects.create(username=prefix, email=f"{prefix}@email.com", cognito_id=prefix)
+        authors = User.objects.bulk_create(
+            User(username=f"{prefix}_{index}", email=f"{prefix}_{index}@email.com", cognito_id=f"{prefix}_{index}")
+            for index in range(size)
+        )
+        Follow.objects.bulk_create(Follow(follower=reader, followed=author) for author in authors)
+        posts = Post.objects.bulk_create(
+            (Post(user=author, content=f"Post {index}") for author in authors for index in range(args.posts)),
+            batch_size=5000,
+        )
+        # Spread the posts over the last days, bulk_create sets the same timestamp for every post of a batch
+        for offset, post in enumerate(posts):
+            post.timestamp = now - timedelta(seconds=offset * 7)
+        Post.objects.bulk_update(posts, ["timestamp"], batch_size=5000)
+
+        author_keys = [AuthorPostsCache.get_key(author.id) for author in [reader, *authors]]
+        # Clearing the whole cache would flush the Redis database holding the recent posts as well
+        page_key = PullTimelineService.get_page_key(reader.id, None, TIMELINE_PAGE_SIZE)
+
+        def cold():
+            redis_client.delete(*author_keys)
+            service.cache.delete(page_key)
+            service.get_entries(reader)
+
+        def warm():
+            service.cache.delete(page_key)
+            service.get_entries(reader)
+
+        def cached():
+            service.get_entries(reader)
+
+        print(f"Following {size} authors")
+        report("  cold", measure(cold, args.calls))
+        report("  warm", measure(warm, args.calls))
+        report("  cached", measure(cached, args.calls))
+
+        redis_client.delete(*author_keys)
+        service.cache.delete(page_key)
+        User.objects.filter(username__startswith=prefix).delete()
+
+
+if __name__ == "__main__":
+    main()
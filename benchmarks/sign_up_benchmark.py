@@ -0,0 +1,92 @@
+"""
+Measures the latency of the Cognito part of UserManagementService.create_user against a stubbed Cognito.
+
+Every Cognito call of the stand-in takes --latency milliseconds. The sequential pipeline (sign up, group
+assignment and confirmation one after another) is compared with the current one, which assigns the group and
+confirms the user concurrently. The local database is stubbed out, so only the Cognito round trips are measured.
+
+Usage: python -m benchmarks.sign_up_benchmark [--calls 50] [--latency 30]
+Requires the Django settings environment (.env) to be available.
+"""
+import argparse
+import statistics
+import time
+import uuid
+
+from benchmarks.cognito_stub import CognitoStubServer
+from benchmarks.environment import configure_cognito, setup_django
+
+
+class LocalUserServiceStub:
+    @staticmethod
+    def get_availability(username, email):
+        return True, True
+
+    @staticmethod
+    def create_user(cognito_id, email, username):
+        pass
+
+
+def measure(call, calls: int) -> list[float]:
+    durations = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        durations.append(time.perf_counter() - start)
+
+    return sorted(durations)
+
+
+def report(name: str, durations: list[float]) -> None:
+    p99 = durations[max(int(len(durations) * 0.99) - 1, 0)]
+    print(f"{name:<22} mean {statistics.mean(durations) * 1000:8.2f} ms    p99 {p99 * 1000:8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=30, help="Latency of each Cognito call in milliseconds.")
+    args = parser.parse_args()
+
+    server = CognitoStubServer(latency=args.latency / 1000).start()
+    configure_cognito(server.endpoint_url)
+    setup_django()
+
+    from accounts.dto_models import SignUpUserModel
+    from accounts.services.user_management_service import UserManagementService
+    from accounts.settings.cognito_config import DEFAULT_USER_GROUP
+
+    service = UserManagementService()
+    service.user_service = LocalUserServiceStub()
+    provider = service.aws_cognito_service
+
+    def new_user() -> SignUpUserModel:
+        username = f"user{uuid.uuid4().hex[:8]}"
+        return SignUpUserModel(
+            email=f"{username}@email.com",
+            password="Password123!",
+            username=username,
+            first_name="Bench",
+            last_name="User",
+        )
+
+    def sequential_pipeline():
+        user = new_user()
+        provider.sign_up_user(user)
+        provider.add_user_to_group(user.email, DEFAULT_USER_GROUP)
+        provider.confirm_user(user.email)
+
+    def current_pipeline():
+        service.create_user(new_user())
+
+    # Warm up the shared client and the connection pool
+    current_pipeline()
+
+    report("sequential pipeline", measure(sequential_pipeline, args.calls))
+    report("current pipeline", measure(current_pipeline, args.calls))
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -25,7 +25,9 @@ INSTALLED_APPS = [
     "django_filters",
     "accounts.apps.AccountsConfig",
     "followers.apps.FollowersConfig",
-    "posts.apps.PostsConfig"
+    "posts.apps.PostsConfig",
+    "timelines.apps.TimelinesConfig",
+    "jobs.apps.JobsConfig",
 ]
 
 MIDDLEWARE = [
@@ -39,6 +41,16 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = "config.urls"
 
+# Django Rest Framework
+REST_FRAMEWORK = {
+    "DEFAULT_AUTHENTICATION_CLASSES": [
+        "accounts.authentication.CognitoTokenAuthentication",
+    ],
+    "DEFAULT_PERMISSION_CLASSES": [
+        "rest_framework.permissions.AllowAny",
+    ],
+}
+
 # Database
 DATABASES = {
     "default": {
@@ -52,10 +64,14 @@ DATABASES = {
 }
 
 # Redis config
+REDIS_URL = env("REDIS_URL", default="redis://localhost:6379/1")
+# Database the tests run against and flush, it must not be the one of REDIS_URL
+TEST_REDIS_URL = env("TEST_REDIS_URL", default="redis://localhost:6379/15")
+
 CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.redis.RedisCache",
-        "LOCATION": "redis://localhost:6379/1",
+        "LOCATION": REDIS_URL,
     }
 }
 
@@ -6,4 +6,5 @@ urlpatterns = [
     path(DEFAULT_URL_PREFIX + "users/", include("accounts.urls")),
     path(DEFAULT_URL_PREFIX + "users/", include("followers.urls")),
     path(DEFAULT_URL_PREFIX + "users/", include("posts.urls")),
+    path(DEFAULT_URL_PREFIX + "users/", include("timelines.urls")),
 ]
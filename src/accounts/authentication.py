@@ -0,0 +1,36 @@
+from jwt import PyJWTError
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+
+from accounts.services.token_service import TokenService
+from accounts.services.user_service import UserService
+
+
+class CognitoTokenAuthentication(BaseAuthentication):
+    """
+    Authenticates requests using the Cognito access token stored in the 'access_token' cookie.
+
+    The token is decoded and the user is resolved once per request. DRF exposes them as 'request.user' and
+    'request.auth', and also sets them on the underlying Django request, so the token middleware can reuse
+    the decoded token instead of decoding it again.
+    """
+
+    def authenticate(self, request):
+        access_token = request.COOKIES.get("access_token")
+        if not access_token:
+            return None
+
+        try:
+            user_info = TokenService.decode_token(access_token)
+        except PyJWTError:
+            raise AuthenticationFailed("Invalid or expired access token.")
+
+        user = UserService.get_user_by_cognito_id(user_info["username"])
+        if not user:
+            raise AuthenticationFailed(f"Authenticated user with Cognito ID {user_info['username']} not found.")
+
+        return user, user_info
+
+    def authenticate_header(self, request):
+        # Returning a value makes DRF respond with 401 instead of 403 to unauthenticated requests
+        return 'Cookie realm="api"'
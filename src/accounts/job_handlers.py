@@ -0,0 +1,20 @@
+from accounts.services.aws_cognito_client import AwsCognitoClient
+from accounts.services.aws_cognito_identity_provider import AwsCognitoIdentityProvider
+from accounts.settings.cognito_config import AwsCognitoConfig, GLOBAL_SIGN_OUT_JOB
+from jobs.registry import job_handler
+
+
+@job_handler(GLOBAL_SIGN_OUT_JOB, secret_fields=("access_token",))
+def global_sign_out(access_token: str):
+    """
+    Signs the user out of all active sessions in the AWS Cognito service, a revoked or expired access token
+    completes the job without a sign-out.
+
+    :param access_token: The access token of the user being signed out.
+    """
+    aws_cognito_identity_provider = AwsCognitoIdentityProvider(
+        cognito_client=AwsCognitoClient(),
+        client_id=AwsCognitoConfig.CLIENT_ID,
+        client_secret=AwsCognitoConfig.CLIENT_SECRET,
+    )
+    aws_cognito_identity_provider.sign_out_user(access_token=access_token)
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from accounts.services.availability_service import AvailabilityService
+
+
+class Command(BaseCommand):
+    help = "Adds all existing users to the username and email availability index."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reset", action="store_true", help="Clear the index before seeding it.")
+
+    def handle(self, *args, **options):
+        count = AvailabilityService().seed(reset=options["reset"])
+        self.stdout.write(f"Availability index seeded with {count} users.")
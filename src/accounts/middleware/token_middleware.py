@@ -1,11 +1,27 @@
 import logging
 
+from jwt import PyJWTError
 from rest_framework.exceptions import ValidationError
 
 from accounts.services.token_service import TokenService
 from accounts.services.user_management_service import UserManagementService
 
 
+def get_decoded_token(request, access_token: str) -> dict:
+    """
+    Returns the claims of the access token, reusing the ones decoded by the authentication class when possible.
+
+    :param request: The incoming request.
+    :param access_token: The access token found in the request cookies.
+    :return: Decoded access token.
+    """
+    decoded_token = getattr(request, "auth", None)
+    if decoded_token is not None:
+        return decoded_token
+
+    return TokenService.decode_token(access_token)
+
+
 def token_middleware(get_response):
     def middleware(request):
         access_token = request.COOKIES.get("access_token")
@@ -16,7 +32,7 @@ def token_middleware(get_response):
         if access_token and refresh_token:
             try:
                 token_service = TokenService()
-                decoded_token = token_service.decode_token(access_token)
+                decoded_token = get_decoded_token(request, access_token)
                 expiration_timestamp = decoded_token.get("exp")
 
                 if token_service.is_token_expired(expiration_timestamp):
@@ -42,7 +58,14 @@ def token_middleware(get_response):
 
         elif access_token:
             token_service = TokenService()
-            decoded_token = token_service.decode_token(access_token)
+            try:
+                decoded_token = get_decoded_token(request, access_token)
+            except PyJWTError as e:
+                # The authentication class already rejected the request, drop the unusable token
+                response.delete_cookie("access_token")
+                logging.info(f"Removed invalid access token: {e}")
+                return response
+
             expiration_timestamp = decoded_token.get("exp")
 
             if token_service.is_token_expired(expiration_timestamp):
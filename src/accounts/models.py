@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Upper
 
 
 class User(models.Model):
@@ -6,5 +7,19 @@ class User(models.Model):
     email = models.EmailField()
     username = models.CharField(unique=True, max_length=255)
 
+    class Meta:
+        indexes = [
+            # Serve the case-insensitive (iexact) lookups of the availability checks
+            models.Index(Upper("username"), name="user_username_upper_idx"),
+            models.Index(Upper("email"), name="user_email_upper_idx"),
+        ]
+
+    @property
+    def is_authenticated(self):
+        """
+        Always True, allows DRF permission classes to tell authenticated users apart from anonymous ones.
+        """
+        return True
+
     def __str__(self):
         return self.email
@@ -0,0 +1,181 @@
+import logging
+
+from django.db.models import Q
+from redis.exceptions import RedisError
+
+from accounts.models import User
+from accounts.settings.availability_config import (
+    AVAILABILITY_EMAIL_FILTER_KEY,
+    AVAILABILITY_FILTER_CAPACITY,
+    AVAILABILITY_FILTER_ERROR_RATE,
+    AVAILABILITY_SEED_BATCH_SIZE,
+    AVAILABILITY_SEEDED_KEY,
+    AVAILABILITY_USERNAME_FILTER_KEY,
+)
+from utils.bloom_filter import RedisBloomFilter
+from utils.redis_client import get_redis_client
+
+
+class AvailabilityService:
+    """
+    Answers whether usernames and email addresses are still available.
+
+    Every taken username and email is added to a Bloom filter in Redis. A name the filter has never seen is
+    definitely free and is answered without touching the database, a probable hit is confirmed with a
+    case-insensitive indexed query. Until the filters are seeded with all existing users, every check goes to
+    the database.
+    """
+
+    def __init__(self):
+        self.redis_client = get_redis_client()
+        self.username_filter = RedisBloomFilter(
+            self.redis_client, AVAILABILITY_USERNAME_FILTER_KEY, AVAILABILITY_FILTER_CAPACITY,
+            AVAILABILITY_FILTER_ERROR_RATE
+        )
+        self.email_filter = RedisBloomFilter(
+            self.redis_client, AVAILABILITY_EMAIL_FILTER_KEY, AVAILABILITY_FILTER_CAPACITY,
+            AVAILABILITY_FILTER_ERROR_RATE
+        )
+
+    def is_username_available(self, username: str) -> bool:
+        """
+        Checks whether the username is available, usernames are compared case-insensitively.
+        :param username: Username to check.
+        :return: True if the username is available, False otherwise.
+        """
+        username_available, _ = self.get_availability(username=username)
+        return username_available
+
+    def is_email_available(self, email: str) -> bool:
+        """
+        Checks whether the email is available, emails are compared case-insensitively.
+        :param email: Email address to check.
+        :return: True if the email is available, False otherwise.
+        """
+        _, email_available = self.get_availability(email=email)
+        return email_available
+
+    def get_availability(self, username: str = None, email: str = None) -> tuple[bool | None, bool | None]:
+        """
+        Checks whether the username and the email are available, with at most one database query.
+        :param username: Username to check (optional).
+        :param email: Email address to check (optional).
+        :return: Tuple with the availability of the username and of the email, None for values not checked.
+        """
+        check_username, check_email = self.__get_probable_hits(username, email)
+
+        username_available = None if username is None else True
+        email_available = None if email is None else True
+
+        if not check_username and not check_email:
+            return username_available, email_available
+
+        query = Q()
+        if check_username:
+            query |= Q(username__iexact=username)
+        if check_email:
+            query |= Q(email__iexact=email)
+
+        for taken_username, taken_email in User.objects.filter(query).values_list("username", "email"):
+            if check_username and taken_username.lower() == username.lower():
+                username_available = False
+            if check_email and taken_email.lower() == email.lower():
+                email_available = False
+
+        return username_available, email_available
+
+    def add_user(self, username: str, email: str) -> None:
+        """
+        Marks the username and email of a new user as taken.
+        :param username: Username of the user.
+        :param email: Email address of the user.
+        """
+        try:
+            self.username_filter.add(username.lower())
+            self.email_filter.add(email.lower())
+        except RedisError as e:
+            # A missing entry would wrongly report a taken name as available, force database checks instead
+            logging.error(f"Failed to add user {username} to the availability index: {e}")
+            try:
+                self.redis_client.delete(AVAILABILITY_SEEDED_KEY)
+            except RedisError:
+                logging.error("Failed to mark the availability index as incomplete, it has to be re-seeded.")
+
+    def seed(self, reset: bool = False, batch_size: int = AVAILABILITY_SEED_BATCH_SIZE) -> int:
+        """
+        Adds every existing user to the filters, after which available names can be answered from Redis.
+
+        Users created while seeding are added by the regular user creation hook, so no user is missed.
+
+        :param reset: Clear the filters first, e.g. to drop deleted users or to apply a new capacity.
+        :param batch_size: Number of users added per round trip.
+        :return: Number of users added.
+        """
+        if reset:
+            self.redis_client.delete(AVAILABILITY_SEEDED_KEY)
+            self.username_filter.clear()
+            self.email_filter.clear()
+
+        count = 0
+        usernames = []
+        emails = []
+        for username, email in User.objects.values_list("username", "email").iterator(chunk_size=batch_size):
+            usernames.append(username.lower())
+            emails.append(email.lower())
+
+            if len(usernames) >= batch_size:
+                count += self.__add_batch(usernames, emails)
+
+        count += self.__add_batch(usernames, emails)
+        self.redis_client.set(AVAILABILITY_SEEDED_KEY, 1)
+        logging.info(f"Availability index seeded with {count} users.")
+
+        return count
+
+    def __add_batch(self, usernames: list[str], emails: list[str]) -> int:
+        count = len(usernames)
+        if count:
+            self.username_filter.add(*usernames)
+            self.email_filter.add(*emails)
+            usernames.clear()
+            emails.clear()
+
+        return count
+
+    def __get_probable_hits(self, username: str | None, email: str | None) -> tuple[bool, bool]:
+        """
+        Looks the values up in the filters, using a single round trip.
+        :return: Whether the username and whether the email have to be checked in the database.
+        """
+        lookups = [
+            (bloom_filter, value.lower())
+            for bloom_filter, value in [(self.username_filter, username), (self.email_filter, email)]
+            if value is not None
+        ]
+        if not lookups:
+            return False, False
+
+        try:
+            pipeline = self.redis_client.pipeline(transaction=False)
+            pipeline.exists(AVAILABILITY_SEEDED_KEY)
+            for bloom_filter, value in lookups:
+                bloom_filter.queue_lookup(pipeline, value)
+            seeded, *bits = pipeline.execute()
+        except RedisError as e:
+            logging.warning(f"Availability index is unavailable, checking the database: {e}")
+            return username is not None, email is not None
+
+        if not seeded:
+            return username is not None, email is not None
+
+        hits = []
+        for bloom_filter, _ in lookups:
+            hits.append(all(bits[:bloom_filter.hash_count]))
+            bits = bits[bloom_filter.hash_count:]
+
+        if username is None:
+            return False, hits[0]
+        if email is None:
+            return hits[0], False
+
+        return hits[0], hits[1]
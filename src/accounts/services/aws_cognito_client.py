@@ -1,29 +1,73 @@
+import threading
+
 import boto3
+from botocore.config import Config
 
-from accounts.settings.cognito_config import AwsCognitoConfig
+from accounts.settings.cognito_config import (
+    AwsCognitoConfig,
+    COGNITO_CONNECT_TIMEOUT,
+    COGNITO_MAX_ATTEMPTS,
+    COGNITO_MAX_POOL_CONNECTIONS,
+    COGNITO_READ_TIMEOUT,
+)
 
 
 class AwsCognitoClient:
     """
     Class for interacting with AWS Cognito service using boto3.
+
+    The boto3 client is created lazily and shared by the whole process, so the botocore service model is loaded
+    once and the pooled keep-alive connections are reused across requests. Boto3 clients are thread-safe.
     """
 
+    _client = None
+    _client_lock = threading.Lock()
+
     def __init__(self):
         self.aws_access_key = AwsCognitoConfig.AWS_ACCESS_KEY
         self.aws_secret_access_key = AwsCognitoConfig.AWS_SECRET_ACCESS_KEY
         self.region_name = AwsCognitoConfig.REGION_NAME
         self.user_pool_id = AwsCognitoConfig.USER_POOL_ID
+        self.endpoint_url = AwsCognitoConfig.ENDPOINT_URL
 
     def get_client(self) -> boto3.client:
         """
-        :returns: boto3.client: The initialized boto3 client for interacting with Cognito.
+        :returns: boto3.client: The shared boto3 client for interacting with Cognito.
 
         :raises botocore.exceptions.NoCredentialsError: If AWS credentials are not found.
         :raises botocore.exceptions.PartialCredentialsError: If partial credentials are provided.
         """
-        return boto3.client(
+        if AwsCognitoClient._client is None:
+            with AwsCognitoClient._client_lock:
+                if AwsCognitoClient._client is None:
+                    AwsCognitoClient._client = self.__create_client()
+
+        return AwsCognitoClient._client
+
+    @classmethod
+    def reset_client(cls) -> None:
+        """
+        Drops the shared client, the next call of get_client will create a new one.
+        """
+        with cls._client_lock:
+            cls._client = None
+
+    def __create_client(self) -> boto3.client:
+        config = Config(
+            max_pool_connections=COGNITO_MAX_POOL_CONNECTIONS,
+            connect_timeout=COGNITO_CONNECT_TIMEOUT,
+            read_timeout=COGNITO_READ_TIMEOUT,
+            tcp_keepalive=True,
+            retries={"max_attempts": COGNITO_MAX_ATTEMPTS, "mode": "standard"},
+        )
+
+        # Boto3 sessions are not thread-safe, the client gets its own session and is created under the lock
+        session = boto3.session.Session()
+        return session.client(
             "cognito-idp",
             aws_access_key_id=self.aws_access_key,
             aws_secret_access_key=self.aws_secret_access_key,
-            region_name=self.region_name
+            region_name=self.region_name,
+            endpoint_url=self.endpoint_url,
+            config=config,
         )
@@ -97,7 +97,8 @@ class AwsCognitoIdentityProvider:
         signing the user out globally from all devices.
 
         :param access_token: The access token of the authenticated user initiating the sign-out request.
-        :return: The response from AWS Cognito confirming the sign-out action.
+        :return: The response from AWS Cognito confirming the sign-out action, or None if the access token was
+            already revoked or expired.
         :raises ValidationError: If the sign-out operation fails due to an error from AWS Cognito.
         :raises ClientError: If there is an issue with the AWS Cognito client interaction.
         """
@@ -105,8 +106,13 @@ class AwsCognitoIdentityProvider:
             response = self.cognito_client.get_client().global_sign_out(AccessToken=access_token)
             return response
         except ClientError as e:
+            if e.response["Error"]["Code"] == "NotAuthorizedException":
+                # A revoked or expired token can never be signed out, retrying the sign-out would not change that
+                logging.info(f"Skipped sign-out, the access token is no longer valid: {e.response['Error']['Message']}")
+                return None
+
             logging.error(f"Failed to sign out user: {e.response['Error']['Message']}")
-            raise ValidationError(f"Failed to sign out user: {access_token}")
+            raise ValidationError(f"Failed to sign out user: {e.response['Error']['Message']}")
 
     def refresh_token(self, refresh_token: str, jwt_token_username: str):
         """
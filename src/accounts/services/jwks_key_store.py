@@ -0,0 +1,120 @@
+import logging
+import re
+import threading
+import time
+
+import jwt
+import requests
+from jwt.algorithms import RSAAlgorithm
+
+from accounts.settings.cognito_config import (
+    JWKS_CACHE_TTL,
+    JWKS_MIN_REFRESH_INTERVAL,
+    JWKS_REQUEST_TIMEOUT,
+    JWKS_URL,
+)
+
+MAX_AGE_REGEX = re.compile(r"max-age=(\d+)")
+
+
+class JwksKeyStore:
+    """
+    Process-wide store of the public keys used to verify Cognito tokens, indexed by key ID (kid).
+
+    The JWKS is fetched once and the parsed keys are kept until the Cache-Control max-age of the response
+    (or the configured TTL) runs out. Refreshes are rate limited, and the last good key set is kept
+    whenever the JWKS endpoint cannot be reached.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+            self,
+            jwks_url: str = JWKS_URL,
+            ttl: int = JWKS_CACHE_TTL,
+            min_refresh_interval: int = JWKS_MIN_REFRESH_INTERVAL,
+            timeout: int = JWKS_REQUEST_TIMEOUT,
+    ):
+        self.jwks_url = jwks_url
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        self.timeout = timeout
+
+        self._keys = {}
+        self._expires_at = 0.0
+        self._last_refresh_at = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> "JwksKeyStore":
+        """
+        :return: The key store shared by the whole process.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+
+        return cls._instance
+
+    def get_key(self, kid: str):
+        """
+        Returns the public key matching the given key ID.
+
+        A known key is served from memory until the key set expires. An unknown key ID triggers a single
+        refresh of the key set, since Cognito might have rotated its signing keys.
+
+        :param kid: Key ID found in the header of the token.
+        :return: RSA public key used to verify the signature of the token.
+        :raises jwt.PyJWTError: If no key with the given key ID could be found.
+        """
+        key = self._keys.get(kid)
+        if key is not None and time.monotonic() < self._expires_at:
+            return key
+
+        self.__refresh()
+
+        key = self._keys.get(kid)
+        if key is None:
+            raise jwt.PyJWTError("Unable to find the appropriate key for token verification.")
+
+        return key
+
+    def __refresh(self) -> None:
+        """
+        Fetches the JWKS and replaces the stored keys, unless a refresh was attempted within the minimum refresh
+        interval. Failures are logged and the previously stored keys are kept.
+        """
+        with self._lock:
+            now = time.monotonic()
+
+            # Another thread might have refreshed the keys while this one was waiting for the lock
+            if self._last_refresh_at is not None and now - self._last_refresh_at < self.min_refresh_interval:
+                return
+
+            self._last_refresh_at = now
+
+            try:
+                response = requests.get(self.jwks_url, timeout=self.timeout)
+                response.raise_for_status()
+                keys = {key["kid"]: RSAAlgorithm.from_jwk(key) for key in response.json()["keys"]}
+            except (requests.RequestException, ValueError, KeyError, jwt.PyJWTError) as e:
+                logging.error(f"Failed to refresh JWKS, serving {len(self._keys)} previously fetched keys: {e}")
+                return
+
+            self._keys = keys
+            self._expires_at = now + self.__get_ttl(response.headers.get("Cache-Control"))
+            logging.info(f"JWKS refreshed, {len(keys)} keys loaded.")
+
+    def __get_ttl(self, cache_control: str | None) -> int:
+        """
+        :param cache_control: Value of the Cache-Control header of the JWKS response.
+        :return: Number of seconds the fetched keys can be used for.
+        """
+        if cache_control:
+            match = MAX_AGE_REGEX.search(cache_control)
+            if match:
+                return int(match.group(1))
+
+        return self.ttl
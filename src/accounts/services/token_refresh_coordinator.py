@@ -0,0 +1,95 @@
+import hashlib
+import logging
+import time
+from typing import Callable
+
+from django.core.cache import caches
+
+from accounts.settings.cognito_config import (
+    TOKEN_REFRESH_CACHE_ALIAS,
+    TOKEN_REFRESH_LOCK_TIMEOUT,
+    TOKEN_REFRESH_POLL_INTERVAL,
+    TOKEN_REFRESH_RESULT_TTL,
+    TOKEN_REFRESH_WAIT_TIMEOUT,
+)
+
+
+class TokenRefreshCoordinator:
+    """
+    Coalesces concurrent refreshes of the same refresh token into a single call towards AWS Cognito.
+
+    The first request acquires a lock keyed on the digest of the refresh token and performs the refresh, the
+    result is then shared through the cache. Requests that arrive while the lock is held wait for that result
+    instead of refreshing the token themselves.
+    """
+
+    def __init__(
+            self,
+            cache_alias: str = TOKEN_REFRESH_CACHE_ALIAS,
+            lock_timeout: int = TOKEN_REFRESH_LOCK_TIMEOUT,
+            wait_timeout: float = TOKEN_REFRESH_WAIT_TIMEOUT,
+            poll_interval: float = TOKEN_REFRESH_POLL_INTERVAL,
+            result_ttl: int = TOKEN_REFRESH_RESULT_TTL,
+    ):
+        self.cache = caches[cache_alias]
+        self.lock_timeout = lock_timeout
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self.result_ttl = result_ttl
+
+    def refresh(self, refresh_token: str, refresh_function: Callable[[], dict]) -> dict:
+        """
+        Refreshes the tokens, unless another request is already doing so for the same refresh token.
+
+        :param refresh_token: The user's refresh token.
+        :param refresh_function: Function performing the actual refresh, returns the new tokens.
+        :return: New tokens.
+        """
+        digest = hashlib.sha256(refresh_token.encode()).hexdigest()
+        lock_key = f"token_refresh:lock:{digest}"
+        result_key = f"token_refresh:result:{digest}"
+
+        try:
+            result = self.cache.get(result_key)
+            if result is not None:
+                return result
+
+            lock_acquired = self.cache.add(lock_key, 1, timeout=self.lock_timeout)
+        except Exception as e:
+            logging.warning(f"Token refresh lock is unavailable, refreshing without coordination: {e}")
+            return refresh_function()
+
+        if lock_acquired:
+            try:
+                result = refresh_function()
+                self.cache.set(result_key, result, timeout=self.result_ttl)
+                return result
+            finally:
+                self.cache.delete(lock_key)
+
+        result = self.__wait_for_result(lock_key, result_key)
+        if result is not None:
+            logging.info("Reusing tokens refreshed by a concurrent request.")
+            return result
+
+        # The request holding the lock failed or took too long, refresh the tokens directly
+        return refresh_function()
+
+    def __wait_for_result(self, lock_key: str, result_key: str) -> dict | None:
+        """
+        Polls the cache until the tokens refreshed by another request become available.
+
+        :return: New tokens, or None if the lock was released without a result or the wait timed out.
+        """
+        deadline = time.monotonic() + self.wait_timeout
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+
+            result = self.cache.get(result_key)
+            if result is not None:
+                return result
+
+            if not self.cache.get(lock_key):
+                return self.cache.get(result_key)
+
+        return None
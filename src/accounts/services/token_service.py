@@ -1,12 +1,13 @@
 from datetime import datetime, timezone
 
 import jwt
-import requests
-from jwt.algorithms import RSAAlgorithm
 
 from accounts.services.aws_cognito_client import AwsCognitoClient
 from accounts.services.aws_cognito_identity_provider import AwsCognitoIdentityProvider
-from accounts.settings.cognito_config import AwsCognitoConfig, JWKS_URL, JWT_ALGORITHM, JWT_ISSUER
+from accounts.services.jwks_key_store import JwksKeyStore
+from accounts.services.token_refresh_coordinator import TokenRefreshCoordinator
+from accounts.services.verified_token_cache import VerifiedTokenCache
+from accounts.settings.cognito_config import AwsCognitoConfig, JWT_ALGORITHM, JWT_ISSUER
 
 
 class TokenService:
@@ -17,10 +18,12 @@ class TokenService:
         Decodes the jwt token to get the payload.
         :param token: Token to decode.
         """
-        # Fetch the JWKS
-        response = requests.get(JWKS_URL)
-        response.raise_for_status()
-        jwks = response.json()
+        # Tokens that were already verified are served from the cache until they expire,
+        # which skips the signature verification for every repeated request of the same session.
+        token_cache = VerifiedTokenCache.get_instance()
+        cached_token = token_cache.get(token)
+        if cached_token is not None:
+            return cached_token
 
         # Extract the key ID (kid) from the token's header
         # The "kid" in the token header helps identify which key from the JWKS should be used to verify the token.
@@ -33,36 +36,19 @@ class TokenService:
         if not kid:
             raise jwt.PyJWTError("Token header missing 'kid'.")
 
-        # Find the public key in the JWKS that matches the "kid" from the token header
-        # We loop through all keys in the JWKS to locate the key with a matching "kid".
-        # This ensures we're using the right key to verify the token's signature.
-        rsa_key = None
-        for key in jwks["keys"]:
-            if key["kid"] == kid:
-                rsa_key = {
-                    "kty": key["kty"],
-                    "kid": key["kid"],
-                    "use": key["use"],
-                    "n": key["n"],
-                    "e": key["e"],
-                }
-                break
+        # The key store keeps the already parsed public keys in memory, so the JWKS is only fetched
+        # when the cached keys expire or when a token is signed with a key we have not seen yet.
+        public_key = JwksKeyStore.get_instance().get_key(kid)
 
-        if not rsa_key:
-            raise jwt.PyJWTError("Unable to find the appropriate key for token verification.")
-
-        # Convert the JWK (JSON Web Key) to a PEM-formatted RSA public key
-        # The JWK is a compact, JSON-based representation of a public key.
-        # We convert it to PEM format because the decoding library (PyJWT) requires it for token verification.
-        public_key = RSAAlgorithm.from_jwk(rsa_key)
-
-        # Decode the token using the public key in PEM format
+        # Decode the token using the public key
         decoded_token = jwt.decode(
             token,
             public_key,
             algorithms=[JWT_ALGORITHM],
             issuer=JWT_ISSUER
         )
+        token_cache.set(token, decoded_token)
+
         return decoded_token
 
     @staticmethod
@@ -90,4 +76,11 @@ class TokenService:
             client_id=AwsCognitoConfig.CLIENT_ID,
             client_secret=AwsCognitoConfig.CLIENT_SECRET,
         )
-        return aws_cognito_identity_provider.refresh_token(refresh_token, jwt_token_username)
+
+        # Parallel requests of the same client all carry the same refresh token,
+        # only one of them refreshes it while the others reuse the new tokens.
+        token_refresh_coordinator = TokenRefreshCoordinator()
+        return token_refresh_coordinator.refresh(
+            refresh_token,
+            lambda: aws_cognito_identity_provider.refresh_token(refresh_token, jwt_token_username),
+        )
@@ -0,0 +1,162 @@
+import logging
+
+from asgiref.local import Local
+from django.core.cache import caches
+
+from accounts.models import User
+from accounts.settings.user_cache_config import (
+    USER_IDENTITY_CACHE_ALIAS,
+    USER_IDENTITY_CACHE_KEY_PREFIX,
+    USER_IDENTITY_CACHE_TTL,
+    USER_IDENTITY_NEGATIVE_CACHE_TTL,
+)
+
+IDENTITY_FIELDS = ("id", "cognito_id", "username", "email")
+
+
+class UserIdentityCache:
+    """
+    Read-through cache of the identity of users (id, cognito id, username and email), keyed by cognito id.
+
+    The first tier is local to the current request and is cleared when a request starts, the second tier is the
+    configured Redis cache. Unknown cognito ids are cached as well, for a shorter time. Entries are invalidated
+    whenever a user is saved or deleted.
+    """
+
+    # Returned by get when the cognito id is not cached at all, None means the cognito id is known to be unknown
+    MISS = object()
+
+    _local = Local()
+
+    def __init__(self, cache_alias: str = USER_IDENTITY_CACHE_ALIAS):
+        self.cache = caches[cache_alias]
+
+    def get(self, cognito_id: str) -> User | None | object:
+        """
+        :param cognito_id: The id that is assigned to the user's cognito identity.
+        :return: The cached user, None if the cognito id is cached as unknown, or MISS if it is not cached.
+        """
+        local_cache = self.__get_local_cache()
+        if cognito_id in local_cache:
+            return local_cache[cognito_id]
+
+        try:
+            identity = self.cache.get(self.__key(cognito_id))
+        except Exception as e:
+            logging.warning(f"Failed to read user identity from the cache: {e}")
+            return self.MISS
+
+        if identity is None:
+            return self.MISS
+
+        user = self.__to_user(identity)
+        local_cache[cognito_id] = user
+        return user
+
+    def set(self, cognito_id: str, user: User | None) -> None:
+        """
+        Caches the user, or the fact that no user has the given cognito id.
+
+        :param cognito_id: The id that is assigned to the user's cognito identity.
+        :param user: The user, or None if no user has the cognito id.
+        """
+        self.__get_local_cache()[cognito_id] = user
+
+        if user is None:
+            identity, timeout = {}, USER_IDENTITY_NEGATIVE_CACHE_TTL
+        else:
+            identity, timeout = {field: getattr(user, field) for field in IDENTITY_FIELDS}, USER_IDENTITY_CACHE_TTL
+
+        try:
+            self.cache.set(self.__key(cognito_id), identity, timeout=timeout)
+        except Exception as e:
+            logging.warning(f"Failed to store user identity in the cache: {e}")
+
+    def get_many(self, cognito_ids) -> dict[str, User | None]:
+        """
+        Looks up several cognito ids, using a single round trip towards the shared tier.
+
+        :param cognito_ids: The ids that are assigned to the users' cognito identities.
+        :return: Cached users by cognito id, None for cognito ids cached as unknown. Ids not cached are left out.
+        """
+        local_cache = self.__get_local_cache()
+        users = {cognito_id: local_cache[cognito_id] for cognito_id in cognito_ids if cognito_id in local_cache}
+
+        missing_ids = [cognito_id for cognito_id in cognito_ids if cognito_id not in users]
+        if not missing_ids:
+            return users
+
+        try:
+            identities = self.cache.get_many([self.__key(cognito_id) for cognito_id in missing_ids])
+        except Exception as e:
+            logging.warning(f"Failed to read user identities from the cache: {e}")
+            return users
+
+        for cognito_id in missing_ids:
+            identity = identities.get(self.__key(cognito_id))
+            if identity is not None:
+                users[cognito_id] = local_cache[cognito_id] = self.__to_user(identity)
+
+        return users
+
+    def set_many(self, users: dict[str, User | None]) -> None:
+        """
+        Caches several users at once.
+        :param users: Users by cognito id, None for cognito ids no user has.
+        """
+        self.__get_local_cache().update(users)
+
+        known_identities = {}
+        unknown_identities = {}
+        for cognito_id, user in users.items():
+            if user is None:
+                unknown_identities[self.__key(cognito_id)] = {}
+            else:
+                known_identities[self.__key(cognito_id)] = {field: getattr(user, field) for field in IDENTITY_FIELDS}
+
+        try:
+            if known_identities:
+                self.cache.set_many(known_identities, timeout=USER_IDENTITY_CACHE_TTL)
+            if unknown_identities:
+                self.cache.set_many(unknown_identities, timeout=USER_IDENTITY_NEGATIVE_CACHE_TTL)
+        except Exception as e:
+            logging.warning(f"Failed to store user identities in the cache: {e}")
+
+    def invalidate(self, cognito_id: str) -> None:
+        """
+        Removes the cached identity of the cognito id from both tiers.
+        :param cognito_id: The id that is assigned to the user's cognito identity.
+        """
+        self.__get_local_cache().pop(cognito_id, None)
+
+        try:
+            self.cache.delete(self.__key(cognito_id))
+        except Exception as e:
+            logging.error(f"Failed to invalidate the cached identity of {cognito_id}: {e}")
+
+    @classmethod
+    def clear_local(cls) -> None:
+        """
+        Clears the request-local tier, called whenever a new request starts.
+        """
+        cls._local.users = {}
+
+    @classmethod
+    def __get_local_cache(cls) -> dict:
+        if not hasattr(cls._local, "users"):
+            cls._local.users = {}
+
+        return cls._local.users
+
+    @staticmethod
+    def __to_user(identity: dict) -> User | None:
+        if not identity:
+            return None
+
+        # from_db expects the values in the order of the model fields
+        field_names = [field.attname for field in User._meta.concrete_fields if field.attname in identity]
+        return User.from_db("default", field_names, [identity[field_name] for field_name in field_names])
+
+    @staticmethod
+    def __key(cognito_id: str) -> str:
+        return f"{USER_IDENTITY_CACHE_KEY_PREFIX}:{cognito_id}"
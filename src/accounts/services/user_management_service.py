@@ -1,13 +1,17 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor, wait
 
-from botocore.exceptions import ClientError
 from rest_framework.exceptions import ValidationError
 
 from accounts.services.aws_cognito_client import AwsCognitoClient
 from accounts.services.aws_cognito_identity_provider import AwsCognitoIdentityProvider
 from accounts.services.user_service import UserService
-from accounts.settings.cognito_config import AwsCognitoConfig, DEFAULT_USER_GROUP
+from accounts.settings.cognito_config import AwsCognitoConfig, DEFAULT_USER_GROUP, GLOBAL_SIGN_OUT_JOB
 from accounts.validators.account_validator import AccountValidator
+from jobs.services.job_service import JobService
+
+# Runs independent Cognito calls of a single request concurrently, on the shared boto3 client
+cognito_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="cognito")
 
 
 class UserManagementService:
@@ -25,25 +29,27 @@ class UserManagementService:
         account_validator = AccountValidator()
         account_validator.validate(user)
 
-        username_available = self.user_service.is_username_available(user.username)
+        username_available, email_available = self.user_service.get_availability(user.username, user.email)
         if not username_available:
             raise ValidationError({"username": "Username is already in use."})
 
-        email_available = self.user_service.is_email_available(user.email)
         if not email_available:
             raise ValidationError({"email": "This email address is already associated with an existing account."})
 
-        try:
-            # Sign up user in Cognito
-            cognito_user = self.aws_cognito_service.sign_up_user(user)
-            logging.info(f"Creating new Cognito User {user.email}.")
-
-            # Assign them to a group
-            self.aws_cognito_service.add_user_to_group(user.email, DEFAULT_USER_GROUP)
-            logging.info(f"Assigning new User to Group {DEFAULT_USER_GROUP}.")
+        # Sign up user in Cognito
+        cognito_user = self.aws_cognito_service.sign_up_user(user)
+        logging.info(f"Creating new Cognito User {user.email}.")
 
-            # Confirm user
-            self.aws_cognito_service.confirm_user(user.email)
+        try:
+            # Assigning the group and confirming the user do not depend on each other, run them concurrently
+            futures = [
+                cognito_executor.submit(self.aws_cognito_service.add_user_to_group, user.email, DEFAULT_USER_GROUP),
+                cognito_executor.submit(self.aws_cognito_service.confirm_user, user.email),
+            ]
+            wait(futures)
+            for future in futures:
+                future.result()
+            logging.info(f"Assigned new User to Group {DEFAULT_USER_GROUP} and confirmed them.")
 
             # Create the user locally
             self.user_service.create_user(
@@ -52,13 +58,33 @@ class UserManagementService:
                 username=user.username
             )
             logging.info(f"Creating new User locally {user.email}.")
-        except ClientError as e:
-            self.aws_cognito_service.delete_user(user.email)
-            logging.error(f"Failed to create Cognito User {user.email}: {e}")
+        except Exception as e:
+            logging.error(f"Failed to create User {user.email}, removing the Cognito User: {e}")
+            self.__rollback_cognito_user(user.email)
+
+            if isinstance(e, ValidationError):
+                raise
             raise ValidationError({"error": "Failed to create a new user."})
 
     def sign_in_user(self, user):
         return self.aws_cognito_service.sign_in_user(user)
 
-    def sign_out_user(self, access_token: str):
-        return self.aws_cognito_service.sign_out_user(access_token=access_token)
+    @staticmethod
+    def sign_out_user(access_token: str):
+        """
+        Schedules the global sign-out of the user in AWS Cognito.
+
+        The sign-out runs on the background job queue, so the response does not wait on the AWS round trip.
+        :param access_token: The access token of the user being signed out.
+        """
+        JobService.enqueue(GLOBAL_SIGN_OUT_JOB, {"access_token": access_token})
+
+    def __rollback_cognito_user(self, email: str) -> None:
+        """
+        Deletes the Cognito user of a sign-up that could not be completed.
+        :param email: Email address of the user.
+        """
+        try:
+            self.aws_cognito_service.delete_user(email)
+        except ValidationError as e:
+            logging.error(f"Failed to remove Cognito User {email} after a failed sign-up: {e}")
@@ -1,4 +1,6 @@
 from accounts.models import User
+from accounts.services.availability_service import AvailabilityService
+from accounts.services.user_identity_cache import UserIdentityCache
 
 
 class UserService:
@@ -28,10 +30,7 @@ class UserService:
         :param username: Username to check.
         :return: True if the username is available, False otherwise.
         """
-        if User.objects.filter(username=username).exists():
-            return False
-
-        return True
+        return AvailabilityService().is_username_available(username)
 
     @staticmethod
     def is_email_available(email):
@@ -40,14 +39,54 @@ class UserService:
         :param email: Email address to check.
         :return: True if the email is available, False otherwise.
         """
-        if User.objects.filter(email=email).exists():
-            return False
+        return AvailabilityService().is_email_available(email)
 
-        return True
+    @staticmethod
+    def get_availability(username, email):
+        """
+        Checks whether the username and the email are available, using at most one query.
+        :param username: Username to check.
+        :param email: Email address to check.
+        :return: Tuple of booleans, whether the username and whether the email are available.
+        """
+        return AvailabilityService().get_availability(username=username, email=email)
 
     @staticmethod
     def get_user_by_cognito_id(cognito_id):
-        if User.objects.filter(cognito_id=cognito_id).exists():
-            return User.objects.get(cognito_id=cognito_id)
+        """
+        Retrieves the user assigned to the given cognito identity.
+        :param cognito_id: The id that is assigned to the user's cognito identity.
+        :return: The user, or None if no user has the given cognito id.
+        """
+        identity_cache = UserIdentityCache()
+        user = identity_cache.get(cognito_id)
+        if user is not UserIdentityCache.MISS:
+            return user
+
+        user = User.objects.filter(cognito_id=cognito_id).first()
+        identity_cache.set(cognito_id, user)
+
+        return user
+
+    @staticmethod
+    def get_users_by_cognito_ids(cognito_ids):
+        """
+        Retrieves the users assigned to the given cognito identities.
+
+        Users missing from the identity cache are fetched with a single query, so resolving any number of users
+        costs at most one query.
+        :param cognito_ids: The ids that are assigned to the users' cognito identities.
+        :return: Dictionary of the found users by cognito id, unknown cognito ids are left out.
+        """
+        cognito_ids = set(cognito_ids)
+
+        identity_cache = UserIdentityCache()
+        users = identity_cache.get_many(cognito_ids)
+
+        missing_ids = cognito_ids - users.keys()
+        if missing_ids:
+            found_users = {user.cognito_id: user for user in User.objects.filter(cognito_id__in=missing_ids)}
+            identity_cache.set_many({cognito_id: found_users.get(cognito_id) for cognito_id in missing_ids})
+            users.update(found_users)
 
-        return None
+        return {cognito_id: user for cognito_id, user in users.items() if user is not None}
@@ -0,0 +1,162 @@
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import caches
+
+from accounts.settings.cognito_config import (
+    TOKEN_CACHE_ALIAS,
+    TOKEN_CACHE_KEY_PREFIX,
+    TOKEN_CACHE_MAX_SIZE,
+    TOKEN_CACHE_USE_SHARED_CACHE,
+)
+
+
+class VerifiedTokenCache:
+    """
+    Cache of the claims of tokens whose signature has already been verified.
+
+    Entries are keyed by a SHA-256 digest of the token and kept until the token's 'exp' claim is reached.
+    The in-process tier is a bounded LRU, the optional shared tier is the configured Redis cache, which lets
+    other processes skip the verification of tokens already seen by this one.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+            self,
+            max_size: int = TOKEN_CACHE_MAX_SIZE,
+            use_shared_cache: bool = TOKEN_CACHE_USE_SHARED_CACHE,
+            cache_alias: str = TOKEN_CACHE_ALIAS,
+    ):
+        self.max_size = max_size
+        self.use_shared_cache = use_shared_cache
+        self.cache_alias = cache_alias
+
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> "VerifiedTokenCache":
+        """
+        :return: The token cache shared by the whole process.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+
+        return cls._instance
+
+    def get(self, token: str) -> dict | None:
+        """
+        Returns the claims of an already verified token.
+
+        :param token: Raw jwt token.
+        :return: Claims of the token, or None if the token was not verified yet or has expired.
+        """
+        digest = self.get_token_digest(token)
+
+        with self._lock:
+            claims = self._entries.get(digest)
+            if claims is not None:
+                if claims["exp"] > time.time():
+                    self._entries.move_to_end(digest)
+                    self.local_hits += 1
+                    return dict(claims)
+
+                del self._entries[digest]
+
+        if self.use_shared_cache:
+            claims = self.__get_shared(digest)
+            if claims is not None and claims["exp"] > time.time():
+                self.__set_local(digest, claims)
+                with self._lock:
+                    self.shared_hits += 1
+                return dict(claims)
+
+        with self._lock:
+            self.misses += 1
+
+        return None
+
+    def set(self, token: str, claims: dict) -> None:
+        """
+        Stores the claims of a verified token until the token expires.
+
+        :param token: Raw jwt token.
+        :param claims: Claims of the verified token.
+        """
+        expiration_timestamp = claims.get("exp")
+        if expiration_timestamp is None:
+            return
+
+        timeout = int(expiration_timestamp - time.time())
+        if timeout <= 0:
+            return
+
+        digest = self.get_token_digest(token)
+        self.__set_local(digest, claims)
+
+        if self.use_shared_cache:
+            try:
+                caches[self.cache_alias].set(self.__shared_key(digest), claims, timeout=timeout)
+            except Exception as e:
+                logging.warning(f"Failed to store verified token in the shared cache: {e}")
+
+    def clear(self) -> None:
+        """
+        Removes all locally cached tokens and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.local_hits = 0
+            self.shared_hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> dict:
+        """
+        :return: Hit and miss counters of the cache, along with the number of locally cached tokens.
+        """
+        with self._lock:
+            return {
+                "local_hits": self.local_hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+            }
+
+    @staticmethod
+    def get_token_digest(token: str) -> str:
+        """
+        :param token: Raw jwt token.
+        :return: SHA-256 hex digest of the token, used as its cache key.
+        """
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def __set_local(self, digest: str, claims: dict) -> None:
+        with self._lock:
+            self._entries[digest] = claims
+            self._entries.move_to_end(digest)
+
+            # Evict the least recently used tokens once the cache grows beyond its size limit
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def __get_shared(self, digest: str) -> dict | None:
+        try:
+            return caches[self.cache_alias].get(self.__shared_key(digest))
+        except Exception as e:
+            logging.warning(f"Failed to read verified token from the shared cache: {e}")
+            return None
+
+    @staticmethod
+    def __shared_key(digest: str) -> str:
+        return f"{TOKEN_CACHE_KEY_PREFIX}:{digest}"
@@ -0,0 +1,7 @@
+# Bloom filter settings of the username and email availability index
+AVAILABILITY_FILTER_CAPACITY = 1_000_000  # Expected number of users, the filter should be re-seeded with a larger capacity beyond it
+AVAILABILITY_FILTER_ERROR_RATE = 0.01  # Share of available names that still need to be checked in the database
+AVAILABILITY_USERNAME_FILTER_KEY = "availability:usernames"
+AVAILABILITY_EMAIL_FILTER_KEY = "availability:emails"
+AVAILABILITY_SEEDED_KEY = "availability:seeded"  # Set once the filters contain every existing user
+AVAILABILITY_SEED_BATCH_SIZE = 5000
@@ -2,6 +2,7 @@ from environ import environ
 
 DEFAULT_USER_GROUP = "Member"
 DEFAULT_AUTH_FLOW = "USER_PASSWORD_AUTH"
+GLOBAL_SIGN_OUT_JOB = "accounts.global_sign_out"
 
 # Read AWS Connection Keys From Environment
 env = environ.Env()
@@ -15,9 +16,35 @@ class AwsCognitoConfig:
     CLIENT_SECRET = env("COGNITO_CLIENT_SECRET")
     REGION_NAME = env("COGNITO_REGION_NAME")
     USER_POOL_ID = env("COGNITO_USER_POOL_ID")
+    ENDPOINT_URL = env("COGNITO_ENDPOINT_URL", default=None)  # Overrides the AWS endpoint, e.g. for a local Cognito
+
+
+# Boto3 Client Settings
+COGNITO_MAX_POOL_CONNECTIONS = env.int("COGNITO_MAX_POOL_CONNECTIONS", default=20)
+COGNITO_CONNECT_TIMEOUT = env.float("COGNITO_CONNECT_TIMEOUT", default=2.0)  # Seconds
+COGNITO_READ_TIMEOUT = env.float("COGNITO_READ_TIMEOUT", default=5.0)  # Seconds
+COGNITO_MAX_ATTEMPTS = 3  # Total number of attempts per call, including retries
 
 
 # Jwt Token Settings
 JWKS_URL = f"https://cognito-idp.{AwsCognitoConfig.REGION_NAME}.amazonaws.com/{AwsCognitoConfig.USER_POOL_ID}/.well-known/jwks.json"
 JWT_ALGORITHM = "RS256"
 JWT_ISSUER = f"https://cognito-idp.{AwsCognitoConfig.REGION_NAME}.amazonaws.com/{AwsCognitoConfig.USER_POOL_ID}"
+
+# JWKS Cache Settings
+JWKS_CACHE_TTL = 3600  # Seconds, used when the JWKS response does not specify a Cache-Control max-age
+JWKS_MIN_REFRESH_INTERVAL = 30  # Minimum number of seconds between two requests towards the JWKS endpoint
+JWKS_REQUEST_TIMEOUT = 5  # Seconds
+
+# Verified Token Cache Settings
+TOKEN_CACHE_MAX_SIZE = 10000  # Maximum number of verified tokens kept in process memory
+TOKEN_CACHE_USE_SHARED_CACHE = env.bool("TOKEN_CACHE_USE_SHARED_CACHE", default=False)  # Share verified tokens via Redis
+TOKEN_CACHE_ALIAS = "default"  # Alias of the Django cache used as the shared tier
+TOKEN_CACHE_KEY_PREFIX = "verified_token"
+
+# Token Refresh Coalescing Settings
+TOKEN_REFRESH_CACHE_ALIAS = "default"  # Alias of the Django cache holding the refresh locks and results
+TOKEN_REFRESH_LOCK_TIMEOUT = 10  # Seconds after which a lock held by a crashed request is released
+TOKEN_REFRESH_WAIT_TIMEOUT = 5.0  # Seconds a request waits for a refresh performed by another request
+TOKEN_REFRESH_POLL_INTERVAL = 0.05  # Seconds
+TOKEN_REFRESH_RESULT_TTL = 30  # Seconds the refreshed tokens are shared with concurrent requests
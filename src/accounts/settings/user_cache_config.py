@@ -0,0 +1,5 @@
+# Identity cache of the users resolved by their cognito id
+USER_IDENTITY_CACHE_ALIAS = "default"  # Alias of the Django cache used as the shared tier
+USER_IDENTITY_CACHE_KEY_PREFIX = "user_identity"
+USER_IDENTITY_CACHE_TTL = 3600  # Seconds
+USER_IDENTITY_NEGATIVE_CACHE_TTL = 60  # Seconds an unknown cognito id is remembered as unknown
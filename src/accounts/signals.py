@@ -0,0 +1,25 @@
+from django.core.signals import request_started
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from accounts.models import User
+from accounts.services.availability_service import AvailabilityService
+from accounts.services.user_identity_cache import UserIdentityCache
+
+
+@receiver(post_save, sender=User)
+def add_user_to_availability_index(sender, instance: User, created: bool, **kwargs):
+    if created:
+        AvailabilityService().add_user(instance.username, instance.email)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_identity(sender, instance: User, **kwargs):
+    # Also drops the negative entry cached for a cognito id that was unknown before the user got created
+    UserIdentityCache().invalidate(instance.cognito_id)
+
+
+@receiver(request_started)
+def clear_request_user_identities(sender, **kwargs):
+    UserIdentityCache.clear_local()
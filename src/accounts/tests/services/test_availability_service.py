@@ -0,0 +1,106 @@
+from unittest.mock import patch
+
+import pytest
+from redis.exceptions import ConnectionError
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from accounts.services.availability_service import AvailabilityService
+
+
+@pytest.fixture
+def availability_service(redis_client):
+    return AvailabilityService()
+
+
+@pytest.fixture
+def existing_user(redis_client):
+    return User.objects.create(username="TakenUser", email="taken@email.com", cognito_id="taken123")
+
+
+@pytest.mark.django_db
+def test_get_availability_with_unseeded_index_should_check_database(availability_service, existing_user):
+    # Act
+    username_available, email_available = availability_service.get_availability("takenuser", "TAKEN@email.com")
+
+    # Assert
+    assert username_available is False
+    assert email_available is False
+
+
+@pytest.mark.django_db
+def test_get_availability_with_seeded_index_and_free_values_should_not_query_database(
+        availability_service, existing_user, django_assert_num_queries
+):
+    # Assign
+    availability_service.seed()
+
+    # Act
+    with django_assert_num_queries(0):
+        username_available, email_available = availability_service.get_availability("freeuser", "free@email.com")
+
+    # Assert
+    assert username_available is True
+    assert email_available is True
+
+
+@pytest.mark.django_db
+def test_get_availability_with_seeded_index_and_taken_values_should_confirm_with_single_query(
+        availability_service, existing_user, django_assert_num_queries
+):
+    # Assign
+    availability_service.seed()
+
+    # Act
+    with django_assert_num_queries(1):
+        username_available, email_available = availability_service.get_availability("TAKENUSER", "taken@email.com")
+
+    # Assert
+    assert username_available is False
+    assert email_available is False
+
+
+@pytest.mark.django_db
+def test_is_username_available_with_user_created_after_seeding_should_return_false(availability_service):
+    # Assign
+    availability_service.seed()
+    User.objects.create(username="NewUser", email="new@email.com", cognito_id="new123")
+
+    # Act
+    result = availability_service.is_username_available("newuser")
+
+    # Assert
+    assert result is False
+
+
+@pytest.mark.django_db
+def test_get_availability_with_unavailable_redis_should_check_database(availability_service, existing_user):
+    # Assign
+    availability_service.seed()
+
+    # Act
+    with patch.object(availability_service.redis_client, "pipeline", side_effect=ConnectionError()):
+        username_available, email_available = availability_service.get_availability("takenuser", "free@email.com")
+
+    # Assert
+    assert username_available is False
+    assert email_available is True
+
+
+@pytest.mark.django_db
+def test_check_availability_endpoint_should_return_availability_of_each_value(existing_user):
+    # Act
+    response = APIClient().get("/api/users/availability?username=takenuser&email=free@email.com")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json() == {"username": False, "email": True}
+
+
+@pytest.mark.django_db
+def test_check_availability_endpoint_without_parameters_should_return_400_response():
+    # Act
+    response = APIClient().get("/api/users/availability")
+
+    # Assert
+    assert response.status_code == 400
@@ -0,0 +1,49 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from accounts.services.aws_cognito_client import AwsCognitoClient
+from accounts.settings.cognito_config import (
+    COGNITO_CONNECT_TIMEOUT,
+    COGNITO_MAX_POOL_CONNECTIONS,
+    COGNITO_READ_TIMEOUT,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_client():
+    AwsCognitoClient.reset_client()
+    yield
+    AwsCognitoClient.reset_client()
+
+
+def test_get_client_called_repeatedly_should_return_shared_client():
+    # Act
+    first_client = AwsCognitoClient().get_client()
+    second_client = AwsCognitoClient().get_client()
+
+    # Assert
+    assert first_client is second_client
+
+
+def test_get_client_called_concurrently_should_create_client_once():
+    # Act
+    with patch("accounts.services.aws_cognito_client.boto3.session.Session") as mock_session:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = list(executor.map(lambda _: AwsCognitoClient().get_client(), range(32)))
+
+    # Assert
+    mock_session.return_value.client.assert_called_once()
+    assert all(client is clients[0] for client in clients)
+
+
+def test_get_client_should_apply_pool_and_timeout_settings():
+    # Act
+    client = AwsCognitoClient().get_client()
+
+    # Assert
+    assert client.meta.config.max_pool_connections == COGNITO_MAX_POOL_CONNECTIONS
+    assert client.meta.config.connect_timeout == COGNITO_CONNECT_TIMEOUT
+    assert client.meta.config.read_timeout == COGNITO_READ_TIMEOUT
+    assert client.meta.config.tcp_keepalive is True
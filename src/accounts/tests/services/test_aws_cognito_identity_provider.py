@@ -141,3 +141,30 @@ def test_add_user_to_group_with_nonexistent_user_should_raise_validation_error(a
         Username=email,
         GroupName=group_name,
     )
+
+
+def test_sign_out_user_with_revoked_token_should_not_raise(aws_identity_provider, mock_client_instance):
+    # Arrange
+    mock_client_instance.global_sign_out.side_effect = ClientError(
+        {"Error": {"Code": "NotAuthorizedException", "Message": "Access Token has been revoked"}}, "global_sign_out"
+    )
+
+    # Act
+    response = aws_identity_provider.sign_out_user("revoked-token")
+
+    # Assert
+    assert response is None
+    mock_client_instance.global_sign_out.assert_called_once_with(AccessToken="revoked-token")
+
+
+def test_sign_out_user_with_cognito_error_should_not_expose_token(aws_identity_provider, mock_client_instance):
+    # Arrange
+    mock_client_instance.global_sign_out.side_effect = ClientError(
+        {"Error": {"Code": "InternalErrorException", "Message": "Internal error"}}, "global_sign_out"
+    )
+
+    # Act & Assert
+    with pytest.raises(ValidationError) as error:
+        aws_identity_provider.sign_out_user("secret-token")
+
+    assert "secret-token" not in str(error.value)
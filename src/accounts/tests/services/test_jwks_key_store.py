@@ -0,0 +1,125 @@
+from unittest.mock import MagicMock, patch
+
+import jwt
+import pytest
+import requests
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from accounts.services.jwks_key_store import JwksKeyStore
+
+
+def generate_jwk(kid: str) -> dict:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+    jwk.update({"kid": kid, "use": "sig", "alg": "RS256"})
+    return jwk
+
+
+def jwks_response(*jwks: dict, cache_control: str = None) -> MagicMock:
+    response = MagicMock()
+    response.json.return_value = {"keys": list(jwks)}
+    response.headers = {"Cache-Control": cache_control} if cache_control else {}
+    return response
+
+
+@pytest.fixture
+def key_store():
+    return JwksKeyStore(jwks_url="https://example.com/jwks.json", ttl=3600, min_refresh_interval=30)
+
+
+@pytest.fixture
+def mock_get():
+    with patch("accounts.services.jwks_key_store.requests.get") as mock_get:
+        yield mock_get
+
+
+@pytest.fixture
+def mock_time():
+    with patch("accounts.services.jwks_key_store.time.monotonic") as mock_time:
+        mock_time.return_value = 1000.0
+        yield mock_time
+
+
+def test_get_key_called_repeatedly_should_fetch_jwks_once(key_store, mock_get, mock_time):
+    # Assign
+    mock_get.return_value = jwks_response(generate_jwk("kid-1"))
+
+    # Act
+    first_key = key_store.get_key("kid-1")
+    second_key = key_store.get_key("kid-1")
+
+    # Assert
+    assert first_key is second_key
+    mock_get.assert_called_once()
+
+
+def test_get_key_with_unknown_kid_should_refresh_once_and_raise_error(key_store, mock_get, mock_time):
+    # Assign
+    mock_get.return_value = jwks_response(generate_jwk("kid-1"))
+    key_store.get_key("kid-1")
+    mock_time.return_value += 60
+
+    # Act & Assert
+    with pytest.raises(jwt.PyJWTError):
+        key_store.get_key("unknown-kid")
+    with pytest.raises(jwt.PyJWTError):
+        key_store.get_key("unknown-kid")
+
+    assert mock_get.call_count == 2
+
+
+def test_get_key_with_rotated_kid_should_load_new_key(key_store, mock_get, mock_time):
+    # Assign
+    mock_get.return_value = jwks_response(generate_jwk("kid-1"))
+    key_store.get_key("kid-1")
+    mock_time.return_value += 60
+    mock_get.return_value = jwks_response(generate_jwk("kid-1"), generate_jwk("kid-2"))
+
+    # Act
+    key = key_store.get_key("kid-2")
+
+    # Assert
+    assert key is not None
+    assert mock_get.call_count == 2
+
+
+def test_get_key_with_expired_keys_and_failing_endpoint_should_serve_last_good_keys(key_store, mock_get, mock_time):
+    # Assign
+    mock_get.return_value = jwks_response(generate_jwk("kid-1"))
+    cached_key = key_store.get_key("kid-1")
+    mock_time.return_value += 7200
+    mock_get.side_effect = requests.ConnectionError("Connection refused")
+
+    # Act
+    key = key_store.get_key("kid-1")
+
+    # Assert
+    assert key is cached_key
+    assert mock_get.call_count == 2
+
+
+def test_get_key_with_cache_control_max_age_should_expire_keys_after_max_age(key_store, mock_get, mock_time):
+    # Assign
+    mock_get.return_value = jwks_response(generate_jwk("kid-1"), cache_control="public, max-age=120")
+    key_store.get_key("kid-1")
+
+    # Act
+    mock_time.return_value += 100
+    key_store.get_key("kid-1")
+    fetches_before_expiry = mock_get.call_count
+    mock_time.return_value += 100
+    key_store.get_key("kid-1")
+
+    # Assert
+    assert fetches_before_expiry == 1
+    assert mock_get.call_count == 2
+
+
+def test_get_key_with_unreachable_endpoint_and_no_keys_should_raise_error(key_store, mock_get, mock_time):
+    # Assign
+    mock_get.side_effect = requests.Timeout("Timed out")
+
+    # Act & Assert
+    with pytest.raises(jwt.PyJWTError):
+        key_store.get_key("kid-1")
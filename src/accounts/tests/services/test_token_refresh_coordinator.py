@@ -0,0 +1,71 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.core.cache import cache
+from rest_framework.exceptions import ValidationError
+
+from accounts.services.token_refresh_coordinator import TokenRefreshCoordinator
+
+
+@pytest.fixture
+def coordinator():
+    cache.clear()
+    yield TokenRefreshCoordinator(wait_timeout=2.0, poll_interval=0.01)
+    cache.clear()
+
+
+def test_refresh_called_concurrently_should_refresh_token_once(coordinator):
+    # Assign
+    refresh_count = 0
+    refresh_count_lock = threading.Lock()
+
+    def refresh_function():
+        nonlocal refresh_count
+        with refresh_count_lock:
+            refresh_count += 1
+        time.sleep(0.2)
+        return {"AccessToken": "new-access-token", "ExpiresIn": 3600}
+
+    # Act
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: coordinator.refresh("refresh-token", refresh_function), range(8)))
+
+    # Assert
+    assert refresh_count == 1
+    assert all(result["AccessToken"] == "new-access-token" for result in results)
+
+
+def test_refresh_with_recently_refreshed_token_should_reuse_result(coordinator):
+    # Assign
+    coordinator.refresh("refresh-token", lambda: {"AccessToken": "first-access-token"})
+
+    # Act
+    result = coordinator.refresh("refresh-token", lambda: {"AccessToken": "second-access-token"})
+
+    # Assert
+    assert result["AccessToken"] == "first-access-token"
+
+
+def test_refresh_with_different_tokens_should_refresh_each_token(coordinator):
+    # Act
+    first_result = coordinator.refresh("first-refresh-token", lambda: {"AccessToken": "first-access-token"})
+    second_result = coordinator.refresh("second-refresh-token", lambda: {"AccessToken": "second-access-token"})
+
+    # Assert
+    assert first_result["AccessToken"] == "first-access-token"
+    assert second_result["AccessToken"] == "second-access-token"
+
+
+def test_refresh_with_failing_refresh_should_release_lock_and_raise_error(coordinator):
+    # Assign
+    def failing_refresh_function():
+        raise ValidationError("Failed to refresh token.")
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        coordinator.refresh("refresh-token", failing_refresh_function)
+
+    result = coordinator.refresh("refresh-token", lambda: {"AccessToken": "new-access-token"})
+    assert result["AccessToken"] == "new-access-token"
@@ -0,0 +1,70 @@
+import time
+from unittest.mock import MagicMock, patch
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from accounts.services.token_service import TokenService
+from accounts.services.verified_token_cache import VerifiedTokenCache
+from accounts.settings.cognito_config import JWT_ISSUER
+
+
+@pytest.fixture
+def private_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def key_store(private_key):
+    store = MagicMock()
+    store.get_key.return_value = private_key.public_key()
+    with patch("accounts.services.token_service.JwksKeyStore.get_instance", return_value=store):
+        yield store
+
+
+@pytest.fixture
+def token_cache():
+    token_cache = VerifiedTokenCache(use_shared_cache=False)
+    with patch("accounts.services.token_service.VerifiedTokenCache.get_instance", return_value=token_cache):
+        yield token_cache
+
+
+def create_token(private_key, expires_in: int = 3600) -> str:
+    payload = {"username": "user123", "iss": JWT_ISSUER, "exp": int(time.time()) + expires_in}
+    return jwt.encode(payload, private_key, algorithm="RS256", headers={"kid": "kid-1"})
+
+
+def test_decode_token_with_valid_token_should_return_claims(private_key, key_store, token_cache):
+    # Assign
+    token = create_token(private_key)
+
+    # Act
+    decoded_token = TokenService.decode_token(token)
+
+    # Assert
+    assert decoded_token["username"] == "user123"
+    key_store.get_key.assert_called_once_with("kid-1")
+
+
+def test_decode_token_called_repeatedly_should_verify_signature_once(private_key, key_store, token_cache):
+    # Assign
+    token = create_token(private_key)
+
+    # Act
+    with patch("accounts.services.token_service.jwt.decode", wraps=jwt.decode) as mock_decode:
+        for _ in range(5):
+            TokenService.decode_token(token)
+
+    # Assert
+    mock_decode.assert_called_once()
+    assert token_cache.get_stats()["local_hits"] == 4
+
+
+def test_decode_token_with_expired_token_should_raise_error(private_key, key_store, token_cache):
+    # Assign
+    token = create_token(private_key, expires_in=-10)
+
+    # Act & Assert
+    with pytest.raises(jwt.ExpiredSignatureError):
+        TokenService.decode_token(token)
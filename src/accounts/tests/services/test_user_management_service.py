@@ -0,0 +1,133 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+from rest_framework.exceptions import ValidationError
+
+from accounts.dto_models import SignUpUserModel
+from accounts.models import User
+from accounts.services.aws_cognito_client import AwsCognitoClient
+from accounts.services.user_management_service import UserManagementService
+from jobs.models import Job
+from jobs.services.job_service import JobService
+
+
+@pytest.fixture
+def mock_cognito_client():
+    client = MagicMock()
+    client.sign_up.return_value = {"UserSub": "cognito-sub-123"}
+    with patch.object(AwsCognitoClient, "get_client", return_value=client):
+        yield client
+
+
+@pytest.fixture
+def test_user():
+    return SignUpUserModel(
+        email="testuser@email.com",
+        password="TestPassword123!",
+        username="testuser",
+        first_name="TestF",
+        last_name="User",
+    )
+
+
+@pytest.mark.django_db
+def test_create_user_with_valid_data_should_create_cognito_and_local_user(mock_cognito_client, test_user):
+    # Act
+    UserManagementService().create_user(test_user)
+
+    # Assert
+    mock_cognito_client.sign_up.assert_called_once()
+    mock_cognito_client.admin_add_user_to_group.assert_called_once()
+    mock_cognito_client.admin_confirm_sign_up.assert_called_once()
+    mock_cognito_client.admin_delete_user.assert_not_called()
+    assert User.objects.filter(cognito_id="cognito-sub-123", username=test_user.username).exists()
+
+
+@pytest.mark.django_db
+def test_create_user_should_check_username_and_email_with_single_query(
+        mock_cognito_client, test_user, django_assert_num_queries
+):
+    # Act & Assert
+    # One query checks the availability, the other one inserts the local user
+    with django_assert_num_queries(2):
+        UserManagementService().create_user(test_user)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("username, email", [("testuser", "other@email.com"), ("otheruser", "testuser@email.com")])
+def test_create_user_with_taken_username_or_email_should_raise_error(mock_cognito_client, test_user, username, email):
+    # Assign
+    User.objects.create(username=username, email=email, cognito_id="existing123")
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        UserManagementService().create_user(test_user)
+
+    mock_cognito_client.sign_up.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_create_user_with_failing_confirmation_should_delete_cognito_user(mock_cognito_client, test_user):
+    # Assign
+    mock_cognito_client.admin_confirm_sign_up.side_effect = ClientError(
+        {"Error": {"Code": "SomeError", "Message": "Some error occurred"}}, "admin_confirm_sign_up"
+    )
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        UserManagementService().create_user(test_user)
+
+    mock_cognito_client.admin_delete_user.assert_called_once()
+    assert not User.objects.filter(username=test_user.username).exists()
+
+
+@pytest.mark.django_db
+def test_create_user_with_failing_local_insert_should_delete_cognito_user(mock_cognito_client, test_user):
+    # Assign
+    User.objects.create(username="otheruser", email="other@email.com", cognito_id="cognito-sub-123")
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        UserManagementService().create_user(test_user)
+
+    mock_cognito_client.admin_delete_user.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_sign_out_user_should_enqueue_sign_out_without_calling_cognito(mock_cognito_client):
+    # Act
+    UserManagementService().sign_out_user(access_token="access-token")
+
+    # Assert
+    mock_cognito_client.global_sign_out.assert_not_called()
+    assert Job.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_sign_out_user_processed_by_worker_should_sign_out_user_in_cognito(mock_cognito_client):
+    # Assign
+    UserManagementService().sign_out_user(access_token="access-token")
+
+    # Act
+    JobService.run_pending()
+
+    # Assert
+    mock_cognito_client.global_sign_out.assert_called_once_with(AccessToken="access-token")
+    assert not Job.objects.exists()
+
+
+@pytest.mark.django_db
+def test_sign_out_user_with_revoked_token_should_not_retry_job(mock_cognito_client):
+    # Assign
+    mock_cognito_client.global_sign_out.side_effect = ClientError(
+        {"Error": {"Code": "NotAuthorizedException", "Message": "Access Token has been revoked"}}, "global_sign_out"
+    )
+    UserManagementService().sign_out_user(access_token="access-token")
+
+    # Act
+    JobService.run_pending()
+
+    # Assert
+    mock_cognito_client.global_sign_out.assert_called_once_with(AccessToken="access-token")
+    assert not Job.objects.exists()
@@ -0,0 +1,136 @@
+import pytest
+
+from accounts.models import User
+from accounts.services.user_identity_cache import UserIdentityCache
+from accounts.services.user_service import UserService
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(username="user1", email="user1@email.com", cognito_id="user123")
+
+
+@pytest.mark.django_db
+def test_get_user_by_cognito_id_with_existing_user_should_return_user(user):
+    # Act
+    result = UserService.get_user_by_cognito_id(user.cognito_id)
+
+    # Assert
+    assert result == user
+    assert result.username == user.username
+
+
+@pytest.mark.django_db
+def test_get_user_by_cognito_id_with_warm_cache_should_not_query_database(user, django_assert_num_queries):
+    # Assign
+    UserService.get_user_by_cognito_id(user.cognito_id)
+    UserIdentityCache.clear_local()
+
+    # Act
+    with django_assert_num_queries(0):
+        result = UserService.get_user_by_cognito_id(user.cognito_id)
+
+    # Assert
+    assert result.id == user.id
+    assert result.email == user.email
+
+
+@pytest.mark.django_db
+def test_get_user_by_cognito_id_with_unknown_id_should_cache_negative_result(django_assert_num_queries):
+    # Assign
+    UserService.get_user_by_cognito_id("unknown")
+    UserIdentityCache.clear_local()
+
+    # Act
+    with django_assert_num_queries(0):
+        result = UserService.get_user_by_cognito_id("unknown")
+
+    # Assert
+    assert result is None
+
+
+@pytest.mark.django_db
+def test_get_user_by_cognito_id_with_user_created_after_negative_result_should_return_user():
+    # Assign
+    UserService.get_user_by_cognito_id("user123")
+    created_user = User.objects.create(username="user1", email="user1@email.com", cognito_id="user123")
+
+    # Act
+    result = UserService.get_user_by_cognito_id("user123")
+
+    # Assert
+    assert result == created_user
+
+
+@pytest.mark.django_db
+def test_get_user_by_cognito_id_with_updated_user_should_return_updated_identity(user):
+    # Assign
+    UserService.get_user_by_cognito_id(user.cognito_id)
+    user.username = "renamed"
+    user.save()
+
+    # Act
+    result = UserService.get_user_by_cognito_id(user.cognito_id)
+
+    # Assert
+    assert result.username == "renamed"
+
+
+@pytest.mark.django_db
+def test_get_user_by_cognito_id_with_deleted_user_should_return_none(user):
+    # Assign
+    UserService.get_user_by_cognito_id(user.cognito_id)
+    user.delete()
+
+    # Act
+    result = UserService.get_user_by_cognito_id("user123")
+
+    # Assert
+    assert result is None
+
+
+@pytest.mark.django_db
+def test_get_users_by_cognito_ids_with_uncached_users_should_use_single_query(django_assert_num_queries):
+    # Assign
+    users = [
+        User.objects.create(username=f"user{i}", email=f"user{i}@email.com", cognito_id=f"cognito{i}")
+        for i in range(20)
+    ]
+
+    # Act
+    with django_assert_num_queries(1):
+        result = UserService.get_users_by_cognito_ids([user.cognito_id for user in users] + ["unknown"])
+
+    # Assert
+    assert set(result) == {user.cognito_id for user in users}
+
+
+@pytest.mark.django_db
+def test_get_users_by_cognito_ids_with_warm_cache_should_not_query_database(user, django_assert_num_queries):
+    # Assign
+    UserService.get_users_by_cognito_ids([user.cognito_id, "unknown"])
+    UserIdentityCache.clear_local()
+
+    # Act
+    with django_assert_num_queries(0):
+        result = UserService.get_users_by_cognito_ids([user.cognito_id, "unknown"])
+
+    # Assert
+    assert result[user.cognito_id].id == user.id
+    assert "unknown" not in result
+
+
+@pytest.mark.django_db
+def test_get_users_by_cognito_ids_with_partially_cached_users_should_fetch_only_missing_users(
+        user, django_assert_num_queries
+):
+    # Assign
+    UserService.get_user_by_cognito_id(user.cognito_id)
+    other_user = User.objects.create(username="user2", email="user2@email.com", cognito_id="user456")
+
+    # Act
+    with django_assert_num_queries(1):
+        result = UserService.get_users_by_cognito_ids([user.cognito_id, other_user.cognito_id])
+
+    # Assert
+    assert result == {user.cognito_id: user, other_user.cognito_id: other_user}
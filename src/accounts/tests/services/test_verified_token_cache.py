@@ -0,0 +1,94 @@
+import time
+
+import pytest
+from django.core.cache import cache
+
+from accounts.services.verified_token_cache import VerifiedTokenCache
+
+
+def claims(expires_in: int = 3600) -> dict:
+    return {"username": "user123", "exp": int(time.time()) + expires_in}
+
+
+@pytest.fixture
+def token_cache():
+    return VerifiedTokenCache(max_size=2, use_shared_cache=False)
+
+
+@pytest.fixture
+def shared_token_cache():
+    cache.clear()
+    yield VerifiedTokenCache(max_size=2, use_shared_cache=True)
+    cache.clear()
+
+
+def test_get_with_cached_token_should_return_claims_and_count_hit(token_cache):
+    # Assign
+    token_claims = claims()
+    token_cache.set("token", token_claims)
+
+    # Act
+    result = token_cache.get("token")
+
+    # Assert
+    assert result == token_claims
+    assert token_cache.get_stats()["local_hits"] == 1
+
+
+def test_get_with_unknown_token_should_return_none_and_count_miss(token_cache):
+    # Act
+    result = token_cache.get("token")
+
+    # Assert
+    assert result is None
+    assert token_cache.get_stats()["misses"] == 1
+
+
+def test_get_with_expired_token_should_return_none(token_cache):
+    # Assign
+    token_cache.set("token", claims())
+    token_cache._entries[token_cache.get_token_digest("token")]["exp"] = int(time.time()) - 1
+
+    # Act
+    result = token_cache.get("token")
+
+    # Assert
+    assert result is None
+    assert token_cache.get_stats()["size"] == 0
+
+
+def test_set_with_expired_token_should_not_cache_token(token_cache):
+    # Act
+    token_cache.set("token", claims(expires_in=-10))
+
+    # Assert
+    assert token_cache.get_stats()["size"] == 0
+
+
+def test_set_beyond_max_size_should_evict_least_recently_used_token(token_cache):
+    # Assign
+    token_cache.set("first", claims())
+    token_cache.set("second", claims())
+    token_cache.get("first")
+
+    # Act
+    token_cache.set("third", claims())
+
+    # Assert
+    assert token_cache.get("second") is None
+    assert token_cache.get("first") is not None
+    assert token_cache.get("third") is not None
+
+
+def test_get_with_token_cached_by_other_process_should_return_claims_from_shared_cache(shared_token_cache):
+    # Assign
+    token_claims = claims()
+    other_process_cache = VerifiedTokenCache(max_size=2, use_shared_cache=True)
+    other_process_cache.set("token", token_claims)
+
+    # Act
+    result = shared_token_cache.get("token")
+
+    # Assert
+    assert result == token_claims
+    assert shared_token_cache.get_stats()["shared_hits"] == 1
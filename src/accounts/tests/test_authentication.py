@@ -0,0 +1,114 @@
+import time
+from unittest.mock import patch
+
+import pytest
+from jwt import PyJWTError
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from accounts.services.token_service import TokenService
+from posts.models import Post
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(username="user1", email="user1@email.com", cognito_id="user123")
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    client.cookies["access_token"] = "access-token"
+    return client
+
+
+@pytest.fixture
+def mock_decode_token(user):
+    claims = {"username": user.cognito_id, "exp": int(time.time()) + 3600}
+    with patch.object(TokenService, "decode_token", return_value=claims) as mock_decode_token:
+        yield mock_decode_token
+
+
+@pytest.mark.django_db
+def test_create_post_with_valid_token_should_decode_token_once(user, api_client, mock_decode_token):
+    # Act
+    response = api_client.post("/api/users/post/create", {"content": "Test post content"})
+
+    # Assert
+    assert response.status_code == 201
+    mock_decode_token.assert_called_once_with("access-token")
+
+
+@pytest.mark.django_db
+def test_create_post_with_valid_token_should_resolve_user_with_single_query(
+        user, api_client, mock_decode_token, django_assert_num_queries
+):
+    # Act & Assert
+    # One query resolves the authenticated user, one inserts the post and one loads the followers to fan out to
+    with django_assert_num_queries(3):
+        response = api_client.post("/api/users/post/create", {"content": "Test post content"})
+
+    assert response.status_code == 201
+    assert Post.objects.filter(user=user).exists()
+
+
+@pytest.mark.django_db
+def test_create_post_with_warm_identity_cache_should_resolve_user_without_query(
+        user, api_client, mock_decode_token, django_assert_num_queries
+):
+    # Assign
+    api_client.post("/api/users/post/create", {"content": "First post"})
+
+    # Act & Assert
+    # The only queries left are the insert of the post and the followers to fan out to
+    with django_assert_num_queries(2):
+        response = api_client.post("/api/users/post/create", {"content": "Second post"})
+
+    assert response.status_code == 201
+
+
+@pytest.mark.django_db
+def test_follow_user_with_valid_token_should_resolve_each_user_once(
+        user, api_client, mock_decode_token, django_assert_num_queries
+):
+    # Assign
+    followed = User.objects.create(username="user2", email="user2@email.com", cognito_id="user456")
+
+    # Act & Assert
+    # Two queries resolve the users, the remaining ones belong to the get_or_create of the follow relationship
+    # and the update of the follow counts in the same transaction
+    with django_assert_num_queries(10):
+        response = api_client.post(f"/api/users/follow?user_id={followed.cognito_id}")
+
+    assert response.status_code == 201
+    mock_decode_token.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_create_post_without_token_should_return_401_response():
+    # Act
+    response = APIClient().post("/api/users/post/create", {"content": "Test post content"})
+
+    # Assert
+    assert response.status_code == 401
+
+
+@pytest.mark.django_db
+def test_create_post_with_invalid_token_should_return_401_response(api_client):
+    # Act
+    with patch.object(TokenService, "decode_token", side_effect=PyJWTError("Invalid token")):
+        response = api_client.post("/api/users/post/create", {"content": "Test post content"})
+
+    # Assert
+    assert response.status_code == 401
+
+
+@pytest.mark.django_db
+def test_create_post_with_token_of_unknown_user_should_return_401_response(api_client):
+    # Act
+    claims = {"username": "unknown", "exp": int(time.time()) + 3600}
+    with patch.object(TokenService, "decode_token", return_value=claims):
+        response = api_client.post("/api/users/post/create", {"content": "Test post content"})
+
+    # Assert
+    assert response.status_code == 401
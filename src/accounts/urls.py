@@ -1,9 +1,10 @@
 from django.urls import path
 
-from accounts.views import sign_in_user, sign_out_user, sign_up_user
+from accounts.views import check_availability, sign_in_user, sign_out_user, sign_up_user
 
 urlpatterns = [
     path("signup", sign_up_user, name="signup"),
     path("signin", sign_in_user, name="signin"),
     path("signout", sign_out_user, name="signout"),
+    path("availability", check_availability, name="availability"),
 ]
@@ -1,12 +1,14 @@
 from rest_framework import status
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, authentication_classes
 from rest_framework.response import Response
 
 from accounts.serializers import SignInUserSerializer, SignUpUserSerializer
+from accounts.services.availability_service import AvailabilityService
 from accounts.services.user_management_service import UserManagementService
 
 
 @api_view(["POST"])
+@authentication_classes([])
 def sign_up_user(request) -> Response:
     serializer = SignUpUserSerializer(data=request.data)
     if not serializer.is_valid():
@@ -19,6 +21,7 @@ def sign_up_user(request) -> Response:
 
 
 @api_view(["POST"])
+@authentication_classes([])
 def sign_in_user(request):
     serializer = SignInUserSerializer(data=request.data)
     if not serializer.is_valid():
@@ -51,6 +54,7 @@ def sign_in_user(request):
 
 
 @api_view(["POST"])
+@authentication_classes([])
 def sign_out_user(request):
     access_token = request.COOKIES.get("access_token")
 
@@ -65,3 +69,27 @@ def sign_out_user(request):
     response.delete_cookie(key="refresh_token")
 
     return response
+
+
+@api_view(["GET"])
+@authentication_classes([])
+def check_availability(request):
+    username = request.query_params.get("username")
+    email = request.query_params.get("email")
+
+    if not username and not email:
+        return Response(
+            {"error": "Missing 'username' or 'email' query parameter."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    availability_service = AvailabilityService()
+    username_available, email_available = availability_service.get_availability(username=username, email=email)
+
+    response_data = {}
+    if username:
+        response_data["username"] = username_available
+    if email:
+        response_data["email"] = email_available
+
+    return Response(response_data, status=status.HTTP_200_OK)
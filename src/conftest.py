@@ -0,0 +1,47 @@
+import pytest
+from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
+
+from accounts.services.user_identity_cache import UserIdentityCache
+from utils import redis_client as redis_client_module
+from utils.redis_client import get_redis_client
+
+
+@pytest.fixture(scope="session", autouse=True)
+def redis_test_database():
+    """
+    Points the Redis client and the caches at TEST_REDIS_URL, the tests flush the database they run against.
+    """
+    if settings.TEST_REDIS_URL == settings.REDIS_URL:
+        pytest.exit("TEST_REDIS_URL must not be REDIS_URL, the tests would flush the Redis database of the app.")
+
+    caches = {
+        alias: {**config, "LOCATION": settings.TEST_REDIS_URL} if config.get("LOCATION") == settings.REDIS_URL
+        else config
+        for alias, config in settings.CACHES.items()
+    }
+    with override_settings(REDIS_URL=settings.TEST_REDIS_URL, CACHES=caches):
+        redis_client_module._client = None
+        yield
+    redis_client_module._client = None
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """
+    Starts every test with empty caches, cached entries could otherwise refer to rows of a rolled back test.
+    """
+    cache.clear()
+    UserIdentityCache.clear_local()
+
+
+@pytest.fixture
+def redis_client():
+    """
+    Redis client with an empty database, for tests of the services built on Redis data structures.
+    """
+    client = get_redis_client()
+    client.flushdb()
+    yield client
+    client.flushdb()
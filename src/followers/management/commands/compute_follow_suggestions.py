@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from followers.services.follow_suggestion_service import FollowSuggestionService
+from followers.settings.follow_settings import FOLLOW_SUGGESTIONS_BLOCK_SIZE, FOLLOW_SUGGESTIONS_MAX_PER_USER
+
+
+class Command(BaseCommand):
+    help = "Computes the follow suggestions of all users from the follow graph."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--block-size", type=int, default=FOLLOW_SUGGESTIONS_BLOCK_SIZE)
+        parser.add_argument("--workers", type=int, default=1, help="Processes computing the suggestions.")
+        parser.add_argument("--max-per-user", type=int, default=FOLLOW_SUGGESTIONS_MAX_PER_USER)
+
+    def handle(self, *args, **options):
+        count = FollowSuggestionService().compute(
+            block_size=options["block_size"], workers=options["workers"], max_per_user=options["max_per_user"]
+        )
+        self.stdout.write(f"Computed the follow suggestions of {count} users.")
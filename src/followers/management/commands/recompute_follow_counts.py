@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from followers.services.follow_count_service import FollowCountService
+from followers.settings.follow_settings import FOLLOW_COUNT_RECOMPUTE_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = "Recounts the follows of all users and corrects the counts that drifted."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=FOLLOW_COUNT_RECOMPUTE_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        count = FollowCountService().recompute(batch_size=options["batch_size"])
+        self.stdout.write(f"Corrected the follow counts of {count} users.")
@@ -0,0 +1,52 @@
+# Generated by Django 5.1.3 on 2026-10-17 20:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def delete_duplicate_follows(apps, schema_editor):
+    """
+    Keeps the oldest follow of every follower and followed pair, so the unique constraint can be added.
+    """
+    Follow = apps.get_model("followers", "Follow")
+
+    duplicates = (
+        Follow.objects.values("follower_id", "followed_id")
+        .annotate(count=models.Count("id"), first_id=models.Min("id"))
+        .filter(count__gt=1)
+    )
+    for duplicate in duplicates.iterator():
+        Follow.objects.filter(follower_id=duplicate["follower_id"], followed_id=duplicate["followed_id"]).exclude(
+            id=duplicate["first_id"]
+        ).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_user_upper_indexes'),
+        ('followers', '0001_initial'),
+    ]
+
+    # The composite indexes are created before the single column indexes they replace are dropped
+    operations = [
+        migrations.RunPython(delete_duplicate_follows, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='follow',
+            constraint=models.UniqueConstraint(fields=('follower', 'followed'), name='follow_follower_followed_unique'),
+        ),
+        migrations.AddIndex(
+            model_name='follow',
+            index=models.Index(fields=['followed', 'follower'], name='follow_followed_follower_idx'),
+        ),
+        migrations.AlterField(
+            model_name='follow',
+            name='followed',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='followers', to='accounts.user'),
+        ),
+        migrations.AlterField(
+            model_name='follow',
+            name='follower',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='following', to='accounts.user'),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.1.3 on 2026-10-17 20:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def count_follows(apps, schema_editor):
+    Follow = apps.get_model("followers", "Follow")
+    FollowCount = apps.get_model("followers", "FollowCount")
+    User = apps.get_model("accounts", "User")
+
+    def count(field):
+        return Coalesce(
+            models.Subquery(
+                Follow.objects.filter(**{field: models.OuterRef("id")})
+                .values(field)
+                .annotate(count=models.Count("id"))
+                .values("count")
+            ),
+            0,
+        )
+
+    users = User.objects.annotate(
+        follower_count=count("followed_id"), following_count=count("follower_id")
+    ).values_list("id", "follower_count", "following_count")
+    batch = []
+    for user_id, follower_count, following_count in users.iterator(chunk_size=1000):
+        batch.append(FollowCount(user_id=user_id, follower_count=follower_count, following_count=following_count))
+        if len(batch) == 1000:
+            FollowCount.objects.bulk_create(batch)
+            batch = []
+    FollowCount.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_user_upper_indexes'),
+        ('followers', '0002_follow_unique_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FollowCount',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='follow_count', serialize=False, to='accounts.user')),
+                ('follower_count', models.IntegerField(default=0)),
+                ('following_count', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(count_follows, migrations.RunPython.noop),
+    ]
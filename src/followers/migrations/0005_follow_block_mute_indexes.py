@@ -0,0 +1,26 @@
+# Generated by Django 5.1.3 on 2026-10-17 20:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_user_upper_indexes'),
+        ('followers', '0004_follow_suggestion'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='follow',
+            index=models.Index(condition=models.Q(('is_blocked', True)), fields=['follower', 'followed'], name='follow_blocked_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='follow',
+            index=models.Index(condition=models.Q(('is_blocked', True)), fields=['followed', 'follower'], name='follow_blocked_by_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='follow',
+            index=models.Index(condition=models.Q(('is_muted', True)), fields=['follower', 'followed'], name='follow_muted_idx'),
+        ),
+    ]
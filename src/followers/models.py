@@ -1,11 +1,47 @@
+from django.contrib.postgres.fields import ArrayField
 from django.db import models
+from django.db.models import Q
 
 from accounts.models import User
 
 
 class Follow(models.Model):
-    follower = models.ForeignKey(User, related_name="following", on_delete=models.CASCADE)
-    followed = models.ForeignKey(User, related_name="followers", on_delete=models.CASCADE)
+    # Both columns lead one of the composite indexes, separate indexes on them would only slow down the writes
+    follower = models.ForeignKey(User, related_name="following", on_delete=models.CASCADE, db_index=False)
+    followed = models.ForeignKey(User, related_name="followers", on_delete=models.CASCADE, db_index=False)
     timestamp = models.DateTimeField(auto_now_add=True)
     is_muted = models.BooleanField(default=False)
     is_blocked = models.BooleanField(default=False)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["follower", "followed"], name="follow_follower_followed_unique"),
+        ]
+        indexes = [
+            models.Index(fields=["followed", "follower"], name="follow_followed_follower_idx"),
+            # Few follows are blocked or muted, partial indexes keep the block and mute lookups small
+            models.Index(fields=["follower", "followed"], condition=Q(is_blocked=True), name="follow_blocked_idx"),
+            models.Index(fields=["followed", "follower"], condition=Q(is_blocked=True), name="follow_blocked_by_idx"),
+            models.Index(fields=["follower", "followed"], condition=Q(is_muted=True), name="follow_muted_idx"),
+        ]
+
+
+class FollowCount(models.Model):
+    """
+    Denormalised follow counts of a user, in a table of their own so follows do not lock the user rows.
+    """
+    user = models.OneToOneField(User, primary_key=True, related_name="follow_count", on_delete=models.CASCADE)
+    follower_count = models.IntegerField(default=0)
+    following_count = models.IntegerField(default=0)
+
+
+class FollowSuggestion(models.Model):
+    """
+    Precomputed follow suggestions of a user, in a single row so they are read with one primary key lookup.
+
+    The suggested users are ordered best first, with the number of users followed by the user who follow them.
+    """
+    user = models.OneToOneField(User, primary_key=True, related_name="follow_suggestions", on_delete=models.CASCADE)
+    suggested_ids = ArrayField(models.BigIntegerField())
+    mutual_counts = ArrayField(models.IntegerField())
+    computed_at = models.DateTimeField()
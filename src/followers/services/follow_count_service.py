@@ -0,0 +1,196 @@
+import logging
+
+from django.db import transaction
+from django.db.models import Case, Count, F, IntegerField, OuterRef, Subquery, Value, When
+from django.db.models.functions import Coalesce
+from redis.exceptions import RedisError, WatchError
+
+from accounts.models import User
+from followers.models import Follow, FollowCount
+from followers.settings.follow_settings import (
+    FOLLOW_COUNT_KEY_PREFIX,
+    FOLLOW_COUNT_RECOMPUTE_BATCH_SIZE,
+    FOLLOW_COUNT_TTL,
+)
+from utils.redis_client import get_redis_client
+
+class FollowCountService:
+    """
+    Maintains the follower and following counts of the users.
+
+    The counts are updated with F() expressions in the transaction of the follow or unfollow, so they never drift
+    from the follows by a committed change. The reads are served by a Redis mirror of the counts, dropped once the
+    transaction commits and loaded again by the next read.
+    """
+
+    def __init__(self):
+        self.redis_client = get_redis_client()
+
+    def add_follow(self, follower_id: int, followed_id: int) -> None:
+        """
+        Counts a created follow. Must run in the transaction creating the follow.
+
+        :param follower_id: ID of the user who is following.
+        :param followed_id: ID of the user being followed.
+        """
+        self.add_follows({(follower_id, followed_id): 1})
+
+    def remove_follow(self, follower_id: int, followed_id: int) -> None:
+        """
+        Counts a deleted follow. Must run in the transaction deleting the follow.
+
+        :param follower_id: ID of the user who unfollowed.
+        :param followed_id: ID of the user being unfollowed.
+        """
+        self.add_follows({(follower_id, followed_id): -1})
+
+    def add_follows(self, deltas: dict[tuple[int, int], int]) -> None:
+        """
+        Counts several follows or unfollows with a single UPDATE. Must run in the transaction changing the follows.
+
+        :param deltas: Number of follows added, negative for removed follows, per follower and followed ID pair.
+        """
+        follower_deltas = {}
+        following_deltas = {}
+        for (follower_id, followed_id), delta in deltas.items():
+            following_deltas[follower_id] = following_deltas.get(follower_id, 0) + delta
+            follower_deltas[followed_id] = follower_deltas.get(followed_id, 0) + delta
+
+        user_ids = follower_deltas.keys() | following_deltas.keys()
+        if not user_ids:
+            return
+
+        # Users that never followed anyone or were never followed have no counts yet
+        FollowCount.objects.bulk_create([FollowCount(user_id=user_id) for user_id in user_ids], ignore_conflicts=True)
+        FollowCount.objects.filter(user_id__in=user_ids).update(
+            follower_count=F("follower_count") + self.__get_delta(follower_deltas),
+            following_count=F("following_count") + self.__get_delta(following_deltas),
+        )
+
+        transaction.on_commit(lambda: self.__drop_mirrors(user_ids))
+
+    def get_counts(self, user_id: int) -> tuple[int, int]:
+        """
+        Returns the follow counts of a user.
+
+        :param user_id: ID of the user.
+        :return: Number of followers and number of followed users.
+        """
+        key = self.get_key(user_id)
+        try:
+            follower_count, following_count = self.redis_client.hmget(key, ["followers", "following"])
+            if follower_count is not None and following_count is not None:
+                return int(follower_count), int(following_count)
+
+            return self.__load(user_id)
+        except RedisError as e:
+            logging.error(f"Failed to read the follow counts of user {user_id}, querying the database: {e}")
+            return self.__query(user_id)
+
+    def recompute(self, batch_size: int = FOLLOW_COUNT_RECOMPUTE_BATCH_SIZE) -> int:
+        """
+        Recounts the follows of all users, for counts that drifted from the follows.
+
+        :param batch_size: Number of users recounted per query.
+        :return: Number of users whose counts were corrected.
+        """
+        corrected = 0
+        last_id = 0
+        while True:
+            user_ids = list(
+                User.objects.filter(id__gt=last_id).order_by("id").values_list("id", flat=True)[:batch_size]
+            )
+            if not user_ids:
+                return corrected
+
+            with transaction.atomic():
+                # The counts are locked before the follows are counted, a follow or unfollow of these users waits
+                # for the correction and then applies its change on top of it. The count is a separate statement,
+                # a statement waiting for a lock still reads the follows as they were when it started.
+                FollowCount.objects.bulk_create(
+                    [FollowCount(user_id=user_id) for user_id in user_ids], ignore_conflicts=True
+                )
+                list(FollowCount.objects.select_for_update().filter(user_id__in=user_ids).order_by("user_id"))
+                counts = list(
+                    FollowCount.objects.filter(user_id__in=user_ids)
+                    .annotate(
+                        actual_follower_count=self.__count_follows("followed_id"),
+                        actual_following_count=self.__count_follows("follower_id"),
+                    )
+                )
+
+                drifted = []
+                for count in counts:
+                    if (count.follower_count, count.following_count) != (
+                            count.actual_follower_count, count.actual_following_count
+                    ):
+                        count.follower_count = count.actual_follower_count
+                        count.following_count = count.actual_following_count
+                        drifted.append(count)
+                FollowCount.objects.bulk_update(drifted, ["follower_count", "following_count"])
+
+            if drifted:
+                # Dropped mirrors are loaded again with the corrected counts
+                self.__drop_mirrors({count.user_id for count in drifted})
+
+            corrected += len(drifted)
+            last_id = user_ids[-1]
+
+    @staticmethod
+    def get_key(user_id: int) -> str:
+        return f"{FOLLOW_COUNT_KEY_PREFIX}:{user_id}"
+
+    @staticmethod
+    def __get_delta(deltas: dict[int, int]) -> Case:
+        return Case(
+            *[When(user_id=user_id, then=Value(delta)) for user_id, delta in deltas.items() if delta],
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+
+    @staticmethod
+    def __count_follows(field: str) -> Coalesce:
+        follows = Follow.objects.filter(**{field: OuterRef("user_id")}).values(field).annotate(count=Count("id"))
+        return Coalesce(Subquery(follows.values("count")), 0)
+
+    @staticmethod
+    def __query(user_id: int) -> tuple[int, int]:
+        counts = FollowCount.objects.filter(user_id=user_id).values_list("follower_count", "following_count").first()
+        return counts or (0, 0)
+
+    def __drop_mirrors(self, user_ids: set[int]) -> None:
+        # Adding a delta to a mirror would count it twice after a load that read the committed count before this
+        # runs. Dropping the mirror is idempotent, and the bumped version stops a load that read the count before
+        # the commit from storing it.
+        try:
+            pipeline = self.redis_client.pipeline(transaction=False)
+            for user_id in user_ids:
+                key = self.get_key(user_id)
+                pipeline.delete(key)
+                pipeline.incr(self.__get_version_key(key))
+                pipeline.expire(self.__get_version_key(key), FOLLOW_COUNT_TTL)
+            pipeline.execute()
+        except RedisError as e:
+            # Mirrors that missed the change are stale until they expire or the counts are recomputed
+            logging.error(f"Failed to drop the mirrored follow counts of {len(user_ids)} users: {e}")
+
+    def __load(self, user_id: int) -> tuple[int, int]:
+        key = self.get_key(user_id)
+        with self.redis_client.pipeline() as pipeline:
+            # A follow or unfollow between the query and the write bumps the version and the count is not stored
+            pipeline.watch(self.__get_version_key(key))
+            follower_count, following_count = self.__query(user_id)
+
+            pipeline.multi()
+            pipeline.hset(key, mapping={"followers": follower_count, "following": following_count})
+            pipeline.expire(key, FOLLOW_COUNT_TTL)
+            try:
+                pipeline.execute()
+            except WatchError:
+                logging.info(f"Follow counts of user {user_id} changed while loading, they are loaded on next use.")
+
+        return follower_count, following_count
+
+    @staticmethod
+    def __get_version_key(key: str) -> str:
+        return f"{key}:version"
@@ -0,0 +1,207 @@
+import logging
+
+from redis.exceptions import RedisError, WatchError
+
+from followers.models import Follow
+from followers.settings.follow_settings import FOLLOW_GRAPH_KEY_PREFIX, FOLLOW_GRAPH_TTL
+from utils.redis_client import get_redis_client
+
+# Applies a follow or unfollow (ARGV[1] is SADD or SREM) to the following set of the follower (KEYS[1]). A set
+# that is not loaded is left alone, it is loaded with the change. The version (KEYS[2]) is bumped, so a load that
+# read the database before the change does not store a stale set.
+WRITE_SCRIPT = """
+local ttl = tonumber(ARGV[3])
+redis.call("INCR", KEYS[2])
+redis.call("EXPIRE", KEYS[2], ttl)
+if redis.call("EXISTS", KEYS[1]) == 1 then
+    redis.call(ARGV[1], KEYS[1], ARGV[2])
+    redis.call("EXPIRE", KEYS[1], ttl)
+end
+return 1
+"""
+
+
+class FollowGraphService:
+    """
+    Write-through cache of the follow graph, with the users every user follows as a Redis set.
+
+    A set is loaded from the database on first use and then kept up to date by the follows and unfollows. Loaded
+    sets hold a marker member, so a user who follows nobody does not hit the database on every check. Relationship
+    checks are a single SMISMEMBER and the common follows of two users a single SINTER.
+    """
+    COMPLETE_MARKER = b"complete"
+
+    def __init__(self):
+        self.redis_client = get_redis_client()
+        self.write_script = self.redis_client.register_script(WRITE_SCRIPT)
+
+    def add_follow(self, follower_id: int, followed_id: int) -> None:
+        """
+        Adds a created follow to the cached sets.
+
+        :param follower_id: ID of the user who is following.
+        :param followed_id: ID of the user being followed.
+        """
+        self.add_follows(follower_id, [followed_id])
+
+    def add_follows(self, follower_id: int, followed_ids: list[int]) -> None:
+        """
+        Adds created follows of a user to the cached sets, in a single round trip.
+
+        :param follower_id: ID of the user who is following.
+        :param followed_ids: IDs of the users being followed.
+        """
+        self.__write("SADD", follower_id, followed_ids)
+
+    def remove_follow(self, follower_id: int, followed_id: int) -> None:
+        """
+        Removes a deleted follow from the cached sets.
+
+        :param follower_id: ID of the user who unfollowed.
+        :param followed_id: ID of the user being unfollowed.
+        """
+        self.remove_follows(follower_id, [followed_id])
+
+    def remove_follows(self, follower_id: int, followed_ids: list[int]) -> None:
+        """
+        Removes deleted follows of a user from the cached sets, in a single round trip.
+
+        :param follower_id: ID of the user who unfollowed.
+        :param followed_ids: IDs of the users being unfollowed.
+        """
+        self.__write("SREM", follower_id, followed_ids)
+
+    def is_following(self, follower_id: int, followed_id: int) -> bool:
+        """
+        Checks whether a user follows another user.
+
+        :param follower_id: ID of the possible follower.
+        :param followed_id: ID of the possibly followed user.
+        :return: True if the follow exists.
+        """
+        return followed_id in self.filter_following(follower_id, [followed_id])
+
+    def filter_following(self, follower_id: int, user_ids: list[int]) -> set[int]:
+        """
+        Returns which of the users a user follows.
+
+        :param follower_id: ID of the follower.
+        :param user_ids: IDs of the users to check.
+        :return: IDs of the followed users.
+        """
+        if not user_ids:
+            return set()
+
+        key = self.get_following_key(follower_id)
+        try:
+            loaded, *states = self.redis_client.smismember(key, [self.COMPLETE_MARKER, *user_ids])
+            if loaded:
+                return {user_id for user_id, state in zip(user_ids, states) if state}
+        except RedisError as e:
+            logging.error(f"Failed to check the follows of user {follower_id}, querying the database: {e}")
+            return set(
+                Follow.objects.filter(follower_id=follower_id, followed_id__in=user_ids).values_list(
+                    "followed_id", flat=True
+                )
+            )
+
+        return self.get_following_ids(follower_id) & set(user_ids)
+
+    def get_following_ids(self, user_id: int) -> set[int]:
+        """
+        Returns the users a user follows.
+
+        :param user_id: ID of the user.
+        :return: IDs of the followed users.
+        """
+        key = self.get_following_key(user_id)
+        try:
+            members = self.redis_client.smembers(key)
+            if members:
+                return {int(member) for member in members if member != self.COMPLETE_MARKER}
+
+            return self.__load(user_id)
+        except RedisError as e:
+            logging.error(f"Failed to read the follows of user {user_id}, querying the database: {e}")
+            return self.__query(user_id)
+
+    def get_common_following_ids(self, user_id: int, other_user_id: int) -> set[int]:
+        """
+        Returns the users followed by both users.
+
+        :param user_id: ID of the first user.
+        :param other_user_id: ID of the second user.
+        :return: IDs of the users both users follow.
+        """
+        keys = [self.get_following_key(user_id), self.get_following_key(other_user_id)]
+        try:
+            # Loads the sets that are missing, the intersection is then computed by Redis
+            loaded_ids = {}
+            for follower_id, key in zip((user_id, other_user_id), keys):
+                if not self.redis_client.exists(key):
+                    loaded_ids[follower_id] = self.get_following_ids(follower_id)
+
+            # A set that changed while loading is not stored, SINTER would take the missing key for an empty set
+            if loaded_ids and self.redis_client.exists(*keys) < len(keys):
+                following_ids = [
+                    loaded_ids[follower_id] if follower_id in loaded_ids else self.get_following_ids(follower_id)
+                    for follower_id in (user_id, other_user_id)
+                ]
+                return following_ids[0] & following_ids[1]
+
+            members = self.redis_client.sinter(*keys)
+            return {int(member) for member in members if member != self.COMPLETE_MARKER}
+        except RedisError as e:
+            logging.error(f"Failed to intersect the follows of users {user_id} and {other_user_id}: {e}")
+            return self.get_following_ids(user_id) & self.get_following_ids(other_user_id)
+
+    @staticmethod
+    def get_following_key(user_id: int) -> str:
+        return f"{FOLLOW_GRAPH_KEY_PREFIX}:following:{user_id}"
+
+    def __write(self, command: str, follower_id: int, followed_ids: list[int]) -> None:
+        if not followed_ids:
+            return
+
+        key = self.get_following_key(follower_id)
+        try:
+            pipeline = self.redis_client.pipeline(transaction=False)
+            for followed_id in followed_ids:
+                self.write_script(
+                    keys=[key, self.__get_version_key(key)], args=[command, followed_id, FOLLOW_GRAPH_TTL],
+                    client=pipeline,
+                )
+            pipeline.execute()
+        except RedisError as e:
+            # A set that missed the change is stale, dropping it makes the next read load it again
+            logging.error(f"Failed to update the follow graph of user {follower_id} and users {followed_ids}: {e}")
+            try:
+                self.redis_client.delete(key)
+            except RedisError:
+                pass
+
+    @staticmethod
+    def __query(user_id: int) -> set[int]:
+        return set(Follow.objects.filter(follower_id=user_id).values_list("followed_id", flat=True))
+
+    def __load(self, user_id: int) -> set[int]:
+        key = self.get_following_key(user_id)
+        with self.redis_client.pipeline() as pipeline:
+            # A follow or unfollow between the query and the write bumps the version and the set is not stored
+            pipeline.watch(self.__get_version_key(key))
+            user_ids = self.__query(user_id)
+
+            pipeline.multi()
+            pipeline.delete(key)
+            pipeline.sadd(key, self.COMPLETE_MARKER, *user_ids)
+            pipeline.expire(key, FOLLOW_GRAPH_TTL)
+            try:
+                pipeline.execute()
+            except WatchError:
+                logging.info(f"Follow graph set {key} changed while loading, it is loaded on next use.")
+
+        return user_ids
+
+    @staticmethod
+    def __get_version_key(key: str) -> str:
+        return f"{key}:version"
@@ -1,11 +1,28 @@
 import logging
 
+from django.db import connection, transaction
+from django.utils import timezone
 from rest_framework.exceptions import ValidationError
 
 from accounts.models import User
 from accounts.services.token_service import TokenService
 from accounts.services.user_service import UserService
 from followers.models import Follow
+from followers.services.follow_count_service import FollowCountService
+from followers.services.follow_graph_service import FollowGraphService
+from followers.services.user_filter_service import UserFilterService
+from followers.settings.follow_settings import FOLLOW_BULK_MAX_TARGETS
+from timelines.services.home_timeline_service import HomeTimelineService
+
+# Inserts the follows that do not exist yet and returns the users actually followed. A follow created concurrently
+# is a conflict and is not returned, so it is counted by the call that created it.
+FOLLOW_USERS_SQL = f"""
+    INSERT INTO {Follow._meta.db_table} (follower_id, followed_id, "timestamp", is_muted, is_blocked)
+    SELECT %(follower_id)s, followed_id, %(timestamp)s, false, false
+    FROM unnest(%(followed_ids)s::bigint[]) AS followed_id
+    ON CONFLICT (follower_id, followed_id) DO NOTHING
+    RETURNING followed_id
+"""
 
 
 class FollowService:
@@ -27,11 +44,16 @@ class FollowService:
             logging.warning(f"User {follower.username} attempted to follow themselves.")
             raise ValidationError({"error": "You cannot follow yourself."})
 
-        # Attempt to create the follow relationship
-        _, created = Follow.objects.get_or_create(follower=follower, followed=followed)
+        # Attempt to create the follow relationship, a concurrent duplicate is caught by the unique constraint
+        with transaction.atomic():
+            _, created = Follow.objects.get_or_create(follower=follower, followed=followed)
+            if created:
+                FollowCountService().add_follow(follower.id, followed.id)
 
         if created:
             logging.info(f"User {follower.username} successfully followed {followed.username}.")
+            FollowGraphService().add_follow(follower.id, followed.id)
+            HomeTimelineService().add_author(follower.id, followed.id)
         else:
             logging.info(f"User {follower.username} is already following {followed.username}.")
             raise ValidationError({"error": f"User {follower.username} is already following {followed.username}."})
@@ -51,16 +73,117 @@ class FollowService:
             raise ValidationError({"error": "You cannot unfollow yourself."})
 
         # Attempt to delete the follow relationship
-        deleted_count, _ = Follow.objects.filter(follower=follower, followed=followed).delete()
+        with transaction.atomic():
+            deleted_count, _ = Follow.objects.filter(follower=follower, followed=followed).delete()
+            if deleted_count > 0:
+                FollowCountService().remove_follow(follower.id, followed.id)
 
         if deleted_count > 0:
             logging.info(f"User {follower.username} successfully unfollowed {followed.username}.")
+            FollowGraphService().remove_follow(follower.id, followed.id)
+            HomeTimelineService().remove_author(follower.id, followed.id)
+            # A block or mute is stored on the follow and goes with it
+            UserFilterService().invalidate([follower.id, followed.id])
             return True
         else:
             logging.warning(
                 f"User {follower.username} attempted to unfollow {followed.username}, but no follow relationship existed.")
             raise ValidationError({"error": f"You are not following {followed.username}."})
 
+    @staticmethod
+    def follow_users(follower: User, cognito_ids: list[str]) -> dict[str, str]:
+        """
+        Creates the follow relationships of a user with many users at once.
+
+        The targets are resolved with one query and the follows inserted with one INSERT that skips the existing
+        ones and returns the created ones, the follow counts of all users are updated with one UPDATE.
+
+        :param follower: The user who is following.
+        :param cognito_ids: IDs of the users to follow, at most FOLLOW_BULK_MAX_TARGETS.
+        :return: Result per ID, one of 'followed', 'already_following', 'not_found' or 'self'.
+        :raises ValidationError: If too many users are given.
+        """
+        results, targets = FollowService.__resolve_targets(follower, cognito_ids)
+        if targets:
+            with transaction.atomic():
+                with connection.cursor() as cursor:
+                    cursor.execute(FOLLOW_USERS_SQL, {
+                        "follower_id": follower.id,
+                        "followed_ids": list(targets.values()),
+                        "timestamp": timezone.now(),
+                    })
+                    created_ids = [followed_id for followed_id, in cursor.fetchall()]
+                FollowCountService().add_follows({(follower.id, user_id): 1 for user_id in created_ids})
+
+            followed_ids = set(created_ids)
+            for cognito_id, user_id in targets.items():
+                results[cognito_id] = "followed" if user_id in followed_ids else "already_following"
+
+            FollowGraphService().add_follows(follower.id, created_ids)
+            HomeTimelineService().add_authors(follower.id, created_ids)
+            logging.info(f"User {follower.username} followed {len(created_ids)} users.")
+
+        return results
+
+    @staticmethod
+    def unfollow_users(follower: User, cognito_ids: list[str]) -> dict[str, str]:
+        """
+        Deletes the follow relationships of a user with many users at once, with a single DELETE.
+
+        :param follower: The user who is unfollowing.
+        :param cognito_ids: IDs of the users to unfollow, at most FOLLOW_BULK_MAX_TARGETS.
+        :return: Result per ID, one of 'unfollowed', 'not_following', 'not_found' or 'self'.
+        :raises ValidationError: If too many users are given.
+        """
+        results, targets = FollowService.__resolve_targets(follower, cognito_ids)
+        if targets:
+            with transaction.atomic():
+                # Locking the follows makes the deleted ones, and so the counts, exact under concurrent unfollows
+                follows = dict(
+                    Follow.objects.select_for_update()
+                    .filter(follower=follower, followed_id__in=targets.values())
+                    .values_list("followed_id", "id")
+                )
+                Follow.objects.filter(id__in=follows.values()).delete()
+                FollowCountService().add_follows({(follower.id, user_id): -1 for user_id in follows})
+
+            for cognito_id, user_id in targets.items():
+                results[cognito_id] = "unfollowed" if user_id in follows else "not_following"
+
+            deleted_ids = list(follows)
+            FollowGraphService().remove_follows(follower.id, deleted_ids)
+            HomeTimelineService().remove_authors(follower.id, deleted_ids)
+            if deleted_ids:
+                UserFilterService().invalidate([follower.id, *deleted_ids])
+            logging.info(f"User {follower.username} unfollowed {len(deleted_ids)} users.")
+
+        return results
+
+    @staticmethod
+    def __resolve_targets(follower: User, cognito_ids: list[str]) -> tuple[dict[str, str], dict[str, int]]:
+        """
+        Resolves the users of a bulk request with a single query.
+        :return: Results of the IDs that cannot be followed, and user ID per resolved Cognito ID.
+        """
+        cognito_ids = list(dict.fromkeys(cognito_ids))
+        if len(cognito_ids) > FOLLOW_BULK_MAX_TARGETS:
+            raise ValidationError({"error": f"At most {FOLLOW_BULK_MAX_TARGETS} users can be given at once."})
+
+        user_ids = dict(User.objects.filter(cognito_id__in=cognito_ids).values_list("cognito_id", "id"))
+
+        # Results are filled in the order of the request
+        results = dict.fromkeys(cognito_ids)
+        targets = {}
+        for cognito_id in cognito_ids:
+            if cognito_id == follower.cognito_id:
+                results[cognito_id] = "self"
+            elif cognito_id not in user_ids:
+                results[cognito_id] = "not_found"
+            else:
+                targets[cognito_id] = user_ids[cognito_id]
+
+        return results, targets
+
     @staticmethod
     def update_follow_properties(follower: User, followed: User, is_muted=None, is_blocked=None):
         """
@@ -87,6 +210,7 @@ class FollowService:
 
         if updated:
             follow.save()
+            UserFilterService().invalidate([follower.id, followed.id])
             logging.info(
                 f"Updated follow relationship: follower={follower.username}, followed={followed.username}, "
                 f"is_muted={follow.is_muted}, is_blocked={follow.is_blocked}."
@@ -0,0 +1,212 @@
+import logging
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import numpy as np
+from django.utils import timezone
+from scipy import sparse
+
+from accounts.models import User
+from followers.models import Follow, FollowSuggestion
+from followers.services.follow_graph_service import FollowGraphService
+from followers.settings.follow_settings import (
+    FOLLOW_SUGGESTIONS_BLOCK_SIZE,
+    FOLLOW_SUGGESTIONS_EDGE_CHUNK_SIZE,
+    FOLLOW_SUGGESTIONS_MAX_PER_USER,
+    FOLLOW_SUGGESTIONS_PAGE_SIZE,
+)
+
+# Matrices of the follow graph in the worker processes, set once per process so blocks do not carry them
+_worker_graph = None
+
+
+def _init_worker(graph: "FollowGraphMatrices") -> None:
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _compute_block(user_ids: np.ndarray) -> list[tuple[int, list[int], list[int]]]:
+    return _worker_graph.get_suggestions(user_ids)
+
+
+class FollowGraphMatrices:
+    """
+    Sparse adjacency matrices of the follow graph, rows are followers and columns followed users, indexed by ID.
+    """
+
+    def __init__(self, paths: sparse.csr_matrix, follows: sparse.csr_matrix, blocked_by: sparse.csr_matrix,
+                 max_per_user: int):
+        self.paths = paths
+        self.follows = follows
+        self.blocked_by = blocked_by
+        self.max_per_user = max_per_user
+
+    def get_suggestions(self, user_ids: np.ndarray) -> list[tuple[int, list[int], list[int]]]:
+        """
+        Computes the suggestions of a block of users.
+
+        :param user_ids: IDs of the users.
+        :return: User ID, suggested user IDs and their mutual follow counts, best first, per user.
+        """
+        # Entry (u, c) of the product counts the users followed by u who follow c
+        candidates = self.paths[user_ids] @ self.paths
+
+        suggestions = []
+        for index, user_id in enumerate(user_ids):
+            start, end = candidates.indptr[index], candidates.indptr[index + 1]
+            candidate_ids = candidates.indices[start:end]
+            mutual_counts = candidates.data[start:end]
+
+            excluded_ids = np.concatenate((
+                self.follows.indices[self.follows.indptr[user_id]:self.follows.indptr[user_id + 1]],
+                self.blocked_by.indices[self.blocked_by.indptr[user_id]:self.blocked_by.indptr[user_id + 1]],
+                [user_id],
+            ))
+            kept = ~np.isin(candidate_ids, excluded_ids)
+            candidate_ids, mutual_counts = candidate_ids[kept], mutual_counts[kept]
+
+            if len(candidate_ids) > self.max_per_user:
+                top = np.argpartition(-mutual_counts, self.max_per_user - 1)[:self.max_per_user]
+                candidate_ids, mutual_counts = candidate_ids[top], mutual_counts[top]
+
+            # Most mutual follows first, ties broken by the older account
+            order = np.lexsort((candidate_ids, -mutual_counts))
+            suggestions.append((int(user_id), candidate_ids[order].tolist(), mutual_counts[order].tolist()))
+
+        return suggestions
+
+
+class FollowSuggestionService:
+    """
+    Suggests users to follow, the users followed by the most users someone follows.
+
+    The suggestions are computed offline from sparse matrices of the whole follow graph, two hops are a sparse
+    matrix product computed for a block of users at a time. Follows that are muted or blocked do not lead to
+    suggestions, and followed users and users who blocked the user are never suggested.
+    """
+
+    def compute(self, block_size: int = FOLLOW_SUGGESTIONS_BLOCK_SIZE, workers: int = 1,
+                max_per_user: int = FOLLOW_SUGGESTIONS_MAX_PER_USER) -> int:
+        """
+        Computes and stores the suggestions of all users who follow someone. Suggestions of other users are deleted.
+
+        :param block_size: Number of users whose suggestions are computed per matrix product.
+        :param workers: Number of processes computing the blocks, 1 computes them in this process.
+        :param max_per_user: Number of suggestions stored per user.
+        :return: Number of users with suggestions.
+        """
+        started_at = timezone.now()
+        graph = self.load_graph(max_per_user)
+
+        user_ids = np.flatnonzero(np.diff(graph.paths.indptr))
+        blocks = [user_ids[start:start + block_size] for start in range(0, len(user_ids), block_size)]
+        logging.info(f"Computing follow suggestions of {len(user_ids)} users in {len(blocks)} blocks.")
+
+        count = 0
+        if workers > 1:
+            # Forked workers inherit the matrices instead of receiving a pickled copy of them
+            with ProcessPoolExecutor(workers, mp_context=get_context("fork"), initializer=_init_worker,
+                                     initargs=(graph,)) as executor:
+                for suggestions in executor.map(_compute_block, blocks):
+                    count += self.__store(suggestions, started_at)
+        else:
+            for block in blocks:
+                count += self.__store(graph.get_suggestions(block), started_at)
+
+        FollowSuggestion.objects.filter(computed_at__lt=started_at).delete()
+        logging.info(f"Stored the follow suggestions of {count} users.")
+
+        return count
+
+    @staticmethod
+    def load_graph(max_per_user: int = FOLLOW_SUGGESTIONS_MAX_PER_USER) -> FollowGraphMatrices:
+        """
+        Streams the follows from the database into sparse matrices.
+
+        The follows are read with a server-side cursor into typed arrays, so the memory used is a few bytes per
+        follow rather than a Python object per row.
+
+        :param max_per_user: Number of suggestions computed per user.
+        :return: Matrices of the follow graph.
+        """
+        followers, followed, paths = array("q"), array("q"), array("b")
+        blocked_followers, blocked_followed = array("q"), array("q")
+
+        follows = Follow.objects.values_list("follower_id", "followed_id", "is_muted", "is_blocked")
+        for follower_id, followed_id, is_muted, is_blocked in follows.iterator(
+                chunk_size=FOLLOW_SUGGESTIONS_EDGE_CHUNK_SIZE
+        ):
+            followers.append(follower_id)
+            followed.append(followed_id)
+            paths.append(not (is_muted or is_blocked))
+            if is_blocked:
+                blocked_followers.append(follower_id)
+                blocked_followed.append(followed_id)
+
+        followers = np.frombuffer(followers, dtype=np.int64)
+        followed = np.frombuffer(followed, dtype=np.int64)
+        paths = np.frombuffer(paths, dtype=np.int8).astype(bool)
+        size = int(max(followers.max(initial=0), followed.max(initial=0))) + 1
+
+        def to_matrix(rows, columns):
+            return sparse.csr_matrix((np.ones(len(rows), dtype=np.int32), (rows, columns)), shape=(size, size))
+
+        return FollowGraphMatrices(
+            paths=to_matrix(followers[paths], followed[paths]),
+            follows=to_matrix(followers, followed),
+            # Row u holds the users who blocked u
+            blocked_by=to_matrix(
+                np.frombuffer(blocked_followed, dtype=np.int64), np.frombuffer(blocked_followers, dtype=np.int64)
+            ),
+            max_per_user=max_per_user,
+        )
+
+    @staticmethod
+    def get_suggestions(user: User, limit: int = FOLLOW_SUGGESTIONS_PAGE_SIZE) -> list[tuple[User, int]]:
+        """
+        Returns the precomputed suggestions of a user.
+
+        :param user: The user.
+        :param limit: Maximum number of suggestions.
+        :return: Suggested users with their number of mutual follows, best first.
+        """
+        suggestion = (
+            FollowSuggestion.objects.filter(user=user).values_list("suggested_ids", "mutual_counts").first()
+        )
+        if suggestion is None:
+            return []
+
+        # Users followed since the suggestions were computed are left out
+        suggested_ids, mutual_counts = suggestion
+        followed_ids = FollowGraphService().filter_following(user.id, suggested_ids)
+        suggestions = [
+            (suggested_id, mutual_count)
+            for suggested_id, mutual_count in zip(suggested_ids, mutual_counts)
+            if suggested_id not in followed_ids
+        ][:limit]
+
+        users = User.objects.in_bulk([suggested_id for suggested_id, _ in suggestions])
+        return [
+            (users[suggested_id], mutual_count)
+            for suggested_id, mutual_count in suggestions
+            if suggested_id in users
+        ]
+
+    @staticmethod
+    def __store(suggestions: list[tuple[int, list[int], list[int]]], computed_at) -> int:
+        rows = [
+            FollowSuggestion(
+                user_id=user_id, suggested_ids=suggested_ids, mutual_counts=mutual_counts, computed_at=computed_at
+            )
+            for user_id, suggested_ids, mutual_counts in suggestions
+            if suggested_ids
+        ]
+        FollowSuggestion.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["user"],
+            update_fields=["suggested_ids", "mutual_counts", "computed_at"],
+        )
+
+        return len(rows)
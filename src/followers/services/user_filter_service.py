@@ -0,0 +1,146 @@
+import logging
+
+from django.db.models import Q
+from redis.exceptions import RedisError, WatchError
+
+from followers.models import Follow
+from followers.settings.follow_settings import USER_FILTER_KEY_PREFIX, USER_FILTER_TTL
+from utils.redis_client import get_redis_client
+
+
+class UserFilter:
+    """
+    Users whose content is hidden from a viewer: the users the viewer blocked or muted, and the users who blocked
+    the viewer. Every check is a set lookup, so read paths apply it to each item in memory.
+    """
+
+    def __init__(self, blocked_ids: set[int], muted_ids: set[int], blocked_by_ids: set[int]):
+        self.blocked_ids = blocked_ids
+        self.muted_ids = muted_ids
+        self.blocked_by_ids = blocked_by_ids
+        self.hidden_ids = blocked_ids | muted_ids | blocked_by_ids
+
+    def is_hidden(self, user_id: int) -> bool:
+        """
+        :return: True if the content of the user is hidden from the viewer.
+        """
+        return user_id in self.hidden_ids
+
+    def is_blocked_by(self, user_id: int) -> bool:
+        """
+        :return: True if the user blocked the viewer.
+        """
+        return user_id in self.blocked_by_ids
+
+    def filter_posts(self, posts: list) -> list:
+        """
+        :return: The posts whose authors are not hidden from the viewer, in the same order.
+        """
+        if not self.hidden_ids:
+            return posts
+
+        return [post for post in posts if post.user_id not in self.hidden_ids]
+
+
+class UserFilterService:
+    """
+    Caches the blocked and muted users of every user in Redis sets.
+
+    The three sets of a user are loaded together with one query served by the partial indexes on the blocked and
+    muted follows, and hold a marker member once loaded. A block or mute drops the sets of both users.
+    """
+    COMPLETE_MARKER = b"complete"
+    SETS = ("blocked", "muted", "blocked_by")
+
+    def __init__(self):
+        self.redis_client = get_redis_client()
+
+    def get_filter(self, user_id: int) -> UserFilter:
+        """
+        Returns the users hidden from a user.
+
+        :param user_id: ID of the viewing user.
+        :return: Filter of the hidden users.
+        """
+        keys = [self.get_key(user_id, name) for name in self.SETS]
+        try:
+            pipeline = self.redis_client.pipeline(transaction=False)
+            for key in keys:
+                pipeline.smembers(key)
+            members = pipeline.execute()
+
+            if all(self.COMPLETE_MARKER in set_members for set_members in members):
+                return UserFilter(*[
+                    {int(member) for member in set_members if member != self.COMPLETE_MARKER}
+                    for set_members in members
+                ])
+
+            return self.__load(user_id)
+        except RedisError as e:
+            logging.error(f"Failed to read the blocked and muted users of user {user_id}, querying the database: {e}")
+            return self.__query(user_id)
+
+    def invalidate(self, user_ids: list[int]) -> None:
+        """
+        Drops the cached sets of users whose blocks or mutes changed, they are loaded again on next use.
+
+        :param user_ids: IDs of the users.
+        """
+        try:
+            pipeline = self.redis_client.pipeline(transaction=False)
+            for user_id in user_ids:
+                pipeline.delete(*[self.get_key(user_id, name) for name in self.SETS])
+                # Bumping the version stops a load that read the database before the change from storing it
+                pipeline.incr(self.__get_version_key(user_id))
+                pipeline.expire(self.__get_version_key(user_id), USER_FILTER_TTL)
+            pipeline.execute()
+        except RedisError as e:
+            logging.error(f"Failed to invalidate the blocked and muted users of users {user_ids}: {e}")
+
+    @staticmethod
+    def get_key(user_id: int, name: str) -> str:
+        return f"{USER_FILTER_KEY_PREFIX}:{name}:{user_id}"
+
+    @staticmethod
+    def __query(user_id: int) -> UserFilter:
+        follows = Follow.objects.filter(
+            Q(follower_id=user_id, is_blocked=True)
+            | Q(follower_id=user_id, is_muted=True)
+            | Q(followed_id=user_id, is_blocked=True)
+        ).values_list("follower_id", "followed_id", "is_blocked", "is_muted")
+
+        blocked_ids, muted_ids, blocked_by_ids = set(), set(), set()
+        for follower_id, followed_id, is_blocked, is_muted in follows:
+            if follower_id == user_id:
+                if is_blocked:
+                    blocked_ids.add(followed_id)
+                if is_muted:
+                    muted_ids.add(followed_id)
+            else:
+                blocked_by_ids.add(follower_id)
+
+        return UserFilter(blocked_ids, muted_ids, blocked_by_ids)
+
+    def __load(self, user_id: int) -> UserFilter:
+        with self.redis_client.pipeline() as pipeline:
+            pipeline.watch(self.__get_version_key(user_id))
+            user_filter = self.__query(user_id)
+
+            pipeline.multi()
+            for name, user_ids in zip(self.SETS, (
+                    user_filter.blocked_ids, user_filter.muted_ids, user_filter.blocked_by_ids
+            )):
+                key = self.get_key(user_id, name)
+                pipeline.delete(key)
+                pipeline.sadd(key, self.COMPLETE_MARKER, *user_ids)
+                pipeline.expire(key, USER_FILTER_TTL)
+            try:
+                pipeline.execute()
+            except WatchError:
+                logging.info(f"Blocked and muted users of user {user_id} changed while loading.")
+
+        return user_filter
+
+    @staticmethod
+    def __get_version_key(user_id: int) -> str:
+        return f"{USER_FILTER_KEY_PREFIX}:{user_id}:version"
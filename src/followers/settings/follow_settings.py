@@ -0,0 +1,20 @@
+# Follow graph cached in Redis sets, the database stays the source of truth
+FOLLOW_GRAPH_KEY_PREFIX = "follow_graph"
+FOLLOW_GRAPH_TTL = 24 * 3600  # Seconds a set is kept without being changed or loaded
+
+# Follow counts of the users, mirrored in Redis hashes for the reads
+FOLLOW_COUNT_KEY_PREFIX = "follow_counts"
+FOLLOW_COUNT_TTL = 24 * 3600  # Seconds a mirrored count is kept without being changed or loaded
+FOLLOW_COUNT_RECOMPUTE_BATCH_SIZE = 1000  # Users recounted per query
+
+# Follow suggestions, users followed by the users someone follows, computed offline
+FOLLOW_SUGGESTIONS_MAX_PER_USER = 50
+FOLLOW_SUGGESTIONS_EDGE_CHUNK_SIZE = 100000  # Follows fetched per round trip of the server-side cursor
+FOLLOW_SUGGESTIONS_BLOCK_SIZE = 5000  # Users whose two-hop candidates are computed per matrix product
+FOLLOW_SUGGESTIONS_PAGE_SIZE = 20
+
+FOLLOW_BULK_MAX_TARGETS = 500  # Users followed or unfollowed per bulk request
+
+# Blocked and muted users of every user, cached in Redis sets for the filtering of the read paths
+USER_FILTER_KEY_PREFIX = "user_filter"
+USER_FILTER_TTL = 24 * 3600  # Seconds a set is kept without being loaded
@@ -0,0 +1,22 @@
+import pytest
+
+from accounts.models import User
+
+
+@pytest.fixture
+def create_users():
+    """
+    Creates users named user0, user1, ... for the follow tests.
+    """
+    def create(count: int) -> list[User]:
+        return [
+            User.objects.create(username=f"user{index}", email=f"user{index}@email.com", cognito_id=f"user{index}")
+            for index in range(count)
+        ]
+
+    return create
+
+
+@pytest.fixture
+def users(create_users):
+    return create_users(6)
@@ -0,0 +1,88 @@
+import pytest
+
+from followers.models import Follow, FollowCount
+from followers.services.follow_count_service import FollowCountService
+from followers.services.follow_service import FollowService
+
+
+@pytest.mark.django_db
+def test_follow_and_unfollow_should_update_counts(redis_client, users):
+    # Assign
+    FollowService.follow_user(users[0], users[2])
+    FollowService.follow_user(users[1], users[2])
+    FollowService.follow_user(users[2], users[0])
+
+    # Act
+    FollowService.unfollow_user(users[1], users[2])
+
+    # Assert
+    assert FollowCount.objects.get(user=users[2]).follower_count == 1
+    assert FollowCount.objects.get(user=users[2]).following_count == 1
+    assert FollowCount.objects.get(user=users[1]).following_count == 0
+
+
+@pytest.mark.django_db
+def test_get_counts_after_follow_should_load_mirror_once(
+        redis_client, users, django_assert_num_queries, django_capture_on_commit_callbacks
+):
+    # Assign
+    count_service = FollowCountService()
+    FollowService.follow_user(users[0], users[1])
+    assert count_service.get_counts(users[1].id) == (1, 0)
+
+    # Act
+    with django_capture_on_commit_callbacks(execute=True):
+        FollowService.follow_user(users[2], users[1])
+    with django_assert_num_queries(1):
+        counts = count_service.get_counts(users[1].id)
+        count_service.get_counts(users[1].id)
+
+    # Assert
+    assert counts == (2, 0)
+
+
+@pytest.mark.django_db
+def test_get_counts_loaded_between_commit_and_callback_should_not_count_follow_twice(
+        redis_client, users, django_capture_on_commit_callbacks
+):
+    # Assign
+    count_service = FollowCountService()
+    with django_capture_on_commit_callbacks() as callbacks:
+        FollowService.follow_user(users[0], users[1])
+    assert count_service.get_counts(users[1].id) == (1, 0)
+
+    # Act
+    for callback in callbacks:
+        callback()
+    counts = count_service.get_counts(users[1].id)
+
+    # Assert
+    assert counts == (1, 0)
+
+
+@pytest.mark.django_db
+def test_get_counts_without_follows_should_return_zero(redis_client, users):
+    # Act
+    counts = FollowCountService().get_counts(users[0].id)
+
+    # Assert
+    assert counts == (0, 0)
+
+
+@pytest.mark.django_db
+def test_recompute_should_correct_drifted_counts(redis_client, users):
+    # Assign
+    count_service = FollowCountService()
+    FollowService.follow_user(users[0], users[1])
+    Follow.objects.create(follower=users[2], followed=users[1])
+    FollowCount.objects.filter(user=users[0]).update(following_count=5)
+    assert count_service.get_counts(users[1].id) == (1, 0)
+
+    # Act
+    corrected = count_service.recompute(batch_size=2)
+
+    # Assert
+    assert corrected == 3
+    assert count_service.get_counts(users[0].id) == (0, 1)
+    assert count_service.get_counts(users[1].id) == (2, 0)
+    assert count_service.get_counts(users[2].id) == (0, 1)
@@ -0,0 +1,133 @@
+from unittest.mock import patch
+
+import pytest
+from django.db import IntegrityError, transaction
+from redis.exceptions import RedisError
+
+from followers.models import Follow
+from followers.services.follow_graph_service import FollowGraphService
+from followers.services.follow_service import FollowService
+
+
+@pytest.mark.django_db
+def test_follow_after_load_should_update_cached_sets(redis_client, users):
+    # Assign
+    graph_service = FollowGraphService()
+    graph_service.get_following_ids(users[0].id)
+
+    # Act
+    FollowService.follow_user(users[0], users[1])
+
+    # Assert
+    assert graph_service.is_following(users[0].id, users[1].id)
+    assert graph_service.get_following_ids(users[0].id) == {users[1].id}
+
+
+@pytest.mark.django_db
+def test_unfollow_should_update_cached_sets(redis_client, users):
+    # Assign
+    FollowService.follow_user(users[0], users[1])
+    graph_service = FollowGraphService()
+    assert graph_service.is_following(users[0].id, users[1].id)
+
+    # Act
+    FollowService.unfollow_user(users[0], users[1])
+
+    # Assert
+    assert not graph_service.is_following(users[0].id, users[1].id)
+    assert graph_service.get_following_ids(users[0].id) == set()
+
+
+@pytest.mark.django_db
+def test_is_following_should_load_set_once(redis_client, users, django_assert_num_queries):
+    # Assign
+    Follow.objects.create(follower=users[0], followed=users[1])
+    graph_service = FollowGraphService()
+
+    # Act & Assert
+    with django_assert_num_queries(1):
+        assert graph_service.is_following(users[0].id, users[1].id)
+        assert not graph_service.is_following(users[0].id, users[2].id)
+        assert graph_service.filter_following(users[0].id, [users[1].id, users[2].id]) == {users[1].id}
+
+
+@pytest.mark.django_db
+def test_load_racing_with_follow_should_not_store_stale_set(redis_client, users):
+    # Assign
+    graph_service = FollowGraphService()
+    values_list = Follow.objects.filter(follower_id=users[0].id).values_list("followed_id", flat=True)
+
+    def follow_during_load(*args, **kwargs):
+        result = list(values_list)
+        FollowService.follow_user(users[0], users[1])
+        return result
+
+    # Act
+    with patch("followers.services.follow_graph_service.Follow.objects.filter") as filter_mock:
+        filter_mock.return_value.values_list.side_effect = follow_during_load
+        loaded = graph_service.get_following_ids(users[0].id)
+
+    # Assert
+    assert loaded == set()
+    assert graph_service.get_following_ids(users[0].id) == {users[1].id}
+
+
+@pytest.mark.django_db
+def test_get_common_following_ids_should_intersect_sets(redis_client, users):
+    # Assign
+    for follower, followed in [(0, 2), (0, 3), (1, 2), (1, 0)]:
+        FollowService.follow_user(users[follower], users[followed])
+
+    # Act
+    common = FollowGraphService().get_common_following_ids(users[0].id, users[1].id)
+
+    # Assert
+    assert common == {users[2].id}
+
+
+@pytest.mark.django_db
+def test_get_common_following_ids_with_set_changed_while_loading_should_intersect_loaded_sets(redis_client, users):
+    # Assign
+    FollowService.follow_user(users[0], users[2])
+    FollowService.follow_user(users[1], users[2])
+    graph_service = FollowGraphService()
+    graph_service.get_following_ids(users[1].id)
+    values_list = Follow.objects.filter(follower_id=users[0].id).values_list("followed_id", flat=True)
+
+    def follow_during_load(*args, **kwargs):
+        result = list(values_list)
+        FollowService.follow_user(users[0], users[3])
+        return result
+
+    # Act
+    with patch("followers.services.follow_graph_service.Follow.objects.filter") as filter_mock:
+        filter_mock.return_value.values_list.side_effect = follow_during_load
+        common = graph_service.get_common_following_ids(users[0].id, users[1].id)
+
+    # Assert
+    assert common == {users[2].id}
+    assert not redis_client.exists(graph_service.get_following_key(users[0].id))
+
+
+@pytest.mark.django_db
+def test_is_following_with_redis_unavailable_should_query_database(users):
+    # Assign
+    Follow.objects.create(follower=users[0], followed=users[1])
+    graph_service = FollowGraphService()
+
+    # Act
+    with patch.object(graph_service.redis_client, "smismember", side_effect=RedisError):
+        following = graph_service.is_following(users[0].id, users[1].id)
+
+    # Assert
+    assert following
+
+
+@pytest.mark.django_db
+def test_duplicate_follow_should_violate_unique_constraint(users):
+    # Assign
+    Follow.objects.create(follower=users[0], followed=users[1])
+
+    # Act & Assert
+    with pytest.raises(IntegrityError), transaction.atomic():
+        Follow.objects.create(follower=users[0], followed=users[1])
@@ -1,7 +1,10 @@
+import threading
+
 import pytest
+from django.db import connection
 from rest_framework.exceptions import ValidationError
 from accounts.models import User
-from followers.models import Follow
+from followers.models import Follow, FollowCount
 from followers.services import follow_service
 from followers.services.follow_service import FollowService
 
@@ -126,3 +129,107 @@ def test_update_follow_properties_follow_relationship_does_not_exist_should_rais
     with pytest.raises(ValidationError):
         follow_service.update_follow_properties(follower, followed, is_muted=True)
 
+
+
+@pytest.fixture
+def targets():
+    return User.objects.bulk_create(
+        [User(username=f"target{index}", email=f"target{index}@email.com", cognito_id=f"target{index}")
+         for index in range(200)]
+    )
+
+
+@pytest.mark.django_db
+def test_follow_users_should_return_result_per_target(redis_client):
+    # Assign
+    follower = User.objects.create(username="follower", cognito_id="follower123")
+    followed = User.objects.create(username="followed", email="followed@email.com", cognito_id="followed123")
+    other = User.objects.create(username="other", email="other@email.com", cognito_id="other123")
+    Follow.objects.create(follower=follower, followed=followed)
+
+    # Act
+    results = FollowService.follow_users(follower, ["other123", "followed123", "missing", "follower123", "other123"])
+
+    # Assert
+    assert results == {
+        "other123": "followed",
+        "followed123": "already_following",
+        "missing": "not_found",
+        "follower123": "self",
+    }
+    assert Follow.objects.filter(follower=follower, followed=other).exists()
+    assert FollowCount.objects.get(user=follower).following_count == 1
+
+
+@pytest.mark.django_db
+def test_follow_users_with_many_targets_should_use_constant_queries(
+        redis_client, targets, django_assert_max_num_queries
+):
+    # Assign
+    follower = User.objects.create(username="follower", cognito_id="follower123")
+
+    # Act
+    with django_assert_max_num_queries(10):
+        results = FollowService.follow_users(follower, [target.cognito_id for target in targets])
+
+    # Assert
+    assert set(results.values()) == {"followed"}
+    assert Follow.objects.filter(follower=follower).count() == 200
+    assert FollowCount.objects.get(user=follower).following_count == 200
+    assert FollowCount.objects.get(user=targets[0]).follower_count == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_follow_users_with_concurrent_calls_should_count_each_follow_once(redis_client, targets):
+    # Assign
+    follower = User.objects.create(username="follower", cognito_id="follower123")
+    cognito_ids = [target.cognito_id for target in targets[:20]]
+    barrier = threading.Barrier(4)
+    results = []
+
+    def follow():
+        try:
+            barrier.wait()
+            results.append(FollowService.follow_users(follower, cognito_ids))
+        finally:
+            connection.close()
+
+    # Act
+    threads = [threading.Thread(target=follow) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    assert sum(list(result.values()).count("followed") for result in results) == 20
+    assert Follow.objects.filter(follower=follower).count() == 20
+    assert FollowCount.objects.get(user=follower).following_count == 20
+    assert set(FollowCount.objects.filter(user__in=targets[:20]).values_list("follower_count", flat=True)) == {1}
+
+
+@pytest.mark.django_db
+def test_unfollow_users_should_delete_follows_in_bulk(redis_client, targets, django_assert_max_num_queries):
+    # Assign
+    follower = User.objects.create(username="follower", cognito_id="follower123")
+    FollowService.follow_users(follower, [target.cognito_id for target in targets[:150]])
+
+    # Act
+    with django_assert_max_num_queries(10):
+        results = FollowService.unfollow_users(follower, [target.cognito_id for target in targets])
+
+    # Assert
+    assert list(results.values()).count("unfollowed") == 150
+    assert list(results.values()).count("not_following") == 50
+    assert not Follow.objects.filter(follower=follower).exists()
+    assert FollowCount.objects.get(user=follower).following_count == 0
+
+
+@pytest.mark.django_db
+def test_follow_users_with_too_many_targets_should_raise_error():
+    # Assign
+    follower = User.objects.create(username="follower", cognito_id="follower123")
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        FollowService.follow_users(follower, [f"user{index}" for index in range(501)])
@@ -0,0 +1,91 @@
+import pytest
+
+from followers.models import Follow, FollowSuggestion
+from followers.services.follow_suggestion_service import FollowSuggestionService
+
+
+def follow(users, edges, **properties):
+    for follower, followed in edges:
+        Follow.objects.create(follower=users[follower], followed=users[followed], **properties)
+
+
+@pytest.mark.django_db
+def test_compute_should_rank_by_mutual_follows(users):
+    # Assign
+    follow(users, [(0, 1), (0, 2), (1, 3), (2, 3), (1, 4), (2, 0)])
+
+    # Act
+    FollowSuggestionService().compute()
+
+    # Assert
+    suggestion = FollowSuggestion.objects.get(user=users[0])
+    assert suggestion.suggested_ids == [users[3].id, users[4].id]
+    assert suggestion.mutual_counts == [2, 1]
+
+
+@pytest.mark.django_db
+def test_compute_should_exclude_followed_and_blocking_users(users):
+    # Assign
+    follow(users, [(0, 1), (1, 2), (1, 3), (1, 4), (0, 2)])
+    follow(users, [(3, 0)], is_blocked=True)
+
+    # Act
+    FollowSuggestionService().compute()
+
+    # Assert
+    assert FollowSuggestion.objects.get(user=users[0]).suggested_ids == [users[4].id]
+
+
+@pytest.mark.django_db
+def test_compute_should_not_suggest_through_muted_follows(users):
+    # Assign
+    follow(users, [(1, 2)])
+    follow(users, [(0, 1)], is_muted=True)
+
+    # Act
+    FollowSuggestionService().compute()
+
+    # Assert
+    assert not FollowSuggestion.objects.filter(user=users[0]).exists()
+
+
+@pytest.mark.django_db
+def test_compute_with_blocks_and_limit_should_keep_top_suggestions(users):
+    # Assign
+    follow(users, [(0, 1), (0, 2), (1, 3), (1, 4), (1, 5), (2, 5), (3, 0), (3, 1)])
+
+    # Act
+    count = FollowSuggestionService().compute(block_size=1, max_per_user=1)
+
+    # Assert
+    assert count == 3
+    assert FollowSuggestion.objects.get(user=users[0]).suggested_ids == [users[5].id]
+
+
+@pytest.mark.django_db
+def test_compute_should_delete_outdated_suggestions(users):
+    # Assign
+    follow(users, [(0, 1), (1, 2)])
+    suggestion_service = FollowSuggestionService()
+    suggestion_service.compute()
+    Follow.objects.filter(follower=users[1]).delete()
+
+    # Act
+    suggestion_service.compute()
+
+    # Assert
+    assert not FollowSuggestion.objects.exists()
+
+
+@pytest.mark.django_db
+def test_get_suggestions_should_leave_out_users_followed_since(redis_client, users):
+    # Assign
+    follow(users, [(0, 1), (1, 2), (1, 3)])
+    FollowSuggestionService().compute()
+    follow(users, [(0, 2)])
+
+    # Act
+    suggestions = FollowSuggestionService.get_suggestions(users[0])
+
+    # Assert
+    assert suggestions == [(users[3], 1)]
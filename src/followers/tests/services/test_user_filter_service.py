@@ -0,0 +1,101 @@
+import pytest
+from rest_framework.exceptions import ValidationError
+
+from followers.models import Follow
+from followers.services.follow_service import FollowService
+from followers.services.user_filter_service import UserFilterService
+from posts.models import Post
+from posts.services.post_search_service import PostSearchService
+from posts.services.post_service import PostService
+from timelines.services.home_timeline_service import HomeTimelineService
+
+
+@pytest.mark.django_db
+def test_get_filter_should_load_sets_with_single_query(redis_client, users, django_assert_num_queries):
+    # Assign
+    Follow.objects.create(follower=users[0], followed=users[1], is_blocked=True)
+    Follow.objects.create(follower=users[0], followed=users[2], is_muted=True)
+    Follow.objects.create(follower=users[3], followed=users[0], is_blocked=True)
+    Follow.objects.create(follower=users[1], followed=users[0])
+    filter_service = UserFilterService()
+
+    # Act
+    with django_assert_num_queries(1):
+        filter_service.get_filter(users[0].id)
+        user_filter = filter_service.get_filter(users[0].id)
+
+    # Assert
+    assert user_filter.blocked_ids == {users[1].id}
+    assert user_filter.muted_ids == {users[2].id}
+    assert user_filter.blocked_by_ids == {users[3].id}
+
+
+@pytest.mark.django_db
+def test_mute_user_should_invalidate_cached_filter(redis_client, users):
+    # Assign
+    FollowService.follow_user(users[0], users[1])
+    filter_service = UserFilterService()
+    assert not filter_service.get_filter(users[0].id).is_hidden(users[1].id)
+
+    # Act
+    FollowService.update_follow_properties(users[0], users[1], is_muted=True)
+
+    # Assert
+    assert filter_service.get_filter(users[0].id).is_hidden(users[1].id)
+
+
+@pytest.mark.django_db
+def test_unfollow_should_drop_block(redis_client, users):
+    # Assign
+    FollowService.follow_user(users[0], users[1])
+    FollowService.update_follow_properties(users[0], users[1], is_blocked=True)
+    filter_service = UserFilterService()
+    assert filter_service.get_filter(users[1].id).is_blocked_by(users[0].id)
+
+    # Act
+    FollowService.unfollow_user(users[0], users[1])
+
+    # Assert
+    assert not filter_service.get_filter(users[1].id).is_blocked_by(users[0].id)
+
+
+@pytest.mark.django_db
+def test_home_timeline_should_leave_out_muted_authors(redis_client, users):
+    # Assign
+    FollowService.follow_user(users[0], users[1])
+    FollowService.follow_user(users[0], users[2])
+    post_service = PostService()
+    post_service.create_post(users[1], "Muted post")
+    post_service.create_post(users[2], "Visible post")
+    FollowService.update_follow_properties(users[0], users[1], is_muted=True)
+
+    # Act
+    posts, _ = HomeTimelineService().get_home_timeline(users[0])
+
+    # Assert
+    assert [post.content for post in posts] == ["Visible post"]
+
+
+@pytest.mark.django_db
+def test_search_should_leave_out_users_blocking_viewer(redis_client, users):
+    # Assign
+    Post.objects.create(user=users[1], content="Coffee from a blocking user")
+    visible_post = Post.objects.create(user=users[2], content="Coffee from anyone")
+    Follow.objects.create(follower=users[1], followed=users[0], is_blocked=True)
+
+    # Act
+    posts, _ = PostSearchService().search("coffee", viewer=users[0])
+
+    # Assert
+    assert posts == [visible_post]
+
+
+@pytest.mark.django_db
+def test_toggle_like_post_of_user_blocking_liker_should_raise_error(redis_client, users):
+    # Assign
+    post = Post.objects.create(user=users[1], content="Test post content")
+    Follow.objects.create(follower=users[1], followed=users[0], is_blocked=True)
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        PostService.toggle_like_post(users[0], post.id)
@@ -5,6 +5,11 @@ from followers import views
 urlpatterns = [
     path("follow", views.follow_user, name="follow"),
     path("unfollow", views.unfollow_user, name="unfollow"),
+    path("follow/bulk", views.follow_users, name="follow_bulk"),
+    path("unfollow/bulk", views.unfollow_users, name="unfollow_bulk"),
+    path("following", views.is_following, name="is_following"),
+    path("follow/counts", views.get_follow_counts, name="follow_counts"),
+    path("follow/suggestions", views.get_follow_suggestions, name="follow_suggestions"),
     path("mute", views.mute_user, name="mute"),
     path("block", views.block_user, name="block"),
 ]
@@ -1,42 +1,26 @@
-from jwt import PyJWTError
 from rest_framework import status
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from accounts.services.token_service import TokenService
 from accounts.services.user_service import UserService
+from followers.services.follow_count_service import FollowCountService
+from followers.services.follow_graph_service import FollowGraphService
 from followers.services.follow_service import FollowService
+from followers.services.follow_suggestion_service import FollowSuggestionService
+from followers.settings.follow_settings import FOLLOW_SUGGESTIONS_MAX_PER_USER, FOLLOW_SUGGESTIONS_PAGE_SIZE
+from utils.cursor import get_page_size
 
 
 @api_view(["POST"])
+@permission_classes([IsAuthenticated])
 def follow_user(request):
     user_id = request.query_params.get("user_id")
     if not user_id:
         return Response({"error": "Missing 'user_id' query parameter."}, status=status.HTTP_400_BAD_REQUEST)
 
-    access_token = request.COOKIES.get("access_token")
-    if not access_token:
-        return Response(status=status.HTTP_401_UNAUTHORIZED)
-
-    # Decode token to get the current user
-    try:
-        token_service = TokenService()
-        user_info = token_service.decode_token(access_token)
-    except PyJWTError:
-        return Response(
-            {"error": "Invalid or expired access token."},
-            status=status.HTTP_401_UNAUTHORIZED
-        )
-
-    # Retrieve the follower and followed user objects
+    # The follower is the authenticated user, resolved once by the authentication class
     user_service = UserService()
-    follower = user_service.get_user_by_cognito_id(user_info["username"])
-    if not follower:
-        return Response(
-            {"error": f"Authenticated user with Cognito ID {user_info['username']} not found."},
-            status=status.HTTP_400_BAD_REQUEST
-        )
-
     followed = user_service.get_user_by_cognito_id(user_id)
     if not followed:
         return Response(
@@ -45,41 +29,20 @@ def follow_user(request):
         )
 
     follow_service = FollowService()
-    follow_service.follow_user(follower, followed)
+    follow_service.follow_user(request.user, followed)
 
     return Response(status=status.HTTP_201_CREATED)
 
 
 @api_view(["POST"])
+@permission_classes([IsAuthenticated])
 def unfollow_user(request):
     user_id = request.query_params.get("user_id")
 
     if not user_id:
         return Response({"error": "Missing 'user_id' query parameter."}, status=status.HTTP_400_BAD_REQUEST)
 
-    access_token = request.COOKIES.get("access_token")
-    if not access_token:
-        return Response({"error": "Unauthorized access."}, status=status.HTTP_401_UNAUTHORIZED)
-
-    # Decode token to get the current user
-    try:
-        token_service = TokenService()
-        user_info = token_service.decode_token(access_token)
-    except PyJWTError:
-        return Response(
-            {"error": "Invalid or expired access token."},
-            status=status.HTTP_401_UNAUTHORIZED
-        )
-
-    # Retrieve the follower and followed user objects
     user_service = UserService()
-    follower = user_service.get_user_by_cognito_id(user_info["username"])
-    if not follower:
-        return Response(
-            {"error": f"Authenticated user with Cognito ID {user_info['username']} not found."},
-            status=status.HTTP_400_BAD_REQUEST
-        )
-
     followed = user_service.get_user_by_cognito_id(user_id)
     if not followed:
         return Response(
@@ -88,65 +51,118 @@ def unfollow_user(request):
         )
 
     follow_service = FollowService()
-    follow_service.unfollow_user(follower, followed)
+    follow_service.unfollow_user(request.user, followed)
     return Response({"message": f"Successfully unfollowed {followed.username}."}, status=status.HTTP_200_OK)
 
 
 @api_view(["POST"])
-def mute_user(request):
+@permission_classes([IsAuthenticated])
+def follow_users(request):
+    user_ids = request.data.get("user_ids")
+    if not isinstance(user_ids, list) or not all(isinstance(user_id, str) for user_id in user_ids):
+        return Response({"error": "'user_ids' must be a list of user IDs."}, status=status.HTTP_400_BAD_REQUEST)
+
+    results = FollowService.follow_users(request.user, user_ids)
+    return Response(
+        {"results": [{"user_id": user_id, "result": result} for user_id, result in results.items()]},
+        status=status.HTTP_200_OK,
+    )
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def unfollow_users(request):
+    user_ids = request.data.get("user_ids")
+    if not isinstance(user_ids, list) or not all(isinstance(user_id, str) for user_id in user_ids):
+        return Response({"error": "'user_ids' must be a list of user IDs."}, status=status.HTTP_400_BAD_REQUEST)
+
+    results = FollowService.unfollow_users(request.user, user_ids)
+    return Response(
+        {"results": [{"user_id": user_id, "result": result} for user_id, result in results.items()]},
+        status=status.HTTP_200_OK,
+    )
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def is_following(request):
+    user_id = request.query_params.get("user_id")
+    if not user_id:
+        return Response({"error": "Missing 'user_id' query parameter."}, status=status.HTTP_400_BAD_REQUEST)
+
+    user_service = UserService()
+    followed = user_service.get_user_by_cognito_id(user_id)
+    if not followed:
+        return Response({"error": f"User with ID {user_id} not found."}, status=status.HTTP_404_NOT_FOUND)
+
+    following = FollowGraphService().is_following(request.user.id, followed.id)
+    return Response({"following": following}, status=status.HTTP_200_OK)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def get_follow_counts(request):
     user_id = request.query_params.get("user_id")
     if not user_id:
         return Response({"error": "Missing 'user_id' query parameter."}, status=status.HTTP_400_BAD_REQUEST)
 
-    access_token = request.COOKIES.get("access_token")
-    if not access_token:
-        return Response({"error": "Unauthorized access."}, status=status.HTTP_401_UNAUTHORIZED)
+    user_service = UserService()
+    user = user_service.get_user_by_cognito_id(user_id)
+    if not user:
+        return Response({"error": f"User with ID {user_id} not found."}, status=status.HTTP_404_NOT_FOUND)
+
+    follower_count, following_count = FollowCountService().get_counts(user.id)
+    return Response({"followers": follower_count, "following": following_count}, status=status.HTTP_200_OK)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def get_follow_suggestions(request):
+    limit = get_page_size(
+        request.query_params.get("limit"), FOLLOW_SUGGESTIONS_PAGE_SIZE, FOLLOW_SUGGESTIONS_MAX_PER_USER
+    )
+    suggestions = FollowSuggestionService.get_suggestions(request.user, limit)
 
-    # Decode token to get the current user
-    try:
-        token_service = TokenService()
-        user_info = token_service.decode_token(access_token)
-    except PyJWTError:
-        return Response({"error": "Invalid or expired access token."}, status=status.HTTP_401_UNAUTHORIZED)
+    results = [
+        {"user_id": user.cognito_id, "username": user.username, "mutual_count": mutual_count}
+        for user, mutual_count in suggestions
+    ]
+    return Response({"results": results}, status=status.HTTP_200_OK)
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def mute_user(request):
+    user_id = request.query_params.get("user_id")
+    if not user_id:
+        return Response({"error": "Missing 'user_id' query parameter."}, status=status.HTTP_400_BAD_REQUEST)
 
     user_service = UserService()
-    follower = user_service.get_user_by_cognito_id(user_info["username"])
     followed = user_service.get_user_by_cognito_id(user_id)
 
-    if not follower or not followed:
+    if not followed:
         return Response({"error": "User not found."}, status=status.HTTP_404_NOT_FOUND)
 
     follow_service = FollowService()
-    follow_service.update_follow_properties(follower, followed, is_muted=True)
+    follow_service.update_follow_properties(request.user, followed, is_muted=True)
 
     return Response({"message": f"{followed.username} has been muted."}, status=status.HTTP_200_OK)
 
 
 @api_view(["POST"])
+@permission_classes([IsAuthenticated])
 def block_user(request):
     user_id = request.query_params.get("user_id")
     if not user_id:
         return Response({"error": "Missing 'user_id' query parameter."}, status=status.HTTP_400_BAD_REQUEST)
 
-    access_token = request.COOKIES.get("access_token")
-    if not access_token:
-        return Response({"error": "Unauthorized access."}, status=status.HTTP_401_UNAUTHORIZED)
-
-    # Decode token to get the current user
-    try:
-        token_service = TokenService()
-        user_info = token_service.decode_token(access_token)
-    except PyJWTError:
-        return Response({"error": "Invalid or expired access token."}, status=status.HTTP_401_UNAUTHORIZED)
-
     user_service = UserService()
-    follower = user_service.get_user_by_cognito_id(user_info["username"])
     followed = user_service.get_user_by_cognito_id(user_id)
 
-    if not follower or not followed:
+    if not followed:
         return Response({"error": "User not found."}, status=status.HTTP_404_NOT_FOUND)
 
     follow_service = FollowService()
-    follow_service.update_follow_properties(follower, followed, is_blocked=True)
+    follow_service.update_follow_properties(request.user, followed, is_blocked=True)
 
     return Response({"message": f"{followed.username} has been blocked."}, status=status.HTTP_200_OK)
@@ -0,0 +1,25 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from jobs.services.job_service import JobService
+from jobs.settings.job_settings import JOB_POLL_INTERVAL
+
+
+class Command(BaseCommand):
+    help = "Runs queued background jobs."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Exit once no due jobs are left.")
+        parser.add_argument("--poll-interval", type=float, default=JOB_POLL_INTERVAL)
+
+    def handle(self, *args, **options):
+        while True:
+            count = JobService.run_pending()
+            if count:
+                self.stdout.write(f"Ran {count} jobs.")
+
+            if options["once"]:
+                return
+
+            time.sleep(options["poll_interval"])
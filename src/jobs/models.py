@@ -0,0 +1,27 @@
+from django.db import models
+from django.utils import timezone
+
+from jobs.settings.job_settings import JOB_MAX_ATTEMPTS
+
+
+class Job(models.Model):
+    class Status(models.TextChoices):
+        PENDING = "pending"
+        DEAD = "dead"
+
+    name = models.CharField(max_length=255)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(max_length=16, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=JOB_MAX_ATTEMPTS)
+    run_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["run_at"], condition=models.Q(status="pending"), name="jobs_job_pending_run_at_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.status})"
@@ -0,0 +1,36 @@
+from typing import Callable
+
+_handlers: dict[str, Callable] = {}
+_secret_fields: dict[str, tuple[str, ...]] = {}
+
+
+def job_handler(name: str, secret_fields: tuple[str, ...] = ()):
+    """
+    Registers the decorated function as the handler of the jobs with the given name.
+
+    :param name: Name under which jobs for this handler are enqueued.
+    :param secret_fields: Payload fields that are removed once the job is dead-lettered, such as credentials.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        _handlers[name] = function
+        _secret_fields[name] = secret_fields
+        return function
+
+    return decorator
+
+
+def get_job_handler(name: str) -> Callable | None:
+    """
+    :param name: Name of the job.
+    :return: The handler registered for the job, or None if there is none.
+    """
+    return _handlers.get(name)
+
+
+def get_secret_fields(name: str) -> tuple[str, ...]:
+    """
+    :param name: Name of the job.
+    :return: The payload fields of the job that must not be kept once it is dead-lettered.
+    """
+    return _secret_fields.get(name, ())
@@ -0,0 +1,128 @@
+import logging
+import random
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.registry import get_job_handler, get_secret_fields
+from jobs.settings.job_settings import JOB_BACKOFF_BASE, JOB_BACKOFF_MAX, JOB_LEASE_TIMEOUT, JOB_MAX_ATTEMPTS
+
+
+class JobService:
+    """
+    Postgres backed queue for work that should not delay the response sent to the user.
+
+    Workers claim due jobs with SELECT ... FOR UPDATE SKIP LOCKED, so any number of them can poll the same
+    table without blocking each other. A claimed job is leased for a limited time, failed jobs are retried with
+    exponential backoff and moved to the dead letter state once they run out of attempts.
+    """
+
+    @staticmethod
+    def enqueue(name: str, payload: dict = None, delay: int = 0, max_attempts: int = JOB_MAX_ATTEMPTS) -> Job:
+        """
+        Adds a new job to the queue.
+
+        :param name: Name of the registered job handler.
+        :param payload: Keyword arguments passed to the handler, must be JSON serializable.
+        :param delay: Number of seconds to wait before the job can run.
+        :param max_attempts: Number of attempts before the job is dead-lettered.
+        :return: The created job.
+        """
+        job = Job.objects.create(
+            name=name,
+            payload=payload or {},
+            max_attempts=max_attempts,
+            run_at=timezone.now() + timedelta(seconds=delay),
+        )
+        logging.info(f"Enqueued job {job.name} with ID {job.id}.")
+        return job
+
+    @staticmethod
+    def claim_next() -> Job | None:
+        """
+        Claims the next due job by extending its lease, other workers skip it until the lease runs out.
+
+        :return: The claimed job, or None if there are no due jobs.
+        """
+        with transaction.atomic():
+            job = (
+                Job.objects.select_for_update(skip_locked=True)
+                .filter(status=Job.Status.PENDING, run_at__lte=timezone.now())
+                .order_by("run_at")
+                .first()
+            )
+            if job is None:
+                return None
+
+            job.attempts += 1
+            job.run_at = timezone.now() + timedelta(seconds=JOB_LEASE_TIMEOUT)
+            job.save(update_fields=["attempts", "run_at"])
+
+        return job
+
+    @classmethod
+    def run_next(cls) -> bool:
+        """
+        Claims and runs the next due job.
+
+        :return: True if a job was run, False if there were no due jobs.
+        """
+        job = cls.claim_next()
+        if job is None:
+            return False
+
+        handler = get_job_handler(job.name)
+
+        try:
+            if handler is None:
+                raise LookupError(f"No handler is registered for job {job.name}.")
+
+            handler(**job.payload)
+        except Exception as e:
+            cls.__handle_failure(job, e)
+            return True
+
+        job.delete()
+        logging.info(f"Job {job.name} with ID {job.id} completed.")
+        return True
+
+    @classmethod
+    def run_pending(cls) -> int:
+        """
+        Runs jobs until no due jobs are left.
+
+        :return: Number of jobs that were run.
+        """
+        count = 0
+        while cls.run_next():
+            count += 1
+
+        return count
+
+    @staticmethod
+    def __handle_failure(job: Job, error: Exception) -> None:
+        """
+        Schedules a retry of the failed job, or dead-letters it once it is out of attempts.
+
+        The secret fields of a dead-lettered job are removed from its payload, so credentials are not kept in the
+        table after the job stopped needing them.
+
+        :param job: The failed job.
+        :param error: The error raised by the job handler.
+        """
+        job.last_error = f"{type(error).__name__}: {error}"
+
+        if job.attempts >= job.max_attempts:
+            job.status = Job.Status.DEAD
+            for field in get_secret_fields(job.name):
+                job.payload.pop(field, None)
+            logging.error(f"Job {job.name} with ID {job.id} failed {job.attempts} times, moved to dead letter: {error}")
+        else:
+            # Exponential backoff with jitter, so failing jobs do not retry in lockstep
+            backoff = min(JOB_BACKOFF_BASE * 2 ** (job.attempts - 1), JOB_BACKOFF_MAX)
+            job.run_at = timezone.now() + timedelta(seconds=backoff * random.uniform(0.5, 1.0))
+            logging.warning(f"Job {job.name} with ID {job.id} failed, retrying in {backoff} seconds: {error}")
+
+        job.save(update_fields=["status", "run_at", "last_error", "payload"])
@@ -0,0 +1,5 @@
+JOB_MAX_ATTEMPTS = 5  # Attempts after which a failing job is moved to the dead letter state
+JOB_BACKOFF_BASE = 2  # Seconds, doubled after every failed attempt
+JOB_BACKOFF_MAX = 300  # Seconds
+JOB_LEASE_TIMEOUT = 60  # Seconds after which a job claimed by a crashed worker becomes available again
+JOB_POLL_INTERVAL = 1.0  # Seconds a worker sleeps when there are no jobs to run
@@ -0,0 +1,137 @@
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.registry import job_handler
+from jobs.services.job_service import JobService
+
+test_handler = MagicMock()
+job_handler("tests.test_job")(lambda **kwargs: test_handler(**kwargs))
+job_handler("tests.secret_job", secret_fields=("token",))(lambda **kwargs: test_handler(**kwargs))
+
+
+@pytest.fixture(autouse=True)
+def reset_test_handler():
+    test_handler.reset_mock(side_effect=True)
+
+
+@pytest.mark.django_db
+def test_run_pending_with_due_job_should_run_handler_and_delete_job():
+    # Assign
+    JobService.enqueue("tests.test_job", {"value": 1})
+
+    # Act
+    count = JobService.run_pending()
+
+    # Assert
+    assert count == 1
+    test_handler.assert_called_once_with(value=1)
+    assert not Job.objects.exists()
+
+
+@pytest.mark.django_db
+def test_run_pending_with_delayed_job_should_not_run_handler():
+    # Assign
+    JobService.enqueue("tests.test_job", {"value": 1}, delay=60)
+
+    # Act
+    count = JobService.run_pending()
+
+    # Assert
+    assert count == 0
+    test_handler.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_run_pending_with_failing_job_should_schedule_retry_with_backoff():
+    # Assign
+    test_handler.side_effect = RuntimeError("Cognito unavailable")
+    job = JobService.enqueue("tests.test_job", {"value": 1})
+
+    # Act
+    JobService.run_pending()
+
+    # Assert
+    job.refresh_from_db()
+    assert job.status == Job.Status.PENDING
+    assert job.attempts == 1
+    assert job.run_at > timezone.now()
+    assert "Cognito unavailable" in job.last_error
+
+
+@pytest.mark.django_db
+def test_run_pending_with_job_out_of_attempts_should_move_job_to_dead_letter():
+    # Assign
+    test_handler.side_effect = RuntimeError("Cognito unavailable")
+    job = JobService.enqueue("tests.test_job", {"value": 1}, max_attempts=2)
+
+    # Act
+    for _ in range(2):
+        Job.objects.filter(id=job.id).update(run_at=timezone.now() - timedelta(seconds=1))
+        JobService.run_pending()
+
+    # Assert
+    job.refresh_from_db()
+    assert job.status == Job.Status.DEAD
+    assert job.attempts == 2
+    assert test_handler.call_count == 2
+
+
+@pytest.mark.django_db
+def test_run_pending_with_dead_lettered_job_should_remove_secret_fields():
+    # Assign
+    test_handler.side_effect = RuntimeError("Cognito unavailable")
+    job = JobService.enqueue("tests.secret_job", {"token": "secret", "value": 1}, max_attempts=1)
+
+    # Act
+    JobService.run_pending()
+
+    # Assert
+    job.refresh_from_db()
+    assert job.status == Job.Status.DEAD
+    assert job.payload == {"value": 1}
+
+
+@pytest.mark.django_db
+def test_run_pending_with_retried_job_should_keep_secret_fields():
+    # Assign
+    test_handler.side_effect = RuntimeError("Cognito unavailable")
+    job = JobService.enqueue("tests.secret_job", {"token": "secret"})
+
+    # Act
+    JobService.run_pending()
+
+    # Assert
+    job.refresh_from_db()
+    assert job.status == Job.Status.PENDING
+    assert job.payload == {"token": "secret"}
+
+
+@pytest.mark.django_db
+def test_run_pending_with_unknown_job_should_record_error():
+    # Assign
+    job = JobService.enqueue("tests.unknown_job")
+
+    # Act
+    JobService.run_pending()
+
+    # Assert
+    job.refresh_from_db()
+    assert "No handler is registered" in job.last_error
+
+
+@pytest.mark.django_db
+def test_claim_next_with_claimed_job_should_not_return_it_again():
+    # Assign
+    JobService.enqueue("tests.test_job")
+
+    # Act
+    first_claim = JobService.claim_next()
+    second_claim = JobService.claim_next()
+
+    # Assert
+    assert first_claim is not None
+    assert second_claim is None
@@ -0,0 +1,37 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError
+from redis.exceptions import RedisError
+
+from posts.services.like_buffer_service import LikeBufferService
+from posts.settings.post_settings import LIKE_BUFFER_FLUSH_INTERVAL
+
+
+class Command(BaseCommand):
+    help = "Writes the like toggles buffered in write-behind mode to the likes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Flush once and exit.")
+        parser.add_argument("--interval", type=float, default=LIKE_BUFFER_FLUSH_INTERVAL)
+
+    def handle(self, *args, **options):
+        like_buffer_service = LikeBufferService()
+
+        while True:
+            try:
+                count = like_buffer_service.flush()
+                if count:
+                    self.stdout.write(f"Flushed the buffered likes of {count} posts.")
+            except RedisError as e:
+                # The buffered toggles stay in Redis and are flushed once it is reachable again
+                logging.error(f"Failed to flush buffered likes: {e}")
+            except DatabaseError as e:
+                # The flush is retried with the same buffered toggles, a failed write loses none of them
+                logging.error(f"Failed to write buffered likes: {e}")
+
+            if options["once"]:
+                return
+
+            time.sleep(options["interval"])
@@ -0,0 +1,33 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+from redis.exceptions import RedisError
+
+from posts.services.like_counter_service import LikeCounterService
+from posts.settings.post_settings import LIKE_COUNTER_FLUSH_INTERVAL
+
+
+class Command(BaseCommand):
+    help = "Writes the like counts buffered in Redis to the posts."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Flush once and exit.")
+        parser.add_argument("--interval", type=float, default=LIKE_COUNTER_FLUSH_INTERVAL)
+
+    def handle(self, *args, **options):
+        like_counter_service = LikeCounterService()
+
+        while True:
+            try:
+                count = like_counter_service.flush()
+                if count:
+                    self.stdout.write(f"Flushed the like counts of {count} posts.")
+            except RedisError as e:
+                # The buffered changes stay in Redis and are flushed once it is reachable again
+                logging.error(f"Failed to flush like counts: {e}")
+
+            if options["once"]:
+                return
+
+            time.sleep(options["interval"])
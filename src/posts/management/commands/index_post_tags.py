@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from posts.models import Post
+from posts.services.post_tag_service import PostTagService
+
+
+class Command(BaseCommand):
+    help = "Indexes the hashtags and mentions of the existing posts, posts that are already indexed are unchanged."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        tag_service = PostTagService()
+        count = 0
+        for post in Post.objects.only("id", "content", "timestamp").iterator(chunk_size=options["batch_size"]):
+            tag_service.index_post(post)
+            count += 1
+
+        self.stdout.write(f"Indexed the hashtags and mentions of {count} posts.")
@@ -0,0 +1,31 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+from redis.exceptions import RedisError
+
+from posts.services.trending_service import TrendingService
+from posts.settings.post_settings import TRENDING_REBASE_INTERVAL
+
+
+class Command(BaseCommand):
+    help = "Decays the trending scores to the current time and drops the entries that stopped trending."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Rebase once and exit.")
+        parser.add_argument("--interval", type=float, default=TRENDING_REBASE_INTERVAL)
+
+    def handle(self, *args, **options):
+        trending_service = TrendingService()
+
+        while True:
+            try:
+                trending_service.rebase()
+            except RedisError as e:
+                # Scores stay valid relative to the old epoch, the next rebase catches up
+                logging.error(f"Failed to rebase the trending scores: {e}")
+
+            if options["once"]:
+                return
+
+            time.sleep(options["interval"])
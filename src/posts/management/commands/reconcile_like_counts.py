@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from posts.services.like_counter_service import LikeCounterService
+from posts.settings.post_settings import LIKE_COUNT_RECONCILE_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = "Recounts the likes of all posts and corrects the counts that drifted."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=LIKE_COUNT_RECONCILE_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        count = LikeCounterService().reconcile(batch_size=options["batch_size"])
+        self.stdout.write(f"Corrected the like counts of {count} posts.")
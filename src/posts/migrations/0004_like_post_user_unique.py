@@ -0,0 +1,36 @@
+# Generated by Django 5.1.3 on 2026-10-17 20:06
+
+from django.db import migrations, models
+
+
+def delete_duplicate_likes(apps, schema_editor):
+    """
+    Keeps the oldest like of every post and user pair, so the unique constraint can be added.
+    """
+    Like = apps.get_model("posts", "Like")
+
+    duplicates = (
+        Like.objects.values("post_id", "user_id")
+        .annotate(count=models.Count("id"), first_id=models.Min("id"))
+        .filter(count__gt=1)
+    )
+    for duplicate in duplicates.iterator():
+        Like.objects.filter(post_id=duplicate["post_id"], user_id=duplicate["user_id"]).exclude(
+            id=duplicate["first_id"]
+        ).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_user_upper_indexes'),
+        ('posts', '0003_post_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicate_likes, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='like',
+            constraint=models.UniqueConstraint(fields=('post', 'user'), name='like_post_user_unique'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.1.3 on 2026-10-17 20:07
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def count_likes(apps, schema_editor):
+    Like = apps.get_model("posts", "Like")
+    Post = apps.get_model("posts", "Post")
+
+    like_counts = (
+        Like.objects.filter(post_id=models.OuterRef("id"))
+        .values("post_id")
+        .annotate(count=models.Count("id"))
+        .values("count")
+    )
+    Post.objects.update(like_count=Coalesce(models.Subquery(like_counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0004_like_post_user_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='like_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(count_likes, migrations.RunPython.noop),
+    ]
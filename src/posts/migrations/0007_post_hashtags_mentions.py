@@ -0,0 +1,41 @@
+# Generated by Django 5.1.3 on 2026-10-17 20:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_user_upper_indexes'),
+        ('posts', '0006_post_search_vector'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostHashtag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tag', models.CharField(max_length=100)),
+                ('timestamp', models.DateTimeField()),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hashtags', to='posts.post')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['tag', '-timestamp', '-post'], name='post_hashtag_tag_ts_idx')],
+                'constraints': [models.UniqueConstraint(fields=('tag', 'post'), name='post_hashtag_tag_post_unique')],
+            },
+        ),
+        migrations.CreateModel(
+            name='PostMention',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('timestamp', models.DateTimeField()),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='mentions', to='posts.post')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='mentions', to='accounts.user')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', '-timestamp', '-post'], name='post_mention_user_ts_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'post'), name='post_mention_user_post_unique')],
+            },
+        ),
+    ]
@@ -1,15 +1,81 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 
 from accounts.models import User
+from posts.settings.post_settings import POST_HASHTAG_MAX_LENGTH, POST_SEARCH_CONFIG
+
+
+class PostManager(models.Manager):
+    def get_queryset(self):
+        # The search vector is only read by the database, loading it would double the size of every post row
+        return super().get_queryset().defer("search_vector")
 
 
 class Post(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     content = models.TextField()
     timestamp = models.DateTimeField(auto_now_add=True)
+    # Maintained by the LikeCounterService, rebuilt from the likes by the reconcile_like_counts command
+    like_count = models.IntegerField(default=0)
+    # Kept up to date by the database on every insert and update of the content
+    search_vector = models.GeneratedField(
+        expression=SearchVector("content", config=POST_SEARCH_CONFIG),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = PostManager()
+
+    class Meta:
+        indexes = [
+            # Keyset pagination of the posts of a user and of all posts, newest first
+            models.Index(fields=["user", "-timestamp", "-id"], name="post_user_timestamp_id_idx"),
+            models.Index(fields=["-timestamp", "-id"], name="post_timestamp_id_idx"),
+            GinIndex(fields=["search_vector"], name="post_search_vector_idx"),
+        ]
 
 
 class Like(models.Model):
     post = models.ForeignKey(Post, on_delete=models.CASCADE)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     timestamp = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["post", "user"], name="like_post_user_unique"),
+        ]
+
+
+class PostHashtag(models.Model):
+    """
+    Inverted index of the hashtags used in the posts, the timestamp of the post is copied for keyset pagination.
+    """
+    tag = models.CharField(max_length=POST_HASHTAG_MAX_LENGTH)
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="hashtags")
+    timestamp = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["tag", "post"], name="post_hashtag_tag_post_unique"),
+        ]
+        indexes = [
+            models.Index(fields=["tag", "-timestamp", "-post"], name="post_hashtag_tag_ts_idx"),
+        ]
+
+
+class PostMention(models.Model):
+    """
+    Inverted index of the users mentioned in the posts, the timestamp of the post is copied for keyset pagination.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="mentions")
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="mentions")
+    timestamp = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "post"], name="post_mention_user_post_unique"),
+        ]
+        indexes = [
+            models.Index(fields=["user", "-timestamp", "-post"], name="post_mention_user_ts_idx"),
+        ]
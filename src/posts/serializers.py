@@ -0,0 +1,17 @@
+from rest_framework import serializers
+
+from posts.models import Post
+
+
+class PostSerializer(serializers.ModelSerializer):
+    user_id = serializers.CharField(source="user.cognito_id", read_only=True)
+    username = serializers.CharField(source="user.username", read_only=True)
+    liked = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Post
+        fields = ["id", "user_id", "username", "content", "timestamp", "like_count", "liked"]
+
+    def get_liked(self, post: Post) -> bool:
+        # Looked up for the whole list at once, see PostService.get_liked_post_ids
+        return post.id in self.context.get("liked_post_ids", set())
@@ -0,0 +1,223 @@
+import logging
+
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+
+from accounts.models import User
+from posts.models import Like, Post
+from posts.settings.post_settings import LIKE_BUFFER_FLUSH_BATCH_SIZE, LIKE_BUFFER_KEY_PREFIX
+from utils.redis_client import get_redis_client
+
+# Flips the buffered like state of a user. The state is looked up in the buffer, then in the buffer being flushed,
+# then in the state read from the database (ARGV[3]). Returns -1 if the database state is needed but was not given.
+TOGGLE_SCRIPT = """
+local state = redis.call("HGET", KEYS[1], ARGV[1])
+if not state then
+    state = redis.call("HGET", KEYS[2], ARGV[1])
+end
+if not state then
+    if ARGV[3] == "" then
+        return -1
+    end
+    state = ARGV[3]
+end
+
+local liked = 1 - tonumber(state)
+redis.call("HSET", KEYS[1], ARGV[1], liked)
+redis.call("SADD", KEYS[3], ARGV[2])
+return liked
+"""
+
+# Writes the buffered likes, given as pairs of post and user IDs. Likes of posts or users deleted since they were
+# buffered are dropped by the joins, in the same statement as the insert.
+INSERT_LIKES_SQL = f"""
+    INSERT INTO {Like._meta.db_table} (post_id, user_id, "timestamp")
+    SELECT post.id, liker.id, %(timestamp)s
+    FROM unnest(%(post_ids)s::bigint[], %(user_ids)s::bigint[]) AS buffered (post_id, user_id)
+    JOIN {Post._meta.db_table} AS post ON post.id = buffered.post_id
+    JOIN {User._meta.db_table} AS liker ON liker.id = buffered.user_id
+    ON CONFLICT (post_id, user_id) DO NOTHING
+"""
+
+
+class LikeBufferService:
+    """
+    Write-behind buffer of like toggles, for posts that receive likes faster than the likes table can take them.
+
+    The wanted like state of every user is kept in a Redis hash per post, with the posts that have buffered
+    changes in a dirty set. The flush renames the hashes before reading them and only deletes them once the likes
+    are written, so a state that is being flushed is still found by the reads.
+    """
+
+    def __init__(self):
+        self.redis_client = get_redis_client()
+        self.toggle_script = self.redis_client.register_script(TOGGLE_SCRIPT)
+
+    def toggle(self, user_id: int, post_id: int) -> tuple[bool, bool]:
+        """
+        Toggles the like of a post in the buffer.
+
+        :param user_id: ID of the user liking or unliking the post.
+        :param post_id: ID of the post.
+        :return: Whether the post exists and whether it is liked after the toggle.
+        :raises RedisError: If Redis is unavailable.
+        """
+        keys = [self.__get_key(post_id), self.__get_flushing_key(post_id), self.__get_dirty_key()]
+
+        liked = self.toggle_script(keys=keys, args=[user_id, post_id, ""])
+        if liked == -1:
+            # The user has no buffered change of this post, the state is read from the database once
+            state = (
+                Post.objects.filter(id=post_id)
+                .annotate(liked=Exists(Like.objects.filter(post_id=OuterRef("id"), user_id=user_id)))
+                .values_list("liked", flat=True)
+                .first()
+            )
+            if state is None:
+                return False, False
+
+            liked = self.toggle_script(keys=keys, args=[user_id, post_id, int(state)])
+
+        return True, liked == 1
+
+    def get_buffered_states(self, user_id: int, post_ids: list[int]) -> dict[int, bool]:
+        """
+        Returns the buffered like states of a user.
+
+        :param user_id: ID of the user.
+        :param post_ids: IDs of the posts.
+        :return: Like state per post ID, posts without a buffered change are left out.
+        :raises RedisError: If Redis is unavailable.
+        """
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for post_id in post_ids:
+            pipeline.hget(self.__get_key(post_id), user_id)
+            pipeline.hget(self.__get_flushing_key(post_id), user_id)
+        responses = pipeline.execute()
+
+        states = {}
+        for index, post_id in enumerate(post_ids):
+            state, flushing_state = responses[index * 2:index * 2 + 2]
+            if state is None:
+                state = flushing_state
+            if state is not None:
+                states[post_id] = state == b"1"
+
+        return states
+
+    def get_unwritten_deltas(self, post_ids: list[int]) -> dict[int, int]:
+        """
+        Returns the changes of the like counts made by buffered toggles that are not written to the likes yet.
+
+        The like counters take a toggle right away, the likes only once the buffer is flushed. A buffered like is
+        unwritten while the like does not exist, a buffered unlike while it still exists.
+
+        :param post_ids: IDs of the posts.
+        :return: Delta per post ID, posts without unwritten changes are left out.
+        :raises RedisError: If Redis is unavailable.
+        """
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for post_id in post_ids:
+            pipeline.hgetall(self.__get_flushing_key(post_id))
+            pipeline.hgetall(self.__get_key(post_id))
+        responses = pipeline.execute()
+
+        # The latest state of a user is the one in the buffer, then the one being flushed
+        states_by_post = {}
+        for index, post_id in enumerate(post_ids):
+            flushing_states, states = responses[index * 2:index * 2 + 2]
+            if flushing_states or states:
+                states_by_post[post_id] = {int(user_id): state == b"1" for user_id, state in {
+                    **flushing_states, **states
+                }.items()}
+        if not states_by_post:
+            return {}
+
+        user_ids = {user_id for states in states_by_post.values() for user_id in states}
+        likes = set(
+            Like.objects.filter(post_id__in=states_by_post, user_id__in=user_ids).values_list("post_id", "user_id")
+        )
+
+        deltas = {}
+        for post_id, states in states_by_post.items():
+            delta = sum(liked - ((post_id, user_id) in likes) for user_id, liked in states.items())
+            if delta:
+                deltas[post_id] = delta
+
+        return deltas
+
+    def flush(self, batch_size: int = LIKE_BUFFER_FLUSH_BATCH_SIZE) -> int:
+        """
+        Writes the buffered like toggles to the likes. Only one flush may run at a time.
+
+        :param batch_size: Number of posts written per transaction.
+        :return: Number of flushed posts.
+        :raises RedisError: If Redis is unavailable.
+        """
+        dirty_key = self.__get_dirty_key()
+        flushing_dirty_key = f"{dirty_key}:flushing"
+
+        # Posts left over by a failed flush are written first, without taking new changes
+        if not self.redis_client.exists(flushing_dirty_key) and self.redis_client.exists(dirty_key):
+            self.redis_client.renamenx(dirty_key, flushing_dirty_key)
+
+        post_ids = [int(post_id) for post_id in self.redis_client.smembers(flushing_dirty_key)]
+        for start in range(0, len(post_ids), batch_size):
+            self.__flush_posts(post_ids[start:start + batch_size])
+
+        self.redis_client.delete(flushing_dirty_key)
+        if post_ids:
+            logging.info(f"Flushed the buffered likes of {len(post_ids)} posts.")
+
+        return len(post_ids)
+
+    def __flush_posts(self, post_ids: list[int]) -> None:
+        for post_id in post_ids:
+            key = self.__get_key(post_id)
+            flushing_key = self.__get_flushing_key(post_id)
+            if not self.redis_client.exists(flushing_key) and self.redis_client.exists(key):
+                self.redis_client.renamenx(key, flushing_key)
+
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for post_id in post_ids:
+            pipeline.hgetall(self.__get_flushing_key(post_id))
+        states_by_post = dict(zip(post_ids, pipeline.execute()))
+
+        post_ids_of_likes, user_ids_of_likes = [], []
+        unliked = Q()
+        for post_id, states in states_by_post.items():
+            liked_user_ids = [int(user_id) for user_id, state in states.items() if state == b"1"]
+            unliked_user_ids = [int(user_id) for user_id, state in states.items() if state == b"0"]
+
+            post_ids_of_likes.extend([post_id] * len(liked_user_ids))
+            user_ids_of_likes.extend(liked_user_ids)
+            if unliked_user_ids:
+                unliked |= Q(post_id=post_id, user_id__in=unliked_user_ids)
+
+        with transaction.atomic():
+            # A reconcile of the like counts holds the locks of the posts while it compares the buffer to the likes
+            list(Post.objects.filter(id__in=post_ids).order_by("id").select_for_update(no_key=True).values_list("id"))
+            if post_ids_of_likes:
+                with connection.cursor() as cursor:
+                    cursor.execute(INSERT_LIKES_SQL, {
+                        "post_ids": post_ids_of_likes,
+                        "user_ids": user_ids_of_likes,
+                        "timestamp": timezone.now(),
+                    })
+            if unliked:
+                Like.objects.filter(unliked).delete()
+
+        self.redis_client.delete(*[self.__get_flushing_key(post_id) for post_id in post_ids])
+
+    @staticmethod
+    def __get_key(post_id: int) -> str:
+        return f"{LIKE_BUFFER_KEY_PREFIX}:{post_id}"
+
+    @staticmethod
+    def __get_flushing_key(post_id: int) -> str:
+        return f"{LIKE_BUFFER_KEY_PREFIX}:{post_id}:flushing"
+
+    @staticmethod
+    def __get_dirty_key() -> str:
+        return f"{LIKE_BUFFER_KEY_PREFIX}:dirty"
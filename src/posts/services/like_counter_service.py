@@ -0,0 +1,168 @@
+import logging
+import random
+
+from django.db import transaction
+from django.db.models import Case, Count, F, IntegerField, OuterRef, Subquery, Value, When
+from django.db.models.functions import Coalesce
+from redis.exceptions import RedisError
+
+from posts.models import Like, Post
+from posts.services.like_buffer_service import LikeBufferService
+from posts.settings.post_settings import (
+    LIKE_COUNT_RECONCILE_BATCH_SIZE,
+    LIKE_COUNTER_KEY_PREFIX,
+    LIKE_COUNTER_SHARDS,
+)
+from utils.redis_client import get_redis_client
+
+
+class LikeCounterService:
+    """
+    Maintains the like_count column of the posts.
+
+    Like toggles add their delta to one of LIKE_COUNTER_SHARDS Redis hashes, picked at random, so a viral post
+    does not turn a single key or row into a hot spot. The flush applies the summed deltas of all shards to the
+    posts in one bulk UPDATE.
+    """
+
+    def __init__(self):
+        self.redis_client = get_redis_client()
+
+    def add(self, post_id: int, delta: int) -> None:
+        """
+        Adds a change of the like count of a post.
+
+        :param post_id: ID of the post.
+        :param delta: 1 for a new like, -1 for a removed one.
+        """
+        shard = random.randrange(LIKE_COUNTER_SHARDS)
+
+        try:
+            self.redis_client.hincrby(self.__get_key(shard), post_id, delta)
+        except RedisError as e:
+            logging.error(f"Failed to buffer the like count of post {post_id}, updating the post: {e}")
+            Post.objects.filter(id=post_id).update(like_count=F("like_count") + delta)
+
+    def get_pending(self, post_ids: list[int]) -> dict[int, int]:
+        """
+        Returns the changes of the like counts that are not flushed yet.
+
+        :param post_ids: IDs of the posts.
+        :return: Pending delta per post ID, posts without changes are left out.
+        """
+        if not post_ids:
+            return {}
+
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for shard in range(LIKE_COUNTER_SHARDS):
+            pipeline.hmget(self.__get_key(shard), post_ids)
+            pipeline.hmget(self.__get_flushing_key(shard), post_ids)
+
+        pending = {}
+        for deltas in pipeline.execute():
+            for post_id, delta in zip(post_ids, deltas):
+                if delta is not None:
+                    pending[post_id] = pending.get(post_id, 0) + int(delta)
+
+        return {post_id: delta for post_id, delta in pending.items() if delta}
+
+    def flush(self) -> int:
+        """
+        Applies the buffered changes of the like counts to the posts. Only one flush may run at a time.
+
+        Every shard is renamed before it is read, so changes added meanwhile go into a new hash. A renamed shard
+        is only deleted once the posts are updated, if the update fails it is applied by the next flush.
+
+        :return: Number of updated posts.
+        """
+        flushing_keys = []
+        for shard in range(LIKE_COUNTER_SHARDS):
+            key = self.__get_key(shard)
+            flushing_key = self.__get_flushing_key(shard)
+
+            # A shard left over by a failed flush is applied first, without taking new changes
+            if not self.redis_client.exists(flushing_key) and self.redis_client.exists(key):
+                self.redis_client.renamenx(key, flushing_key)
+            flushing_keys.append(flushing_key)
+
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for flushing_key in flushing_keys:
+            pipeline.hgetall(flushing_key)
+
+        deltas = {}
+        for shard_deltas in pipeline.execute():
+            for post_id, delta in shard_deltas.items():
+                deltas[int(post_id)] = deltas.get(int(post_id), 0) + int(delta)
+        deltas = {post_id: delta for post_id, delta in deltas.items() if delta}
+
+        # The renamed shards are deleted before the update commits, so a reconcile holding the locks of the posts
+        # never sees deltas that are both applied and still pending
+        with transaction.atomic():
+            if deltas:
+                Post.objects.filter(id__in=deltas).update(like_count=F("like_count") + self.__get_delta(deltas))
+            self.redis_client.delete(*flushing_keys)
+        logging.info(f"Flushed the like counts of {len(deltas)} posts.")
+
+        return len(deltas)
+
+    def reconcile(self, batch_size: int = LIKE_COUNT_RECONCILE_BATCH_SIZE) -> int:
+        """
+        Recounts the likes of all posts, for counts that drifted from the likes.
+
+        Every batch of posts is locked while it is recounted. The count of a post is set to its likes minus the
+        changes still buffered for it, so the flush of those changes brings the count to the number of likes.
+        Toggles still in the write-behind like buffer are already in the counters but not in the likes, they are
+        added to the likes.
+
+        :param batch_size: Number of posts recounted per UPDATE.
+        :return: Number of posts whose count was corrected.
+        """
+        like_counts = (
+            Like.objects.filter(post_id=OuterRef("id"))
+            .values("post_id")
+            .annotate(count=Count("id"))
+            .values("count")
+        )
+        like_count = Coalesce(Subquery(like_counts), 0)
+
+        corrected = 0
+        last_id = 0
+        while True:
+            with transaction.atomic():
+                post_ids = list(
+                    Post.objects.filter(id__gt=last_id)
+                    .order_by("id")
+                    .select_for_update()
+                    .values_list("id", flat=True)[:batch_size]
+                )
+                if not post_ids:
+                    return corrected
+
+                # A flush of these posts waits for the locks, their pending changes stay pending until the commit
+                deltas = self.get_pending(post_ids)
+                for post_id, delta in LikeBufferService().get_unwritten_deltas(post_ids).items():
+                    deltas[post_id] = deltas.get(post_id, 0) - delta
+                expected_like_count = like_count - self.__get_delta(deltas)
+                corrected += (
+                    Post.objects.filter(id__in=post_ids)
+                    .annotate(expected_like_count=expected_like_count)
+                    .exclude(like_count=F("expected_like_count"))
+                    .update(like_count=expected_like_count)
+                )
+            last_id = post_ids[-1]
+
+    @staticmethod
+    def __get_delta(deltas: dict[int, int]) -> Case:
+        return Case(
+            *[When(id=post_id, then=Value(delta)) for post_id, delta in deltas.items()],
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+
+    @staticmethod
+    def __get_key(shard: int) -> str:
+        return f"{LIKE_COUNTER_KEY_PREFIX}:{shard}"
+
+    @staticmethod
+    def __get_flushing_key(shard: int) -> str:
+        return f"{LIKE_COUNTER_KEY_PREFIX}:{shard}:flushing"
@@ -0,0 +1,91 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, FloatField, Q
+from django.db.models.functions import Cast
+from rest_framework.exceptions import ValidationError
+
+from accounts.models import User
+from followers.services.user_filter_service import UserFilterService
+from posts.models import Post
+from posts.settings.post_settings import (
+    POST_PAGE_SIZE,
+    POST_SEARCH_CONFIG,
+    POST_SEARCH_MAX_QUERY_LENGTH,
+    POST_SEARCH_PREFIX_MAX_LENGTH,
+)
+from utils.cursor import decode_cursor, encode_cursor
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+class PostSearchService:
+    """
+    Full-text search of the post content.
+
+    Posts are matched against the generated search_vector column through its GIN index and ranked by ts_rank.
+    Pages are keyed by rank and ID, so a deep page does not rank and skip all posts before it again.
+    """
+
+    def search(
+            self, query: str, cursor: str = None, limit: int = POST_PAGE_SIZE, viewer: User = None
+    ) -> tuple[list[Post], str | None]:
+        """
+        Returns a page of the posts matching the query, best matches first.
+
+        :param query: Search query, in the syntax of web search engines (quoted phrases, "or", "-" for exclusion).
+        :param cursor: Cursor returned with the previous page, None for the first page.
+        :param limit: Maximum number of posts on the page.
+        :param viewer: User searching, posts of users blocked or muted by the viewer or blocking the viewer are
+            left out. None returns all matching posts.
+        :return: Posts of the page and the cursor of the next page, None if there are no more posts.
+        :raises ValidationError: If the query or the cursor is invalid.
+        """
+        search_query = self.get_search_query(query)
+        posts = (
+            Post.objects.filter(search_vector=search_query)
+            # ts_rank returns a real, its text form is rounded and would not compare equal to the cursor
+            .annotate(rank=Cast(SearchRank(F("search_vector"), search_query), FloatField()))
+            .select_related("user")
+            .order_by("-rank", "-id")
+        )
+
+        if cursor:
+            rank, post_id = decode_cursor(cursor, 2)
+            if not isinstance(rank, (int, float)) or not isinstance(post_id, int):
+                raise ValidationError({"cursor": "Invalid cursor."})
+            posts = posts.filter(Q(rank__lt=rank) | Q(rank=rank, id__lt=post_id))
+
+        page = list(posts[:limit])
+        next_cursor = encode_cursor(page[-1].rank, page[-1].id) if len(page) == limit else None
+
+        if viewer is not None:
+            page = UserFilterService().get_filter(viewer.id).filter_posts(page)
+
+        return page, next_cursor
+
+    @staticmethod
+    def get_search_query(query: str) -> SearchQuery:
+        """
+        Parses the search query.
+
+        Queries shorter than POST_SEARCH_PREFIX_MAX_LENGTH would hardly ever match a whole word, they match the
+        words starting with them instead, which the GIN index supports as well.
+
+        :param query: Search query.
+        :return: The parsed query.
+        :raises ValidationError: If the query is empty or too long.
+        """
+        query = (query or "").strip()
+        if not query:
+            raise ValidationError({"q": "Search query must not be empty."})
+        if len(query) > POST_SEARCH_MAX_QUERY_LENGTH:
+            raise ValidationError({"q": f"Search query must not exceed {POST_SEARCH_MAX_QUERY_LENGTH} characters."})
+
+        if len(query) < POST_SEARCH_PREFIX_MAX_LENGTH:
+            words = WORD_PATTERN.findall(query)
+            if not words:
+                raise ValidationError({"q": "Search query must contain a word."})
+            return SearchQuery(" & ".join(f"{word}:*" for word in words), search_type="raw", config=POST_SEARCH_CONFIG)
+
+        return SearchQuery(query, search_type="websearch", config=POST_SEARCH_CONFIG)
@@ -1,10 +1,46 @@
 import logging
+from datetime import datetime
 
+from django.db import connection
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+from redis.exceptions import RedisError
 from rest_framework.exceptions import ValidationError
 
 from accounts.models import User
+from followers.services.user_filter_service import UserFilterService
 from posts.models import Like, Post
+from posts.services.like_buffer_service import LikeBufferService
+from posts.services.like_counter_service import LikeCounterService
+from posts.services.post_tag_service import PostTagService
+from posts.services.trending_service import TrendingService
+from posts.settings.post_settings import LIKE_WRITE_BEHIND_ENABLED, LIKED_LOOKUP_MAX_POSTS, POST_PAGE_SIZE
 from posts.validators.content_validator import ContentValidator
+from timelines.services.author_posts_cache import AuthorPostsCache
+from timelines.services.home_timeline_service import HomeTimelineService
+from utils.cursor import decode_cursor, encode_cursor
+
+# Deletes the like if it exists and inserts it otherwise, in a single round trip. A like inserted concurrently by
+# another click ends up as a conflict, the post is liked either way. The time of a deleted like is returned, so
+# its trending score can be taken back.
+TOGGLE_LIKE_SQL = f"""
+    WITH deleted AS (
+        DELETE FROM {Like._meta.db_table}
+        WHERE post_id = %(post_id)s AND user_id = %(user_id)s
+        RETURNING id, "timestamp"
+    ), inserted AS (
+        INSERT INTO {Like._meta.db_table} (post_id, user_id, "timestamp")
+        SELECT id, %(user_id)s, %(timestamp)s FROM {Post._meta.db_table}
+        WHERE id = %(post_id)s AND NOT EXISTS (SELECT 1 FROM deleted)
+        ON CONFLICT (post_id, user_id) DO NOTHING
+        RETURNING id
+    )
+    SELECT
+        EXISTS (SELECT 1 FROM deleted) OR EXISTS (SELECT 1 FROM {Post._meta.db_table} WHERE id = %(post_id)s),
+        NOT EXISTS (SELECT 1 FROM deleted),
+        EXISTS (SELECT 1 FROM deleted) OR EXISTS (SELECT 1 FROM inserted),
+        (SELECT "timestamp" FROM deleted)
+"""
 
 
 class PostService:
@@ -24,11 +60,16 @@ class PostService:
         try:
             post = Post.objects.create(user=user, content=content)
             logging.info(f"User {user.username} created post with ID {post.id} and content: {content}")
-            return True
         except Exception as e:
             logging.error(f"Error occurred while creating post. {e}")
             raise ValidationError(f"Error occurred while creating post.")
 
+        PostTagService().index_post(post)
+        TrendingService().add_post(post)
+        AuthorPostsCache().add_post(post)
+        HomeTimelineService().fan_out_post(post)
+        return True
+
     @staticmethod
     def delete_post(user: User, post_id: int):
         """
@@ -41,12 +82,17 @@ class PostService:
         if post.user.id != user.id:
             raise ValidationError(f"User {user.username} does not hold the ownership of the post.")
 
+        author_id = post.user_id
         post.delete()
         logging.info(f"User {user.username} deleted post with ID {post_id}.")
+
+        AuthorPostsCache().invalidate(author_id)
+        HomeTimelineService().remove_post(int(post_id), author_id)
+        TrendingService().remove_post(int(post_id))
         return True
 
     @staticmethod
-    def toggle_like_post(user: User, post_id: int):
+    def toggle_like_post(user: User, post_id: int) -> bool:
         """
         Toggles the like status of a post for the user.
         If the user already liked the post, it will unlike it.
@@ -54,21 +100,149 @@ class PostService:
 
         :param user: User that liked/unliked the post.
         :param post_id: ID of the post.
-        :return: None
+        :return: True if the post is liked after the toggle, False otherwise.
         """
         try:
-            post = Post.objects.get(id=post_id)
-        except Post.DoesNotExist:
+            post_id = int(post_id)
+        except (TypeError, ValueError):
+            raise ValidationError(f"Post with ID {post_id} does not exist.")
+
+        # Users who blocked the user are known in memory, the author is only looked up if there are any
+        user_filter = UserFilterService().get_filter(user.id)
+        if user_filter.blocked_by_ids:
+            author_id = Post.objects.filter(id=post_id).values_list("user_id", flat=True).first()
+            if author_id is not None and user_filter.is_blocked_by(author_id):
+                raise ValidationError(f"You cannot like the posts of user {author_id}.")
+
+        post_exists, liked, changed, liked_at = PostService.__toggle_like(user, post_id)
+        if not post_exists:
             raise ValidationError(f"Post with ID {post_id} does not exist.")
 
-        # Check if the user already liked the post
-        existing_like = Like.objects.filter(user=user, post=post).first()
-
-        if existing_like:
-            # If already liked, remove like (unlike)
-            logging.info(f"User {user.username} unliked post {post.id}.")
-            existing_like.delete()
-        else:
-            # If not liked yet, create a like relationship
-            Like.objects.create(user=user, post=post)
-            logging.info(f"User {user.username} liked post {post.id}.")
+        # A click that lost the race against a concurrent like of the same user does not change the count
+        if changed:
+            LikeCounterService().add(post_id, 1 if liked else -1)
+            TrendingService().add_like(post_id, liked, liked_at)
+
+        logging.info(f"User {user.username} {'liked' if liked else 'unliked'} post {post_id}.")
+        return liked
+
+    @staticmethod
+    def has_liked_post(user: User, post_id: int) -> bool:
+        """
+        Checks whether the user liked a post, including likes still in the write-behind buffer.
+
+        :param user: The user.
+        :param post_id: ID of the post.
+        :return: True if the post is liked.
+        """
+        return post_id in PostService.get_liked_post_ids(user, [post_id])
+
+    @staticmethod
+    def get_liked_post_ids(user: User, post_ids: list[int]) -> set[int]:
+        """
+        Returns which of the posts the user liked, with a single query for any number of posts.
+
+        :param user: The user.
+        :param post_ids: IDs of the posts, at most LIKED_LOOKUP_MAX_POSTS.
+        :return: IDs of the liked posts.
+        :raises ValidationError: If too many posts are requested.
+        """
+        if len(post_ids) > LIKED_LOOKUP_MAX_POSTS:
+            raise ValidationError({"post_ids": f"At most {LIKED_LOOKUP_MAX_POSTS} posts can be looked up at once."})
+
+        liked_post_ids = set()
+        post_ids = set(post_ids)
+
+        # Buffered toggles are newer than the likes table
+        if LIKE_WRITE_BEHIND_ENABLED and post_ids:
+            try:
+                buffered_states = LikeBufferService().get_buffered_states(user.id, list(post_ids))
+                liked_post_ids = {post_id for post_id, liked in buffered_states.items() if liked}
+                post_ids -= buffered_states.keys()
+            except RedisError as e:
+                logging.error(f"Failed to read buffered likes of user {user.id}: {e}")
+
+        if post_ids:
+            liked_post_ids.update(
+                Like.objects.filter(user=user, post_id__in=post_ids).values_list("post_id", flat=True)
+            )
+
+        return liked_post_ids
+
+    def get_user_posts(
+            self, user: User, cursor: str = None, limit: int = POST_PAGE_SIZE
+    ) -> tuple[list[Post], str | None]:
+        """
+        Returns a page of the posts of a user, newest first.
+
+        :param user: Author of the posts.
+        :param cursor: Cursor returned with the previous page, None for the first page.
+        :param limit: Maximum number of posts on the page.
+        :return: Posts of the page and the cursor of the next page, None if there are no more posts.
+        """
+        return self.__get_page(Post.objects.filter(user=user), cursor, limit)
+
+    def get_recent_posts(self, cursor: str = None, limit: int = POST_PAGE_SIZE) -> tuple[list[Post], str | None]:
+        """
+        Returns a page of the posts of all users, newest first.
+
+        :param cursor: Cursor returned with the previous page, None for the first page.
+        :param limit: Maximum number of posts on the page.
+        :return: Posts of the page and the cursor of the next page, None if there are no more posts.
+        """
+        return self.__get_page(Post.objects.all(), cursor, limit)
+
+    @staticmethod
+    def get_page_queryset(posts: QuerySet, cursor: str | None, id_field: str = "id") -> QuerySet:
+        """
+        Orders the posts newest first and starts them after the position stored in the cursor.
+
+        The cursor holds the timestamp and ID of the last post of the previous page. Filtering on them instead of
+        an offset lets the (timestamp, id) indexes seek straight to the page, however deep it is.
+
+        :param posts: Posts to paginate, or rows referencing posts that carry the timestamp of their post.
+        :param cursor: Cursor returned with the previous page, None for the first page.
+        :param id_field: Name of the field holding the post ID.
+        :return: The ordered posts of the page and all following pages.
+        :raises ValidationError: If the cursor is malformed.
+        """
+        posts = posts.order_by("-timestamp", f"-{id_field}")
+        if not cursor:
+            return posts
+
+        timestamp, post_id = decode_cursor(cursor, 2)
+        try:
+            timestamp = datetime.fromisoformat(timestamp)
+        except (TypeError, ValueError):
+            raise ValidationError({"cursor": "Invalid cursor."})
+        if not isinstance(post_id, int):
+            raise ValidationError({"cursor": "Invalid cursor."})
+
+        # The timestamp bound is the range condition of the index scan, the ID only breaks ties
+        return posts.filter(Q(timestamp__lt=timestamp) | Q(**{f"{id_field}__lt": post_id}), timestamp__lte=timestamp)
+
+    def __get_page(self, posts: QuerySet, cursor: str | None, limit: int) -> tuple[list[Post], str | None]:
+        page = list(self.get_page_queryset(posts, cursor).select_related("user")[:limit])
+
+        next_cursor = None
+        if len(page) == limit:
+            next_cursor = encode_cursor(page[-1].timestamp.isoformat(), page[-1].id)
+
+        return page, next_cursor
+
+    @staticmethod
+    def __toggle_like(user: User, post_id: int) -> tuple[bool, bool, bool, datetime | None]:
+        """
+        :return: Whether the post exists, whether it is liked after the toggle, whether a like was changed and
+            the time of the removed like, None if it is not known.
+        """
+        if LIKE_WRITE_BEHIND_ENABLED:
+            try:
+                post_exists, liked = LikeBufferService().toggle(user.id, post_id)
+                return post_exists, liked, post_exists, None
+            except RedisError as e:
+                logging.error(f"Failed to buffer the like of post {post_id}, writing it directly: {e}")
+
+        with connection.cursor() as cursor:
+            cursor.execute(TOGGLE_LIKE_SQL, {"post_id": post_id, "user_id": user.id, "timestamp": timezone.now()})
+            return cursor.fetchone()
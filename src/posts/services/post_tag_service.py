@@ -0,0 +1,117 @@
+import re
+
+from django.db.models.functions import Upper
+
+from accounts.models import User
+from posts.models import Post, PostHashtag, PostMention
+from posts.settings.post_settings import POST_HASHTAG_MAX_LENGTH, POST_MAX_HASHTAGS, POST_MAX_MENTIONS, POST_PAGE_SIZE
+from utils.cursor import encode_cursor
+
+HASHTAG_PATTERN = re.compile(rf"(?<![\w#])#(\w{{1,{POST_HASHTAG_MAX_LENGTH}}})(?!\w)")
+# Mentions follow the username constraints, see USERNAME_REGEX
+MENTION_PATTERN = re.compile(r"(?<![\w@])@([A-Za-z][A-Za-z0-9_]{2,14})(?!\w)")
+
+
+class PostTagService:
+    """
+    Indexes the hashtags and mentions of the posts when they are created.
+
+    The inverted index tables copy the timestamp of the post, so the posts with a hashtag or mentioning a user are
+    paginated with a range scan over a single composite index.
+    """
+
+    @staticmethod
+    def extract_hashtags(content: str) -> list[str]:
+        """
+        :return: Distinct hashtags of the content without the '#', lower-cased, in order of appearance.
+        """
+        # Lower-casing can lengthen a tag ('İ' becomes two characters), tags that no longer fit are not indexed
+        hashtags = dict.fromkeys(
+            tag for tag in (tag.lower() for tag in HASHTAG_PATTERN.findall(content))
+            if len(tag) <= POST_HASHTAG_MAX_LENGTH
+        )
+        return list(hashtags)[:POST_MAX_HASHTAGS]
+
+    @staticmethod
+    def extract_mentions(content: str) -> list[str]:
+        """
+        :return: Distinct mentioned usernames of the content without the '@', in order of appearance.
+        """
+        mentions = dict.fromkeys(username.upper() for username in MENTION_PATTERN.findall(content))
+        return list(mentions)[:POST_MAX_MENTIONS]
+
+    def index_post(self, post: Post) -> None:
+        """
+        Stores the hashtags and the mentioned users of a post.
+
+        Mentions are resolved with a single query on the case-insensitive username index, mentions of unknown
+        users are ignored.
+
+        :param post: The created post.
+        """
+        hashtags = self.extract_hashtags(post.content)
+        usernames = self.extract_mentions(post.content)
+
+        if hashtags:
+            PostHashtag.objects.bulk_create(
+                [PostHashtag(tag=tag, post=post, timestamp=post.timestamp) for tag in hashtags],
+                ignore_conflicts=True,
+            )
+
+        if usernames:
+            user_ids = (
+                User.objects.annotate(username_upper=Upper("username"))
+                .filter(username_upper__in=usernames)
+                .values_list("id", flat=True)
+            )
+            PostMention.objects.bulk_create(
+                [PostMention(user_id=user_id, post=post, timestamp=post.timestamp) for user_id in user_ids],
+                ignore_conflicts=True,
+            )
+
+    def get_posts_with_hashtag(
+            self, tag: str, cursor: str = None, limit: int = POST_PAGE_SIZE
+    ) -> tuple[list[Post], str | None]:
+        """
+        Returns a page of the posts using a hashtag, newest first.
+
+        :param tag: The hashtag, with or without the '#'.
+        :param cursor: Cursor returned with the previous page, None for the first page.
+        :param limit: Maximum number of posts on the page.
+        :return: Posts of the page and the cursor of the next page, None if there are no more posts.
+        """
+        tag = tag.removeprefix("#").lower()
+        return self.__get_page(PostHashtag.objects.filter(tag=tag), cursor, limit)
+
+    def get_posts_mentioning(
+            self, user: User, cursor: str = None, limit: int = POST_PAGE_SIZE
+    ) -> tuple[list[Post], str | None]:
+        """
+        Returns a page of the posts mentioning a user, newest first.
+
+        :param user: The mentioned user.
+        :param cursor: Cursor returned with the previous page, None for the first page.
+        :param limit: Maximum number of posts on the page.
+        :return: Posts of the page and the cursor of the next page, None if there are no more posts.
+        """
+        return self.__get_page(PostMention.objects.filter(user=user), cursor, limit)
+
+    @staticmethod
+    def __get_page(entries, cursor: str | None, limit: int) -> tuple[list[Post], str | None]:
+        # Imported here, the post service indexes the created posts with this service
+        from posts.services.post_service import PostService
+
+        entries = list(
+            PostService.get_page_queryset(entries, cursor, id_field="post_id").values_list("post_id", "timestamp")[
+                :limit
+            ]
+        )
+        posts_by_id = Post.objects.select_related("user").in_bulk([post_id for post_id, _ in entries])
+
+        posts = [posts_by_id[post_id] for post_id, _ in entries if post_id in posts_by_id]
+        next_cursor = None
+        if len(entries) == limit:
+            post_id, timestamp = entries[-1]
+            next_cursor = encode_cursor(timestamp.isoformat(), post_id)
+
+        return posts, next_cursor
@@ -0,0 +1,184 @@
+import logging
+import math
+import time
+from datetime import datetime
+
+from redis.exceptions import RedisError
+
+from posts.models import Post
+from posts.services.post_tag_service import PostTagService
+from posts.settings.post_settings import (
+    TRENDING_HALF_LIFE,
+    TRENDING_KEY_PREFIX,
+    TRENDING_LIKE_WEIGHT,
+    TRENDING_MAX_ENTRIES,
+    TRENDING_MIN_SCORE,
+    TRENDING_PAGE_SIZE,
+    TRENDING_POST_WEIGHT,
+)
+from utils.redis_client import get_redis_client
+
+# Adds weight * 2^((now - epoch) / half-life) to members of the sorted sets (KEYS[2..]). Scaling the weight up
+# with the time since the epoch (KEYS[1]) ranks the entries as if all older scores had decayed, without touching
+# them. ARGV[1] is the current time, ARGV[2] the half-life and ARGV[3..] pairs of weight and member.
+BUMP_SCRIPT = """
+local now = tonumber(ARGV[1])
+local epoch = tonumber(redis.call("GET", KEYS[1]))
+if not epoch then
+    epoch = now
+    redis.call("SET", KEYS[1], epoch)
+end
+
+local scale = 2 ^ ((now - epoch) / tonumber(ARGV[2]))
+for index = 2, #KEYS do
+    local argument = 3 + (index - 2) * 2
+    redis.call("ZINCRBY", KEYS[index], tonumber(ARGV[argument]) * scale, ARGV[argument + 1])
+end
+return 1
+"""
+
+# Moves the epoch (KEYS[1]) to the current time (ARGV[1]) and decays the sorted sets (KEYS[2..]) to it, so the
+# scale of new bumps starts from 1 again instead of growing until the scores overflow. Entries that decayed
+# below ARGV[3] and all but the ARGV[4] highest entries are dropped.
+REBASE_SCRIPT = """
+local now = tonumber(ARGV[1])
+local epoch = tonumber(redis.call("GET", KEYS[1]))
+if not epoch then
+    return 0
+end
+
+local factor = 2 ^ ((epoch - now) / tonumber(ARGV[2]))
+for index = 2, #KEYS do
+    redis.call("ZUNIONSTORE", KEYS[index], 1, KEYS[index], "WEIGHTS", factor)
+    redis.call("ZREMRANGEBYSCORE", KEYS[index], "-inf", "(" .. ARGV[3])
+    redis.call("ZREMRANGEBYRANK", KEYS[index], 0, -tonumber(ARGV[4]) - 1)
+end
+redis.call("SET", KEYS[1], now)
+return 1
+"""
+
+
+class TrendingService:
+    """
+    Keeps the trending posts and hashtags in Redis sorted sets.
+
+    The score of an entry is its engagement, each post or like weighted by 2^(-age / TRENDING_HALF_LIFE). Instead
+    of decaying every score as time passes, new engagement is weighted up relative to a stored epoch, so an event
+    is a single ZINCRBY and the top entries are read with a single ZREVRANGE. The periodic rebase moves the epoch
+    forward before the weights grow large enough to overflow.
+    """
+
+    def __init__(self):
+        self.redis_client = get_redis_client()
+        self.bump_script = self.redis_client.register_script(BUMP_SCRIPT)
+        self.rebase_script = self.redis_client.register_script(REBASE_SCRIPT)
+
+    def add_post(self, post: Post) -> None:
+        """
+        Scores a new post and the hashtags it uses.
+
+        :param post: The created post.
+        """
+        entries = [(self.__get_posts_key(), TRENDING_POST_WEIGHT, post.id)]
+        entries += [
+            (self.__get_hashtags_key(), TRENDING_POST_WEIGHT, tag)
+            for tag in PostTagService.extract_hashtags(post.content)
+        ]
+        self.__bump(entries)
+
+    def add_like(self, post_id: int, liked: bool, liked_at: datetime = None) -> None:
+        """
+        Scores a like of a post, or takes back the score of a removed like.
+
+        The score of a removed like is taken back at the weight it was added with. If the time of the like is not
+        known, e.g. for a like still in the write-behind buffer, the unlike counts as new negative engagement.
+
+        :param post_id: ID of the post.
+        :param liked: True for a new like, False for a removed one.
+        :param liked_at: Time of the removed like.
+        """
+        weight = TRENDING_LIKE_WEIGHT if liked else -TRENDING_LIKE_WEIGHT
+        at = liked_at.timestamp() if not liked and liked_at is not None else None
+        self.__bump([(self.__get_posts_key(), weight, post_id)], at)
+
+    def remove_post(self, post_id: int) -> None:
+        """
+        Removes a deleted post from the trending posts.
+
+        :param post_id: ID of the post.
+        """
+        try:
+            self.redis_client.zrem(self.__get_posts_key(), post_id)
+        except RedisError as e:
+            logging.error(f"Failed to remove post {post_id} from the trending posts: {e}")
+
+    def get_trending_posts(self, limit: int = TRENDING_PAGE_SIZE) -> list[Post]:
+        """
+        Returns the trending posts, highest score first.
+
+        :param limit: Maximum number of posts.
+        :return: The trending posts, posts deleted meanwhile are left out.
+        """
+        post_ids = [int(post_id) for post_id, _ in self.__get_top(self.__get_posts_key(), limit)]
+        posts_by_id = Post.objects.select_related("user").in_bulk(post_ids)
+
+        return [posts_by_id[post_id] for post_id in post_ids if post_id in posts_by_id]
+
+    def get_trending_hashtags(self, limit: int = TRENDING_PAGE_SIZE) -> list[tuple[str, float]]:
+        """
+        Returns the trending hashtags, highest score first.
+
+        :param limit: Maximum number of hashtags.
+        :return: Hashtag and its score decayed to the current time.
+        """
+        return [(tag.decode(), score) for tag, score in self.__get_top(self.__get_hashtags_key(), limit)]
+
+    def rebase(self) -> None:
+        """
+        Decays the scores to the current time and moves the epoch to it. Drops the entries that stopped trending.
+        """
+        keys = [self.__get_epoch_key(), self.__get_posts_key(), self.__get_hashtags_key()]
+        self.rebase_script(keys=keys, args=[time.time(), TRENDING_HALF_LIFE, TRENDING_MIN_SCORE, TRENDING_MAX_ENTRIES])
+        logging.info("Rebased the trending scores.")
+
+    def __bump(self, entries: list[tuple[str, float, int | str]], at: float = None) -> None:
+        # Engagement is weighted by the time it happened, relative to the epoch
+        args = [at if at is not None else time.time(), TRENDING_HALF_LIFE]
+        for _, weight, member in entries:
+            args += [weight, member]
+
+        try:
+            self.bump_script(keys=[self.__get_epoch_key()] + [key for key, _, _ in entries], args=args)
+        except RedisError as e:
+            # Trending is best effort, engagement missed while Redis is unavailable is not scored
+            logging.error(f"Failed to update the trending scores: {e}")
+
+    def __get_top(self, key: str, limit: int) -> list[tuple[bytes, float]]:
+        try:
+            pipeline = self.redis_client.pipeline(transaction=True)
+            pipeline.get(self.__get_epoch_key())
+            pipeline.zrevrange(key, 0, limit - 1, withscores=True)
+            epoch, entries = pipeline.execute()
+        except RedisError as e:
+            # Trending is best effort, nothing is trending while Redis is unavailable
+            logging.error(f"Failed to read the trending entries of {key}: {e}")
+            return []
+
+        if epoch is None:
+            return []
+
+        # Scores are relative to the epoch, decaying them to the current time makes them comparable across rebases
+        factor = math.pow(2, (float(epoch) - time.time()) / TRENDING_HALF_LIFE)
+        return [(member, score * factor) for member, score in entries if score > 0]
+
+    @staticmethod
+    def __get_epoch_key() -> str:
+        return f"{TRENDING_KEY_PREFIX}:epoch"
+
+    @staticmethod
+    def __get_posts_key() -> str:
+        return f"{TRENDING_KEY_PREFIX}:posts"
+
+    @staticmethod
+    def __get_hashtags_key() -> str:
+        return f"{TRENDING_KEY_PREFIX}:hashtags"
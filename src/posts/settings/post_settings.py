@@ -1,2 +1,43 @@
+from environ import environ
+
+env = environ.Env()
+
 POST_MIN_LENGTH = 1
-POST_MAX_LENGTH = 1000
\ No newline at end of file
+POST_MAX_LENGTH = 1000
+
+POST_PAGE_SIZE = 20
+POST_MAX_PAGE_SIZE = 100
+LIKED_LOOKUP_MAX_POSTS = 500  # Posts per "has the viewer liked" lookup
+
+# Full-text search of the post content
+POST_SEARCH_CONFIG = "english"  # Text search configuration of the search vector, changing it needs a migration
+POST_SEARCH_PREFIX_MAX_LENGTH = 3  # Shorter queries match words starting with them instead of whole words
+POST_SEARCH_MAX_QUERY_LENGTH = 200
+
+# Like counts are buffered in sharded Redis hashes and flushed to the posts periodically
+LIKE_COUNTER_KEY_PREFIX = "like_counts"
+LIKE_COUNTER_SHARDS = 16
+LIKE_COUNTER_FLUSH_INTERVAL = 5  # Seconds
+LIKE_COUNT_RECONCILE_BATCH_SIZE = 1000  # Posts recounted per UPDATE
+
+# Write-behind mode buffers like toggles in Redis and writes them to the likes in batches
+LIKE_WRITE_BEHIND_ENABLED = env.bool("LIKE_WRITE_BEHIND_ENABLED", default=False)
+LIKE_BUFFER_KEY_PREFIX = "like_buffer"
+LIKE_BUFFER_FLUSH_INTERVAL = 1  # Seconds
+LIKE_BUFFER_FLUSH_BATCH_SIZE = 500  # Posts flushed per transaction
+
+# Hashtags and mentions indexed when a post is created
+POST_HASHTAG_MAX_LENGTH = 100
+POST_MAX_HASHTAGS = 30  # Further hashtags of a post are not indexed
+POST_MAX_MENTIONS = 30  # Further mentions of a post are not indexed
+
+# Trending posts and hashtags, scored by engagement that loses half its weight every half-life
+TRENDING_KEY_PREFIX = "trending"
+TRENDING_HALF_LIFE = 6 * 60 * 60  # Seconds
+TRENDING_POST_WEIGHT = 1.0  # Score of a new post, and of a hashtag per post using it
+TRENDING_LIKE_WEIGHT = 1.0  # Score of a like, removed again by the unlike
+TRENDING_MIN_SCORE = 0.05  # Entries that decayed below it are dropped by the rebase
+TRENDING_MAX_ENTRIES = 10000  # Entries kept per sorted set by the rebase
+TRENDING_REBASE_INTERVAL = 60 * 60  # Seconds
+TRENDING_PAGE_SIZE = 20
+TRENDING_MAX_PAGE_SIZE = 100
@@ -0,0 +1,184 @@
+from unittest.mock import patch
+
+import pytest
+from redis.exceptions import RedisError
+from rest_framework.exceptions import ValidationError
+
+from accounts.models import User
+from posts.models import Like, Post
+from posts.services.like_buffer_service import LikeBufferService
+from posts.services.post_service import PostService
+
+
+@pytest.fixture
+def write_behind():
+    with patch("posts.services.post_service.LIKE_WRITE_BEHIND_ENABLED", True):
+        yield
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(username="user1", cognito_id="user123")
+
+
+@pytest.fixture
+def post(user):
+    return Post.objects.create(user=user, content="Test post content")
+
+
+@pytest.mark.django_db
+def test_toggle_like_post_in_write_behind_mode_should_not_write_like(redis_client, write_behind, user, post):
+    # Act
+    liked = PostService.toggle_like_post(user, post.id)
+
+    # Assert
+    assert liked is True
+    assert not Like.objects.filter(post=post, user=user).exists()
+    assert PostService.has_liked_post(user, post.id) is True
+
+
+@pytest.mark.django_db
+def test_toggle_like_post_in_write_behind_mode_should_toggle_buffered_state(
+        redis_client, write_behind, user, post, django_assert_num_queries
+):
+    # Assign
+    PostService.toggle_like_post(user, post.id)
+
+    # Act & Assert
+    # The state of the first toggle is read from the database, the following ones only use the buffer
+    with django_assert_num_queries(0):
+        liked = PostService.toggle_like_post(user, post.id)
+
+    assert liked is False
+    assert PostService.has_liked_post(user, post.id) is False
+
+
+@pytest.mark.django_db
+def test_toggle_like_post_in_write_behind_mode_should_unlike_stored_like(redis_client, write_behind, user, post):
+    # Assign
+    Like.objects.create(post=post, user=user)
+
+    # Act
+    liked = PostService.toggle_like_post(user, post.id)
+
+    # Assert
+    assert liked is False
+    assert PostService.has_liked_post(user, post.id) is False
+
+
+@pytest.mark.django_db
+def test_toggle_like_post_in_write_behind_mode_with_missing_post_should_raise_validation_error(
+        redis_client, write_behind, user
+):
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        PostService.toggle_like_post(user, -1)
+
+
+@pytest.mark.django_db
+def test_flush_should_write_buffered_likes_and_unlikes(redis_client, write_behind, user, post):
+    # Assign
+    other_users = [
+        User.objects.create(username=f"user{index}", email=f"user{index}@email.com", cognito_id=f"user{index}")
+        for index in range(2, 5)
+    ]
+    Like.objects.create(post=post, user=other_users[0])
+    for other_user in other_users:
+        PostService.toggle_like_post(other_user, post.id)
+
+    # Act
+    count = LikeBufferService().flush()
+
+    # Assert
+    assert count == 1
+    assert set(Like.objects.filter(post=post).values_list("user_id", flat=True)) == {
+        other_users[1].id, other_users[2].id
+    }
+    assert PostService.has_liked_post(other_users[0], post.id) is False
+    assert not redis_client.keys("like_buffer:*")
+
+
+@pytest.mark.django_db
+def test_flush_with_deleted_post_should_drop_buffered_likes(redis_client, write_behind, user, post):
+    # Assign
+    PostService.toggle_like_post(user, post.id)
+    Post.objects.filter(id=post.id).delete()
+
+    # Act
+    LikeBufferService().flush()
+
+    # Assert
+    assert not Like.objects.exists()
+
+
+@pytest.mark.django_db
+def test_flush_with_post_deleted_while_flushing_should_write_other_likes(redis_client, write_behind, user, post):
+    # Assign
+    other_post = Post.objects.create(user=user, content="Other post content")
+    PostService.toggle_like_post(user, post.id)
+    PostService.toggle_like_post(user, other_post.id)
+    service = LikeBufferService()
+    pipeline = service.redis_client.pipeline
+
+    def pipeline_deleting_post(*args, **kwargs):
+        # The post is deleted once the buffered states are read, before the likes are written
+        states_pipeline = pipeline(*args, **kwargs)
+        execute = states_pipeline.execute
+
+        def execute_then_delete_post():
+            states = execute()
+            Post.objects.filter(id=post.id).delete()
+            return states
+
+        states_pipeline.execute = execute_then_delete_post
+        return states_pipeline
+
+    # Act
+    with patch.object(service.redis_client, "pipeline", side_effect=pipeline_deleting_post):
+        service.flush()
+
+    # Assert
+    assert list(Like.objects.values_list("post_id", flat=True)) == [other_post.id]
+    assert not redis_client.keys("like_buffer:*")
+
+
+@pytest.mark.django_db
+def test_flush_with_deleted_liker_should_write_other_likes(redis_client, write_behind, user, post):
+    # Assign
+    liker = User.objects.create(username="liker", email="liker@email.com", cognito_id="liker123")
+    PostService.toggle_like_post(user, post.id)
+    PostService.toggle_like_post(liker, post.id)
+    liker.delete()
+
+    # Act
+    LikeBufferService().flush()
+
+    # Assert
+    assert list(Like.objects.values_list("user_id", flat=True)) == [user.id]
+    assert not redis_client.keys("like_buffer:*")
+
+
+@pytest.mark.django_db
+def test_toggle_like_post_with_redis_error_should_write_like(write_behind, user, post):
+    # Act
+    with patch.object(LikeBufferService, "toggle", side_effect=RedisError):
+        liked = PostService.toggle_like_post(user, post.id)
+
+    # Assert
+    assert liked is True
+    assert Like.objects.filter(post=post, user=user).exists()
+
+
+@pytest.mark.django_db
+def test_get_liked_post_ids_in_write_behind_mode_should_prefer_buffered_states(redis_client, write_behind, user, post):
+    # Assign
+    other_post = Post.objects.create(user=user, content="Other post content")
+    Like.objects.create(post=post, user=user)
+    Like.objects.create(post=other_post, user=user)
+    PostService.toggle_like_post(user, post.id)
+
+    # Act
+    liked_post_ids = PostService.get_liked_post_ids(user, [post.id, other_post.id])
+
+    # Assert
+    assert liked_post_ids == {other_post.id}
@@ -0,0 +1,165 @@
+from unittest.mock import patch
+
+import pytest
+from redis.exceptions import RedisError
+
+from accounts.models import User
+from posts.models import Like, Post
+from posts.services.like_buffer_service import LikeBufferService
+from posts.services.like_counter_service import LikeCounterService
+from posts.services.post_service import PostService
+from posts.settings.post_settings import LIKE_COUNTER_KEY_PREFIX
+
+
+@pytest.fixture
+def post():
+    user = User.objects.create(username="user1", cognito_id="user123")
+    return Post.objects.create(user=user, content="Test post content")
+
+
+@pytest.fixture
+def users():
+    return [
+        User.objects.create(username=f"liker{index}", email=f"liker{index}@email.com", cognito_id=f"liker{index}")
+        for index in range(3)
+    ]
+
+
+@pytest.mark.django_db
+def test_flush_after_toggles_should_update_like_count(redis_client, post, users):
+    # Assign
+    for user in users:
+        PostService.toggle_like_post(user, post.id)
+    PostService.toggle_like_post(users[0], post.id)
+
+    # Act
+    count = LikeCounterService().flush()
+
+    # Assert
+    post.refresh_from_db()
+    assert count == 1
+    assert post.like_count == 2
+
+
+@pytest.mark.django_db
+def test_flush_should_update_all_posts_with_single_query(redis_client, post, django_assert_num_queries):
+    # Assign
+    other_post = Post.objects.create(user=post.user, content="Other post content")
+    like_counter_service = LikeCounterService()
+    for _ in range(5):
+        like_counter_service.add(post.id, 1)
+    like_counter_service.add(other_post.id, 1)
+    like_counter_service.add(other_post.id, -1)
+    like_counter_service.add(other_post.id, 1)
+
+    # Act & Assert
+    # The statements around the UPDATE are the savepoint of the flush transaction
+    with django_assert_num_queries(3) as captured:
+        like_counter_service.flush()
+    assert [query["sql"].split()[0] for query in captured.captured_queries] == ["SAVEPOINT", "UPDATE", "RELEASE"]
+
+    post.refresh_from_db()
+    other_post.refresh_from_db()
+    assert post.like_count == 5
+    assert other_post.like_count == 1
+
+
+@pytest.mark.django_db
+def test_get_pending_should_sum_unflushed_deltas(redis_client, post):
+    # Assign
+    like_counter_service = LikeCounterService()
+    for _ in range(3):
+        like_counter_service.add(post.id, 1)
+
+    # Act
+    pending = like_counter_service.get_pending([post.id])
+
+    # Assert
+    assert pending == {post.id: 3}
+
+
+@pytest.mark.django_db
+def test_flush_with_shard_left_by_failed_flush_should_apply_it(redis_client, post):
+    # Assign
+    redis_client.hset(f"{LIKE_COUNTER_KEY_PREFIX}:0:flushing", post.id, 2)
+    # Changes of the shard left over are only taken by the following flush
+    with patch("posts.services.like_counter_service.random.randrange", return_value=1):
+        LikeCounterService().add(post.id, 1)
+
+    # Act
+    LikeCounterService().flush()
+
+    # Assert
+    post.refresh_from_db()
+    assert post.like_count == 3
+    assert not redis_client.keys(f"{LIKE_COUNTER_KEY_PREFIX}:*")
+
+
+@pytest.mark.django_db
+def test_add_with_redis_error_should_update_post(post):
+    # Assign
+    like_counter_service = LikeCounterService()
+
+    # Act
+    with patch.object(like_counter_service.redis_client, "hincrby", side_effect=RedisError):
+        like_counter_service.add(post.id, 1)
+
+    # Assert
+    post.refresh_from_db()
+    assert post.like_count == 1
+
+
+@pytest.mark.django_db
+def test_reconcile_should_correct_drifted_counts(redis_client, post, users):
+    # Assign
+    for user in users:
+        Like.objects.create(post=post, user=user)
+    other_post = Post.objects.create(user=post.user, content="Other post content", like_count=4)
+
+    # Act
+    count = LikeCounterService().reconcile(batch_size=1)
+
+    # Assert
+    post.refresh_from_db()
+    other_post.refresh_from_db()
+    assert count == 2
+    assert post.like_count == 3
+    assert other_post.like_count == 0
+
+
+@pytest.mark.django_db
+def test_reconcile_with_pending_changes_should_leave_them_to_flush(redis_client, post, users):
+    # Assign
+    for user in users:
+        PostService.toggle_like_post(user, post.id)
+    like_counter_service = LikeCounterService()
+
+    # Act
+    count = like_counter_service.reconcile()
+    like_counter_service.flush()
+
+    # Assert
+    post.refresh_from_db()
+    assert count == 0
+    assert post.like_count == 3
+
+
+@pytest.mark.django_db
+def test_reconcile_with_buffered_toggles_should_leave_them_to_flush(redis_client, post, users):
+    # Assign
+    Like.objects.create(post=post, user=users[0])
+    Post.objects.filter(id=post.id).update(like_count=1)
+    with patch("posts.services.post_service.LIKE_WRITE_BEHIND_ENABLED", True):
+        for user in users:
+            PostService.toggle_like_post(user, post.id)
+    like_counter_service = LikeCounterService()
+
+    # Act
+    count = like_counter_service.reconcile()
+    like_counter_service.flush()
+    LikeBufferService().flush()
+
+    # Assert
+    post.refresh_from_db()
+    assert count == 0
+    assert post.like_count == Like.objects.filter(post=post).count() == 2
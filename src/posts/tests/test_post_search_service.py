@@ -0,0 +1,95 @@
+import pytest
+from django.db import connection
+from rest_framework.exceptions import ValidationError
+
+from accounts.models import User
+from posts.models import Post
+from posts.services.post_search_service import PostSearchService
+from posts.services.post_service import PostService
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(username="user1", cognito_id="user123")
+
+
+@pytest.mark.django_db
+def test_search_should_rank_better_matches_first(user):
+    # Assign
+    Post.objects.create(user=user, content="Nothing to see here")
+    weak_match = Post.objects.create(user=user, content="A long walk along the river in the rain")
+    strong_match = Post.objects.create(user=user, content="River, river, river!")
+
+    # Act
+    posts, next_cursor = PostSearchService().search("rivers")
+
+    # Assert
+    assert posts == [strong_match, weak_match]
+    assert next_cursor is None
+
+
+@pytest.mark.django_db
+def test_search_should_page_with_cursor(user):
+    # Assign
+    posts = [Post.objects.create(user=user, content=f"Coffee number {index}") for index in range(5)]
+    search_service = PostSearchService()
+
+    # Act
+    first_page, cursor = search_service.search("coffee", limit=3)
+    second_page, last_cursor = search_service.search("coffee", cursor, limit=3)
+
+    # Assert
+    assert sorted(post.id for post in first_page + second_page) == sorted(post.id for post in posts)
+    assert len(second_page) == 2
+    assert last_cursor is None
+
+
+@pytest.mark.django_db
+def test_search_with_short_query_should_match_word_prefixes(user):
+    # Assign
+    post = Post.objects.create(user=user, content="Django is great")
+
+    # Act
+    posts, _ = PostSearchService().search("dj")
+
+    # Assert
+    assert posts == [post]
+
+
+@pytest.mark.django_db
+def test_search_after_delete_post_should_not_return_post(user):
+    # Assign
+    PostService().create_post(user, "Searchable post")
+    post = Post.objects.get(user=user)
+    PostService.delete_post(user, post.id)
+
+    # Act
+    posts, _ = PostSearchService().search("searchable")
+
+    # Assert
+    assert posts == []
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("query", ["", "   ", "x" * 201, "!"])
+def test_search_with_invalid_query_should_raise_validation_error(query):
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        PostSearchService().search(query)
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="Query plans are specific to PostgreSQL")
+def test_search_should_use_gin_index(user):
+    # Assign
+    Post.objects.bulk_create(Post(user=user, content=f"Post number {index}") for index in range(500))
+    search_query = PostSearchService.get_search_query("number")
+
+    # Act
+    with connection.cursor() as db_cursor:
+        db_cursor.execute(f"ANALYZE {Post._meta.db_table}")
+        db_cursor.execute("SET LOCAL enable_seqscan = off")
+    plan = Post.objects.filter(search_vector=search_query).explain()
+
+    # Assert
+    assert "post_search_vector_idx" in plan
@@ -1,11 +1,17 @@
+import threading
+from datetime import timedelta
 from unittest.mock import Mock
 
 import pytest
+from django.db import connection
+from django.utils import timezone
 from rest_framework.exceptions import ValidationError
 
 from accounts.models import User
+from followers.services.user_filter_service import UserFilterService
 from posts.models import Like, Post
 from posts.services.post_service import PostService
+from posts.settings.post_settings import LIKED_LOOKUP_MAX_POSTS
 from posts.validators.content_validator import ContentValidator
 
 
@@ -76,7 +82,7 @@ def test_toggle_like_post_like():
     result = PostService.toggle_like_post(user, post.id)
 
     # Assert
-    assert result is None  # No return value expected
+    assert result is True
     assert Like.objects.filter(user=user, post=post).exists()
 
 
@@ -91,7 +97,7 @@ def test_toggle_like_post_unlike():
     result = PostService.toggle_like_post(user, post.id)
 
     # Assert
-    assert result is None
+    assert result is False
     assert not Like.objects.filter(user=user, post=post).exists()
 
 
@@ -115,5 +121,171 @@ def test_toggle_like_post_already_liked():
 
     # Act & Assert
     result = PostService.toggle_like_post(user, post.id)
-    assert result is None
+    assert result is False
     assert not Like.objects.filter(user=user, post=post).exists()
+
+
+@pytest.mark.django_db
+def test_toggle_like_post_should_use_single_query(django_assert_num_queries):
+    # Assign
+    user = User.objects.create(username="user1", cognito_id="user123")
+    post = Post.objects.create(user=user, content="Test post content")
+    # The blocked users are cached after the first read
+    UserFilterService().get_filter(user.id)
+
+    # Act & Assert
+    with django_assert_num_queries(1):
+        PostService.toggle_like_post(user, post.id)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_toggle_like_post_with_concurrent_clicks_should_keep_single_like():
+    # Assign
+    author = User.objects.create(username="author", cognito_id="author123")
+    post = Post.objects.create(user=author, content="Test post content")
+    users = [
+        User.objects.create(username=f"user{index}", email=f"user{index}@email.com", cognito_id=f"user{index}")
+        for index in range(8)
+    ]
+    clicks_per_user = 5
+    barrier = threading.Barrier(len(users) * 2)
+    results = {user.id: [] for user in users}
+
+    def click(user: User):
+        try:
+            barrier.wait()
+            for _ in range(clicks_per_user):
+                results[user.id].append(PostService.toggle_like_post(user, post.id))
+        finally:
+            connection.close()
+
+    # Act
+    # Two threads click for every user at the same time
+    threads = [threading.Thread(target=click, args=(user,)) for user in users for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    for user in users:
+        assert len(results[user.id]) == clicks_per_user * 2
+        assert Like.objects.filter(post=post, user=user).count() <= 1
+
+        # The reported state of the next click is the opposite of the stored one
+        liked = Like.objects.filter(post=post, user=user).exists()
+        assert PostService.toggle_like_post(user, post.id) is not liked
+
+
+@pytest.mark.django_db
+def test_get_liked_post_ids_should_use_single_query(django_assert_num_queries):
+    # Assign
+    user = User.objects.create(username="user1", cognito_id="user123")
+    posts = [Post.objects.create(user=user, content=f"Post {index}") for index in range(5)]
+    Like.objects.create(user=user, post=posts[1])
+    Like.objects.create(user=user, post=posts[3])
+
+    # Act & Assert
+    with django_assert_num_queries(1):
+        liked_post_ids = PostService.get_liked_post_ids(user, [post.id for post in posts])
+
+    assert liked_post_ids == {posts[1].id, posts[3].id}
+
+
+@pytest.mark.django_db
+def test_get_liked_post_ids_with_too_many_posts_should_raise_validation_error():
+    # Assign
+    user = User.objects.create(username="user1", cognito_id="user123")
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        PostService.get_liked_post_ids(user, list(range(LIKED_LOOKUP_MAX_POSTS + 1)))
+
+
+def create_posts(user: User, count: int) -> list[Post]:
+    """
+    Creates posts one second apart, with every pair sharing a timestamp to exercise the ID tie breaker.
+    :return: The posts, newest first.
+    """
+    now = timezone.now()
+    posts = Post.objects.bulk_create(Post(user=user, content=f"Post {index}") for index in range(count))
+    for index, post in enumerate(posts):
+        post.timestamp = now - timedelta(seconds=(count - index) // 2)
+    Post.objects.bulk_update(posts, ["timestamp"])
+    return sorted(posts, key=lambda post: (post.timestamp, post.id), reverse=True)
+
+
+@pytest.mark.django_db
+def test_get_user_posts_should_page_with_cursor():
+    # Assign
+    user = User.objects.create(username="user1", cognito_id="user123")
+    other_user = User.objects.create(username="user2", email="user2@email.com", cognito_id="user456")
+    posts = create_posts(user, 7)
+    create_posts(other_user, 3)
+    post_service = PostService()
+
+    # Act
+    pages = []
+    cursor = None
+    while True:
+        page, cursor = post_service.get_user_posts(user, cursor, limit=3)
+        pages.append(page)
+        if cursor is None:
+            break
+
+    # Assert
+    assert [post.id for page in pages for post in page] == [post.id for post in posts]
+    assert [len(page) for page in pages] == [3, 3, 1]
+
+
+@pytest.mark.django_db
+def test_get_recent_posts_should_return_posts_of_all_users_newest_first():
+    # Assign
+    user = User.objects.create(username="user1", cognito_id="user123")
+    other_user = User.objects.create(username="user2", email="user2@email.com", cognito_id="user456")
+    posts = create_posts(user, 2) + create_posts(other_user, 2)
+    post_service = PostService()
+
+    # Act
+    first_page, cursor = post_service.get_recent_posts(limit=2)
+    second_page, _ = post_service.get_recent_posts(cursor, limit=2)
+
+    # Assert
+    expected = sorted(posts, key=lambda post: (post.timestamp, post.id), reverse=True)
+    assert first_page + second_page == expected
+
+
+@pytest.mark.django_db
+def test_get_user_posts_with_invalid_cursor_should_raise_validation_error():
+    # Assign
+    user = User.objects.create(username="user1", cognito_id="user123")
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        PostService().get_user_posts(user, "invalid")
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="Query plans are specific to PostgreSQL")
+@pytest.mark.parametrize("index_name", ["post_user_timestamp_id_idx", "post_timestamp_id_idx"])
+def test_get_page_queryset_at_deep_page_should_range_scan_index(index_name):
+    # Assign
+    user = User.objects.create(username="user1", cognito_id="user123")
+    other_user = User.objects.create(username="user2", email="user2@email.com", cognito_id="user456")
+    create_posts(user, 2000)
+    create_posts(other_user, 2000)
+    _, cursor = PostService().get_user_posts(user, limit=1000)
+    queryset = Post.objects.filter(user=user) if index_name == "post_user_timestamp_id_idx" else Post.objects.all()
+
+    # Act
+    with connection.cursor() as db_cursor:
+        db_cursor.execute(f"ANALYZE {Post._meta.db_table}")
+        # The table is tiny, without this the planner would prefer reading it whole
+        db_cursor.execute("SET LOCAL enable_seqscan = off")
+    plan = PostService.get_page_queryset(queryset, cursor)[:20].explain()
+
+    # Assert
+    assert f"Index Scan using {index_name}" in plan
+    # The cursor bounds the scan itself, the rows before it are never read
+    assert '"timestamp" <=' in plan.split("Index Cond:")[1].splitlines()[0]
+    assert "Sort" not in plan
@@ -0,0 +1,103 @@
+import pytest
+
+from accounts.models import User
+from posts.models import Post, PostHashtag, PostMention
+from posts.services.post_service import PostService
+from posts.services.post_tag_service import PostTagService
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(username="user1", cognito_id="user123")
+
+
+@pytest.fixture
+def other_user():
+    return User.objects.create(username="Friend_2", cognito_id="user456")
+
+
+def test_extract_hashtags_should_return_distinct_lowercase_tags():
+    # Act
+    hashtags = PostTagService.extract_hashtags("#Django and #django, #rest_api #1 a#b ##double")
+
+    # Assert
+    assert hashtags == ["django", "rest_api", "1"]
+
+
+def test_extract_mentions_should_ignore_emails_and_invalid_usernames():
+    # Act
+    mentions = PostTagService.extract_mentions("@friend_2 @Friend_2 mail@example.com @1user @ab")
+
+    # Assert
+    assert mentions == ["FRIEND_2"]
+
+
+@pytest.mark.django_db
+def test_create_post_with_hashtag_longer_once_lower_cased_should_skip_it(user):
+    # Act
+    PostService().create_post(user, f"#{'İ' * 100} #Django")
+
+    # Assert
+    post = Post.objects.get(user=user)
+    assert list(PostHashtag.objects.filter(post=post).values_list("tag", flat=True)) == ["django"]
+
+
+@pytest.mark.django_db
+def test_create_post_should_index_hashtags_and_mentions(user, other_user):
+    # Act
+    PostService().create_post(user, "Hello @friend_2 and @nobody, #Django #python")
+
+    # Assert
+    post = Post.objects.get(user=user)
+    assert sorted(PostHashtag.objects.filter(post=post).values_list("tag", flat=True)) == ["django", "python"]
+    assert list(PostMention.objects.filter(post=post).values_list("user_id", flat=True)) == [other_user.id]
+
+
+@pytest.mark.django_db
+def test_get_posts_with_hashtag_should_page_newest_first(user):
+    # Assign
+    post_service = PostService()
+    for index in range(5):
+        post_service.create_post(user, f"Post number {index} #Coffee")
+    post_service.create_post(user, "Post without hashtag")
+    tag_service = PostTagService()
+
+    # Act
+    first_page, cursor = tag_service.get_posts_with_hashtag("#coffee", limit=3)
+    second_page, last_cursor = tag_service.get_posts_with_hashtag("coffee", cursor, limit=3)
+
+    # Assert
+    expected = list(Post.objects.filter(content__contains="#Coffee").order_by("-timestamp", "-id"))
+    assert first_page + second_page == expected
+    assert last_cursor is None
+
+
+@pytest.mark.django_db
+def test_get_posts_mentioning_should_return_mentioning_posts(user, other_user):
+    # Assign
+    post_service = PostService()
+    post_service.create_post(user, "Hi @Friend_2")
+    post_service.create_post(user, "Hi nobody")
+    post_service.create_post(other_user, "Hi @user1")
+
+    # Act
+    posts, next_cursor = PostTagService().get_posts_mentioning(other_user)
+
+    # Assert
+    assert [post.content for post in posts] == ["Hi @Friend_2"]
+    assert next_cursor is None
+
+
+@pytest.mark.django_db
+def test_delete_post_should_remove_index_entries(user):
+    # Assign
+    post_service = PostService()
+    post_service.create_post(user, "Gone soon #temporary")
+    post = Post.objects.get(user=user)
+
+    # Act
+    post_service.delete_post(user, post.id)
+
+    # Assert
+    assert PostTagService().get_posts_with_hashtag("temporary") == ([], None)
+    assert not PostHashtag.objects.exists()
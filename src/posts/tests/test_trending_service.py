@@ -0,0 +1,150 @@
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from redis.exceptions import RedisError
+
+from accounts.models import User
+from posts.models import Post
+from posts.services.post_service import PostService
+from posts.services.trending_service import TrendingService
+from posts.settings.post_settings import TRENDING_HALF_LIFE, TRENDING_KEY_PREFIX
+
+NOW = 1_700_000_000.0
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(username="user1", cognito_id="user123")
+
+
+@pytest.fixture
+def likers():
+    return [
+        User.objects.create(username=f"liker{index}", email=f"liker{index}@email.com", cognito_id=f"liker{index}")
+        for index in range(3)
+    ]
+
+
+@pytest.mark.django_db
+def test_get_trending_posts_should_rank_by_likes(redis_client, user, likers):
+    # Assign
+    post_service = PostService()
+    post_service.create_post(user, "Quiet post")
+    post_service.create_post(user, "Popular post")
+    quiet_post, popular_post = Post.objects.order_by("id")
+    for liker in likers:
+        post_service.toggle_like_post(liker, popular_post.id)
+    post_service.toggle_like_post(likers[0], quiet_post.id)
+    post_service.toggle_like_post(likers[0], quiet_post.id)
+
+    # Act
+    posts = TrendingService().get_trending_posts()
+
+    # Assert
+    assert posts == [popular_post, quiet_post]
+
+
+@pytest.mark.django_db
+def test_get_trending_posts_should_prefer_recent_engagement(redis_client, user, likers):
+    # Assign
+    trending_service = TrendingService()
+    old_post = Post.objects.create(user=user, content="Old post")
+    new_post = Post.objects.create(user=user, content="New post")
+    with patch("posts.services.trending_service.time.time", return_value=NOW):
+        for _ in likers:
+            trending_service.add_like(old_post.id, True)
+    with patch("posts.services.trending_service.time.time", return_value=NOW + 2 * TRENDING_HALF_LIFE):
+        trending_service.add_like(new_post.id, True)
+        trending_service.add_like(new_post.id, True)
+
+        # Act
+        posts = trending_service.get_trending_posts()
+
+    # Assert
+    assert posts == [new_post, old_post]
+
+
+@pytest.mark.django_db
+def test_add_like_removing_old_like_should_take_back_its_weight(redis_client, user):
+    # Assign
+    trending_service = TrendingService()
+    post = Post.objects.create(user=user, content="Post #Django")
+    with patch("posts.services.trending_service.time.time", return_value=NOW):
+        trending_service.add_post(post)
+        trending_service.add_like(post.id, True)
+
+    # Act
+    with patch("posts.services.trending_service.time.time", return_value=NOW + 2 * TRENDING_HALF_LIFE):
+        trending_service.add_like(post.id, False, datetime.fromtimestamp(NOW, tz=timezone.utc))
+        hashtags = trending_service.get_trending_hashtags()
+        posts = trending_service.get_trending_posts()
+
+    # Assert
+    assert posts == [post]
+    assert redis_client.zscore(f"{TRENDING_KEY_PREFIX}:posts", post.id) == pytest.approx(1.0)
+    assert hashtags == [("django", pytest.approx(0.25))]
+
+
+@pytest.mark.django_db
+def test_get_trending_posts_with_redis_error_should_return_no_posts(user):
+    # Assign
+    trending_service = TrendingService()
+
+    # Act
+    with patch.object(trending_service.redis_client, "pipeline", side_effect=RedisError):
+        posts = trending_service.get_trending_posts()
+
+    # Assert
+    assert posts == []
+
+
+@pytest.mark.django_db
+def test_rebase_should_keep_scores_and_reset_epoch(redis_client, user):
+    # Assign
+    trending_service = TrendingService()
+    post = Post.objects.create(user=user, content="Post #Django")
+    with patch("posts.services.trending_service.time.time", return_value=NOW):
+        trending_service.add_post(post)
+    later = NOW + TRENDING_HALF_LIFE
+
+    # Act
+    with patch("posts.services.trending_service.time.time", return_value=later):
+        before = trending_service.get_trending_hashtags()
+        trending_service.rebase()
+        after = trending_service.get_trending_hashtags()
+
+    # Assert
+    assert before == after == [("django", pytest.approx(0.5))]
+    assert float(redis_client.get(f"{TRENDING_KEY_PREFIX}:epoch")) == later
+
+
+@pytest.mark.django_db
+def test_rebase_should_drop_decayed_entries(redis_client, user):
+    # Assign
+    trending_service = TrendingService()
+    post = Post.objects.create(user=user, content="Post #Django")
+    with patch("posts.services.trending_service.time.time", return_value=NOW):
+        trending_service.add_post(post)
+
+    # Act
+    with patch("posts.services.trending_service.time.time", return_value=NOW + 10 * TRENDING_HALF_LIFE):
+        trending_service.rebase()
+
+    # Assert
+    assert trending_service.get_trending_posts() == []
+    assert trending_service.get_trending_hashtags() == []
+
+
+@pytest.mark.django_db
+def test_delete_post_should_remove_trending_post(redis_client, user):
+    # Assign
+    post_service = PostService()
+    post_service.create_post(user, "Soon deleted")
+    post = Post.objects.get(user=user)
+
+    # Act
+    post_service.delete_post(user, post.id)
+
+    # Assert
+    assert redis_client.zcard(f"{TRENDING_KEY_PREFIX}:posts") == 0
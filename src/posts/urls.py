@@ -6,4 +6,12 @@ urlpatterns = [
     path("post/create", views.create_post, name="create_post"),
     path("post/delete", views.delete_post, name="delete_post"),
     path("post/like", views.toggle_like_post, name="like_post"),
+    path("posts", views.get_user_posts, name="user_posts"),
+    path("posts/recent", views.get_recent_posts, name="recent_posts"),
+    path("posts/liked", views.get_liked_posts, name="liked_posts"),
+    path("posts/search", views.search_posts, name="search_posts"),
+    path("posts/hashtag", views.get_hashtag_posts, name="hashtag_posts"),
+    path("posts/mentions", views.get_mentioning_posts, name="mentioning_posts"),
+    path("posts/trending", views.get_trending_posts, name="trending_posts"),
+    path("hashtags/trending", views.get_trending_hashtags, name="trending_hashtags"),
 ]
@@ -1,103 +1,164 @@
-from jwt import PyJWTError
 from rest_framework import status
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from accounts.services.token_service import TokenService
 from accounts.services.user_service import UserService
+from posts.serializers import PostSerializer
+from posts.services.post_search_service import PostSearchService
 from posts.services.post_service import PostService
+from posts.services.post_tag_service import PostTagService
+from posts.services.trending_service import TrendingService
+from posts.settings.post_settings import POST_MAX_PAGE_SIZE, POST_PAGE_SIZE, TRENDING_MAX_PAGE_SIZE, TRENDING_PAGE_SIZE
+from utils.cursor import get_page_size
 
 
 @api_view(["POST"])
+@permission_classes([IsAuthenticated])
 def create_post(request):
-    access_token = request.COOKIES.get("access_token")
-    if not access_token:
-        return Response({}, status=status.HTTP_401_UNAUTHORIZED)
-
-    try:
-        token_service = TokenService()
-        user_info = token_service.decode_token(access_token)
-    except PyJWTError:
-        return Response(
-            {"error": "Invalid or expired access token."},
-            status=status.HTTP_401_UNAUTHORIZED
-        )
-
-    user_service = UserService()
-    user = user_service.get_user_by_cognito_id(user_info["username"])
-    if not user:
-        return Response(
-            {"error": f"Authenticated user with Cognito ID {user_info['username']} not found."},
-            status=status.HTTP_400_BAD_REQUEST
-        )
-
     post_service = PostService()
-    post_service.create_post(user, request.data["content"])
+    post_service.create_post(request.user, request.data["content"])
 
     return Response({"message": "Post was created successfully."}, status=status.HTTP_201_CREATED)
 
 
 @api_view(["POST"])
+@permission_classes([IsAuthenticated])
 def delete_post(request):
     post_id = request.query_params.get("post_id")
     if not post_id:
         return Response({"error": "Missing 'post_id' query parameter."}, status=status.HTTP_400_BAD_REQUEST)
 
-    access_token = request.COOKIES.get("access_token")
-    if not access_token:
-        return Response({}, status=status.HTTP_401_UNAUTHORIZED)
-
-    try:
-        token_service = TokenService()
-        user_info = token_service.decode_token(access_token)
-    except PyJWTError:
-        return Response(
-            {"error": "Invalid or expired access token."},
-            status=status.HTTP_401_UNAUTHORIZED
-        )
-
-    user_service = UserService()
-    user = user_service.get_user_by_cognito_id(user_info["username"])
-    if not user:
-        return Response(
-            {"error": f"Authenticated user with Cognito ID {user_info['username']} not found."},
-            status=status.HTTP_400_BAD_REQUEST
-        )
-
     post_service = PostService()
-    post_service.delete_post(user, post_id)
+    post_service.delete_post(request.user, post_id)
 
     return Response({"message": "Post was deleted successfully."}, status=status.HTTP_200_OK)
 
 
 @api_view(["POST"])
+@permission_classes([IsAuthenticated])
 def toggle_like_post(request):
     post_id = request.query_params.get("post_id")
     if not post_id:
         return Response({"error": "Missing 'post_id' query parameter."}, status=status.HTTP_400_BAD_REQUEST)
 
-    access_token = request.COOKIES.get("access_token")
-    if not access_token:
-        return Response({}, status=status.HTTP_401_UNAUTHORIZED)
+    post_service = PostService()
+    liked = post_service.toggle_like_post(request.user, post_id)
+
+    return Response({"liked": liked}, status=status.HTTP_200_OK)
 
-    try:
-        token_service = TokenService()
-        user_info = token_service.decode_token(access_token)
-    except PyJWTError:
-        return Response(
-            {"error": "Invalid or expired access token."},
-            status=status.HTTP_401_UNAUTHORIZED
-        )
-
-    user_service = UserService()
-    user = user_service.get_user_by_cognito_id(user_info["username"])
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def get_user_posts(request):
+    user_id = request.query_params.get("user_id")
+    if not user_id:
+        return Response({"error": "Missing 'user_id' query parameter."}, status=status.HTTP_400_BAD_REQUEST)
+
+    user = UserService().get_user_by_cognito_id(user_id)
     if not user:
-        return Response(
-            {"error": f"Authenticated user with Cognito ID {user_info['username']} not found."},
-            status=status.HTTP_400_BAD_REQUEST
-        )
+        return Response({"error": f"User with ID {user_id} not found."}, status=status.HTTP_404_NOT_FOUND)
 
-    post_service = PostService()
-    post_service.toggle_like_post(user, post_id)
+    limit = get_page_size(request.query_params.get("limit"), POST_PAGE_SIZE, POST_MAX_PAGE_SIZE)
+    posts, next_cursor = PostService().get_user_posts(user, request.query_params.get("cursor"), limit)
+
+    liked_post_ids = PostService.get_liked_post_ids(request.user, [post.id for post in posts])
+    serializer = PostSerializer(posts, many=True, context={"liked_post_ids": liked_post_ids})
+
+    return Response({"results": serializer.data, "next_cursor": next_cursor}, status=status.HTTP_200_OK)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def get_recent_posts(request):
+    limit = get_page_size(request.query_params.get("limit"), POST_PAGE_SIZE, POST_MAX_PAGE_SIZE)
+    posts, next_cursor = PostService().get_recent_posts(request.query_params.get("cursor"), limit)
+
+    liked_post_ids = PostService.get_liked_post_ids(request.user, [post.id for post in posts])
+    serializer = PostSerializer(posts, many=True, context={"liked_post_ids": liked_post_ids})
+
+    return Response({"results": serializer.data, "next_cursor": next_cursor}, status=status.HTTP_200_OK)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def get_liked_posts(request):
+    post_ids = request.query_params.get("post_ids")
+    if not post_ids:
+        return Response({"error": "Missing 'post_ids' query parameter."}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        post_ids = [int(post_id) for post_id in post_ids.split(",")]
+    except ValueError:
+        return Response({"error": "Post IDs must be numbers."}, status=status.HTTP_400_BAD_REQUEST)
+
+    liked_post_ids = PostService.get_liked_post_ids(request.user, post_ids)
+
+    return Response({"liked_post_ids": sorted(liked_post_ids)}, status=status.HTTP_200_OK)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def search_posts(request):
+    query = request.query_params.get("q")
+    if not query:
+        return Response({"error": "Missing 'q' query parameter."}, status=status.HTTP_400_BAD_REQUEST)
+
+    limit = get_page_size(request.query_params.get("limit"), POST_PAGE_SIZE, POST_MAX_PAGE_SIZE)
+    posts, next_cursor = PostSearchService().search(
+        query, request.query_params.get("cursor"), limit, viewer=request.user
+    )
+
+    liked_post_ids = PostService.get_liked_post_ids(request.user, [post.id for post in posts])
+    serializer = PostSerializer(posts, many=True, context={"liked_post_ids": liked_post_ids})
+
+    return Response({"results": serializer.data, "next_cursor": next_cursor}, status=status.HTTP_200_OK)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def get_hashtag_posts(request):
+    tag = request.query_params.get("tag")
+    if not tag:
+        return Response({"error": "Missing 'tag' query parameter."}, status=status.HTTP_400_BAD_REQUEST)
+
+    limit = get_page_size(request.query_params.get("limit"), POST_PAGE_SIZE, POST_MAX_PAGE_SIZE)
+    posts, next_cursor = PostTagService().get_posts_with_hashtag(tag, request.query_params.get("cursor"), limit)
+
+    liked_post_ids = PostService.get_liked_post_ids(request.user, [post.id for post in posts])
+    serializer = PostSerializer(posts, many=True, context={"liked_post_ids": liked_post_ids})
+
+    return Response({"results": serializer.data, "next_cursor": next_cursor}, status=status.HTTP_200_OK)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def get_mentioning_posts(request):
+    limit = get_page_size(request.query_params.get("limit"), POST_PAGE_SIZE, POST_MAX_PAGE_SIZE)
+    posts, next_cursor = PostTagService().get_posts_mentioning(request.user, request.query_params.get("cursor"), limit)
+
+    liked_post_ids = PostService.get_liked_post_ids(request.user, [post.id for post in posts])
+    serializer = PostSerializer(posts, many=True, context={"liked_post_ids": liked_post_ids})
+
+    return Response({"results": serializer.data, "next_cursor": next_cursor}, status=status.HTTP_200_OK)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def get_trending_posts(request):
+    limit = get_page_size(request.query_params.get("limit"), TRENDING_PAGE_SIZE, TRENDING_MAX_PAGE_SIZE)
+    posts = TrendingService().get_trending_posts(limit)
+
+    liked_post_ids = PostService.get_liked_post_ids(request.user, [post.id for post in posts])
+    serializer = PostSerializer(posts, many=True, context={"liked_post_ids": liked_post_ids})
+
+    return Response({"results": serializer.data}, status=status.HTTP_200_OK)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def get_trending_hashtags(request):
+    limit = get_page_size(request.query_params.get("limit"), TRENDING_PAGE_SIZE, TRENDING_MAX_PAGE_SIZE)
+    hashtags = TrendingService().get_trending_hashtags(limit)
 
-    return Response(status=status.HTTP_200_OK)
+    return Response({"results": [{"tag": tag, "score": score} for tag, score in hashtags]}, status=status.HTTP_200_OK)
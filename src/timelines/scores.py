@@ -0,0 +1,36 @@
+from datetime import datetime, timedelta, timezone
+
+from django.db.models import Q
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def to_score(timestamp: datetime) -> int:
+    """
+    Converts a post timestamp into a Redis sorted set score.
+
+    :param timestamp: Timestamp of the post.
+    :return: Timestamp in microseconds, integers of this size are exact as Redis scores.
+    """
+    # Integer arithmetic, a float timestamp can be a microsecond off and break ties on the score
+    return (timestamp - EPOCH) // timedelta(microseconds=1)
+
+
+def to_timestamp(score: int) -> datetime:
+    """
+    Converts a score created by to_score back into a timestamp.
+    """
+    return EPOCH + timedelta(microseconds=score)
+
+
+def before_position(before: tuple[int, int]) -> Q:
+    """
+    Filters the posts ordered after a timeline position, newest first.
+
+    :param before: Exclusive bound as a tuple of score and post ID.
+    :return: Condition on the timestamp and ID of the posts.
+    """
+    score, post_id = before
+    timestamp = to_timestamp(score)
+    # The timestamp bound is the range condition of the index scan, the ID only breaks ties
+    return Q(timestamp__lte=timestamp) & (Q(timestamp__lt=timestamp) | Q(id__lt=post_id))
@@ -0,0 +1,196 @@
+import logging
+
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from redis.exceptions import RedisError, WatchError
+
+from posts.models import Post
+from timelines.scores import before_position, to_score
+from timelines.settings.timeline_settings import (
+    AUTHOR_POSTS_KEY_PREFIX,
+    AUTHOR_POSTS_LOAD_BATCH_SIZE,
+    AUTHOR_POSTS_MAX_LENGTH,
+    AUTHOR_POSTS_TTL,
+)
+from utils.redis_client import get_redis_client
+
+
+class AuthorPostsCache:
+    """
+    Bounded lists of the most recent posts of every author, kept as Redis sorted sets of post IDs scored by
+    the post timestamp.
+
+    A list is loaded from the database on first use. Loaded lists hold a marker member scored +inf, so a list
+    started by a new post after the previous one expired is recognised as incomplete, and an author without
+    posts does not hit the database on every read.
+    """
+    COMPLETE_MARKER = b"complete"
+
+    def __init__(self):
+        self.redis_client = get_redis_client()
+
+    def add_post(self, post: Post) -> None:
+        """
+        Adds a new post to the list of its author.
+        :param post: The created post.
+        """
+        key = self.get_key(post.user_id)
+
+        try:
+            pipeline = self.redis_client.pipeline(transaction=False)
+            pipeline.zadd(key, {post.id: to_score(post.timestamp)})
+            # Keep the marker and the most recent posts
+            pipeline.zremrangebyrank(key, 0, -(AUTHOR_POSTS_MAX_LENGTH + 2))
+            pipeline.expire(key, AUTHOR_POSTS_TTL)
+            # Bumping the version stops a load that read the database before the post from storing its list
+            pipeline.incr(self.__get_version_key(key))
+            pipeline.expire(self.__get_version_key(key), AUTHOR_POSTS_TTL)
+            pipeline.execute()
+        except RedisError as e:
+            logging.error(f"Failed to add post {post.id} to the recent posts of user {post.user_id}: {e}")
+
+    def invalidate(self, author_id: int) -> None:
+        """
+        Drops the list of an author, it is loaded again on next use.
+
+        Used when a post is deleted, a list missing one post could not tell whether older posts were cut off.
+        :param author_id: ID of the author.
+        """
+        key = self.get_key(author_id)
+        try:
+            pipeline = self.redis_client.pipeline(transaction=False)
+            pipeline.delete(key)
+            pipeline.incr(self.__get_version_key(key))
+            pipeline.expire(self.__get_version_key(key), AUTHOR_POSTS_TTL)
+            pipeline.execute()
+        except RedisError as e:
+            logging.error(f"Failed to invalidate the recent posts of user {author_id}: {e}")
+
+    def get_recent_posts(
+            self, author_ids: list[int], before: tuple[int, int] | None, limit: int
+    ) -> dict[int, list[tuple[int, int]]]:
+        """
+        Returns the most recent posts of every author, older than the given position.
+
+        :param author_ids: IDs of the authors.
+        :param before: Exclusive bound as a tuple of score and post ID, None for the newest posts.
+        :param limit: Maximum number of posts per author.
+        :return: Tuples of score and post ID per author ID, newest first.
+        :raises RedisError: If Redis is unavailable.
+        """
+        reads = 3 if before is None else 4
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for author_id in author_ids:
+            key = self.get_key(author_id)
+            pipeline.zscore(key, self.COMPLETE_MARKER)
+            pipeline.zcard(key)
+            pipeline.zrevrangebyscore(
+                key, f"({before[0]}" if before is not None else "+inf", "-inf",
+                start=0, num=limit + 1, withscores=True
+            )
+            if before is not None:
+                # Posts sharing the score of the bound are ordered by ID, not by member, so they are read apart
+                pipeline.zrangebyscore(key, before[0], before[0], withscores=True)
+        responses = pipeline.execute()
+
+        posts_by_author = {}
+        missing_author_ids = []
+        truncated_author_ids = []
+        for index, author_id in enumerate(author_ids):
+            marker, length, *ranges = responses[index * reads:(index + 1) * reads]
+            if marker is None:
+                missing_author_ids.append(author_id)
+                continue
+
+            posts = sorted(
+                (
+                    (int(score), int(post_id))
+                    for entries in ranges for post_id, score in entries
+                    if post_id != self.COMPLETE_MARKER
+                ),
+                reverse=True,
+            )
+            if before is not None:
+                posts = [entry for entry in posts if entry < before]
+            # A full list may have lost older posts to the length cap, those are read from the database
+            if len(posts) < limit and length > AUTHOR_POSTS_MAX_LENGTH:
+                truncated_author_ids.append(author_id)
+                continue
+
+            posts_by_author[author_id] = posts[:limit]
+
+        if missing_author_ids:
+            loaded_posts = self.__load(missing_author_ids)
+            for author_id in missing_author_ids:
+                posts = loaded_posts.get(author_id, [])
+                if before is not None:
+                    posts = [entry for entry in posts if entry < before]
+                if len(posts) < limit and len(loaded_posts.get(author_id, [])) >= AUTHOR_POSTS_MAX_LENGTH:
+                    truncated_author_ids.append(author_id)
+                else:
+                    posts_by_author[author_id] = posts[:limit]
+
+        if truncated_author_ids:
+            posts_by_author.update(self.query_recent_posts(truncated_author_ids, before, limit))
+
+        return posts_by_author
+
+    @staticmethod
+    def query_recent_posts(
+            author_ids: list[int], before: tuple[int, int] | None, limit: int
+    ) -> dict[int, list[tuple[int, int]]]:
+        """
+        Queries the most recent posts of every author from the database.
+
+        :param author_ids: IDs of the authors.
+        :param before: Exclusive bound as a tuple of score and post ID, None for the newest posts.
+        :param limit: Maximum number of posts per author.
+        :return: Tuples of score and post ID per author ID, newest first.
+        """
+        posts_by_author = {}
+        for start in range(0, len(author_ids), AUTHOR_POSTS_LOAD_BATCH_SIZE):
+            posts = Post.objects.filter(user_id__in=author_ids[start:start + AUTHOR_POSTS_LOAD_BATCH_SIZE])
+            if before is not None:
+                posts = posts.filter(before_position(before))
+
+            # Numbering the posts of every author keeps the result to the requested number of posts per author
+            posts = posts.annotate(
+                position=Window(
+                    RowNumber(), partition_by=F("user_id"), order_by=[F("timestamp").desc(), F("id").desc()]
+                )
+            ).filter(position__lte=limit).order_by("user_id", "position")
+
+            for author_id, post_id, timestamp in posts.values_list("user_id", "id", "timestamp"):
+                posts_by_author.setdefault(author_id, []).append((to_score(timestamp), post_id))
+
+        return posts_by_author
+
+    @staticmethod
+    def get_key(author_id: int) -> str:
+        return f"{AUTHOR_POSTS_KEY_PREFIX}:{author_id}"
+
+    def __load(self, author_ids: list[int]) -> dict[int, list[tuple[int, int]]]:
+        with self.redis_client.pipeline() as pipeline:
+            # A post added or deleted between the query and the write bumps a version and no list is stored
+            pipeline.watch(*[self.__get_version_key(self.get_key(author_id)) for author_id in author_ids])
+            posts_by_author = self.query_recent_posts(author_ids, None, AUTHOR_POSTS_MAX_LENGTH)
+
+            pipeline.multi()
+            for author_id in author_ids:
+                key = self.get_key(author_id)
+                entries = {post_id: score for score, post_id in posts_by_author.get(author_id, [])}
+                entries[self.COMPLETE_MARKER] = float("inf")
+
+                pipeline.delete(key)
+                pipeline.zadd(key, entries)
+                pipeline.expire(key, AUTHOR_POSTS_TTL)
+            try:
+                pipeline.execute()
+            except WatchError:
+                logging.info(f"Recent posts of users {author_ids} changed while loading, they are loaded on next use.")
+
+        return posts_by_author
+
+    @staticmethod
+    def __get_version_key(key: str) -> str:
+        return f"{key}:version"
@@ -0,0 +1,329 @@
+import logging
+from datetime import datetime
+
+from redis.exceptions import RedisError
+from rest_framework.exceptions import ValidationError
+
+from accounts.models import User
+from followers.models import Follow
+from followers.services.follow_graph_service import FollowGraphService
+from followers.services.user_filter_service import UserFilterService
+from posts.models import Post
+from timelines.scores import before_position, to_score
+from timelines.services.pull_timeline_service import PullTimelineService
+from timelines.settings.timeline_settings import (
+    HOME_TIMELINE_ACTIVE_READS,
+    HOME_TIMELINE_ACTIVITY_KEY_PREFIX,
+    HOME_TIMELINE_ACTIVITY_WINDOW,
+    HOME_TIMELINE_FANOUT_BATCH_SIZE,
+    HOME_TIMELINE_FANOUT_MAX_FOLLOWERS,
+    HOME_TIMELINE_KEY_PREFIX,
+    HOME_TIMELINE_MAX_LENGTH,
+    HOME_TIMELINE_PULLED_AUTHORS_KEY,
+    HOME_TIMELINE_TTL,
+    TIMELINE_PAGE_SIZE,
+)
+from utils.cursor import decode_cursor, encode_cursor
+from utils.redis_client import get_redis_client
+
+
+class HomeTimelineService:
+    """
+    Home timelines materialised with fan-out on write.
+
+    Every user's timeline is a capped Redis sorted set of post IDs, scored by the post timestamp in microseconds.
+    A new post is pushed into the materialised timelines of the followers of its author, except for authors
+    with more than HOME_TIMELINE_FANOUT_MAX_FOLLOWERS followers. Their posts are merged into the timeline when it
+    is read, so a single post never turns into millions of writes.
+
+    Only active users have a materialised timeline, it expires after HOME_TIMELINE_TTL seconds without a read.
+    The timelines of everyone else are assembled on read by the PullTimelineService.
+    """
+
+    EMPTY_MARKER = b"empty"
+
+    def __init__(self):
+        self.redis_client = get_redis_client()
+        self.pull_timeline_service = PullTimelineService()
+
+    def fan_out_post(self, post: Post) -> None:
+        """
+        Pushes a new post into the materialised timelines of its author and of the author's followers.
+        :param post: The created post.
+        """
+        entry = {post.id: to_score(post.timestamp)}
+
+        try:
+            self.__add_to_existing_timelines([post.user_id], entry)
+
+            # One row more than the threshold is enough to tell whether the author is fanned out
+            follower_ids = list(
+                Follow.objects.filter(followed_id=post.user_id).values_list("follower_id", flat=True)[
+                    :HOME_TIMELINE_FANOUT_MAX_FOLLOWERS + 1
+                ]
+            )
+            if len(follower_ids) > HOME_TIMELINE_FANOUT_MAX_FOLLOWERS:
+                self.redis_client.sadd(HOME_TIMELINE_PULLED_AUTHORS_KEY, post.user_id)
+                logging.info(f"Post {post.id} of user {post.user_id} is merged into timelines on read.")
+                return
+
+            self.redis_client.srem(HOME_TIMELINE_PULLED_AUTHORS_KEY, post.user_id)
+            for start in range(0, len(follower_ids), HOME_TIMELINE_FANOUT_BATCH_SIZE):
+                self.__add_to_existing_timelines(follower_ids[start:start + HOME_TIMELINE_FANOUT_BATCH_SIZE], entry)
+        except RedisError as e:
+            logging.error(f"Failed to fan out post {post.id}: {e}")
+
+    def remove_post(self, post_id: int, author_id: int) -> None:
+        """
+        Removes a deleted post from the timeline of its author and from the timelines of the author's followers.
+
+        Posts of authors with more than HOME_TIMELINE_FANOUT_MAX_FOLLOWERS followers were never fanned out, only
+        the author's timeline is updated for them. A deleted post left in a timeline is skipped by load_page.
+        :param post_id: ID of the deleted post.
+        :param author_id: ID of the author of the post.
+        """
+        try:
+            self.__remove_from_timelines([author_id], [post_id])
+            if self.redis_client.sismember(HOME_TIMELINE_PULLED_AUTHORS_KEY, author_id):
+                return
+
+            # One row more than the threshold is enough to tell whether the author is fanned out
+            follower_ids = list(
+                Follow.objects.filter(followed_id=author_id).values_list("follower_id", flat=True)[
+                    :HOME_TIMELINE_FANOUT_MAX_FOLLOWERS + 1
+                ]
+            )
+            if len(follower_ids) > HOME_TIMELINE_FANOUT_MAX_FOLLOWERS:
+                return
+
+            for start in range(0, len(follower_ids), HOME_TIMELINE_FANOUT_BATCH_SIZE):
+                self.__remove_from_timelines(follower_ids[start:start + HOME_TIMELINE_FANOUT_BATCH_SIZE], [post_id])
+        except RedisError as e:
+            logging.error(f"Failed to remove post {post_id} from timelines: {e}")
+
+    def add_author(self, user_id: int, author_id: int) -> None:
+        """
+        Adds the recent posts of a newly followed author to an already materialised timeline.
+        :param user_id: ID of the user whose timeline is updated.
+        :param author_id: ID of the followed author.
+        """
+        self.add_authors(user_id, [author_id])
+
+    def add_authors(self, user_id: int, author_ids: list[int]) -> None:
+        """
+        Adds the recent posts of newly followed authors to an already materialised timeline, with a single query.
+        :param user_id: ID of the user whose timeline is updated.
+        :param author_ids: IDs of the followed authors.
+        """
+        try:
+            if not author_ids or not self.redis_client.exists(self.get_key(user_id)):
+                return
+
+            entries = {
+                post_id: to_score(timestamp)
+                for post_id, timestamp in self.__get_recent_posts(Post.objects.filter(user_id__in=author_ids))
+            }
+            self.__add_to_timelines([user_id], entries)
+        except RedisError as e:
+            logging.error(f"Failed to add posts of users {author_ids} to the timeline of user {user_id}: {e}")
+
+    def remove_author(self, user_id: int, author_id: int) -> None:
+        """
+        Removes the posts of an unfollowed author from a timeline.
+        :param user_id: ID of the user whose timeline is updated.
+        :param author_id: ID of the unfollowed author.
+        """
+        self.remove_authors(user_id, [author_id])
+
+    def remove_authors(self, user_id: int, author_ids: list[int]) -> None:
+        """
+        Removes the posts of unfollowed authors from a timeline, with a single query.
+
+        A timeline holds at most the HOME_TIMELINE_MAX_LENGTH newest posts of the authors, so removing that many
+        newest posts of the unfollowed authors removes all of them.
+        :param user_id: ID of the user whose timeline is updated.
+        :param author_ids: IDs of the unfollowed authors.
+        """
+        if not author_ids:
+            return
+
+        post_ids = [
+            post_id for post_id, _ in self.__get_recent_posts(Post.objects.filter(user_id__in=author_ids))
+        ]
+
+        try:
+            self.__remove_from_timelines([user_id], post_ids)
+        except RedisError as e:
+            logging.error(f"Failed to remove posts of users {author_ids} from the timeline of user {user_id}: {e}")
+
+    def get_home_timeline(
+            self, user: User, cursor: str = None, limit: int = TIMELINE_PAGE_SIZE
+    ) -> tuple[list[Post], str | None]:
+        """
+        Returns a page of the user's home timeline, newest posts first.
+
+        :param user: The user whose timeline is read.
+        :param cursor: Cursor returned with the previous page, None for the first page.
+        :param limit: Maximum number of posts on the page.
+        :return: Posts of the page and the cursor of the next page, None if there are no more posts.
+        """
+        before = tuple(decode_cursor(cursor, 2)) if cursor else None
+        if before is not None and not all(isinstance(value, int) for value in before):
+            raise ValidationError({"cursor": "Invalid cursor."})
+
+        try:
+            if self.redis_client.expire(self.get_key(user.id), HOME_TIMELINE_TTL):
+                entries = self.__read_timeline(user, before, limit)
+            elif self.__record_read(user):
+                self.build_timeline(user)
+                entries = self.__read_timeline(user, before, limit)
+            else:
+                entries = self.pull_timeline_service.get_entries(user, before, limit)
+        except RedisError as e:
+            logging.error(f"Failed to read the timeline of user {user.id}, querying the database: {e}")
+            entries = self.__query_followed_posts(user, before, limit)
+
+        # Posts of blocked and muted authors are dropped from the page, the cursor still moves past them
+        posts, next_cursor = self.load_page(entries, limit)
+        return UserFilterService().get_filter(user.id).filter_posts(posts), next_cursor
+
+    @staticmethod
+    def load_page(entries: list[tuple[int, int]], limit: int) -> tuple[list[Post], str | None]:
+        """
+        Loads the posts of a timeline page.
+
+        :param entries: Tuples of score and post ID, newest first.
+        :param limit: Maximum number of posts on the page.
+        :return: Posts of the page and the cursor of the next page, None if there are no more posts.
+        """
+        entries = entries[:limit]
+        posts_by_id = Post.objects.select_related("user").in_bulk([post_id for _, post_id in entries])
+
+        # Posts deleted since they were added to the timeline are skipped
+        posts = [posts_by_id[post_id] for _, post_id in entries if post_id in posts_by_id]
+        next_cursor = encode_cursor(*entries[-1]) if len(entries) == limit else None
+
+        return posts, next_cursor
+
+    @staticmethod
+    def get_key(user_id: int) -> str:
+        return f"{HOME_TIMELINE_KEY_PREFIX}:{user_id}"
+
+    def build_timeline(self, user: User) -> None:
+        """
+        Materialises the timeline of a user from the recent posts of the user and of the followed authors.
+        :param user: The user whose timeline is built.
+        :raises RedisError: If Redis is unavailable.
+        """
+        author_ids = [user.id, *FollowGraphService().get_following_ids(user.id)]
+        entries = {
+            post_id: score
+            for score, post_id in self.pull_timeline_service.merge(author_ids, None, HOME_TIMELINE_MAX_LENGTH)
+        }
+
+        key = self.get_key(user.id)
+        self.__add_to_timelines([user.id], entries)
+        # A timeline without posts is still materialised, the marker is never loaded as a post
+        self.redis_client.zadd(key, {self.EMPTY_MARKER: 0})
+        self.redis_client.expire(key, HOME_TIMELINE_TTL)
+
+    def __read_timeline(self, user: User, before: tuple[int, int] | None, limit: int) -> list[tuple[int, int]]:
+        """
+        Reads the materialised timeline merged with the posts of followed authors that are not fanned out.
+        :return: Tuples of score and post ID, newest first.
+        """
+        key = self.get_key(user.id)
+
+        pipeline = self.redis_client.pipeline(transaction=False)
+        pipeline.zrevrangebyscore(
+            key, f"({before[0]}" if before is not None else "+inf", "-inf", start=0, num=limit, withscores=True
+        )
+        if before is not None:
+            # Posts sharing the score the previous page ended with are ordered by ID, not by member
+            pipeline.zrangebyscore(key, before[0], before[0], withscores=True)
+        entries = {
+            int(post_id): int(score)
+            for response in pipeline.execute() for post_id, score in response
+            if post_id != self.EMPTY_MARKER and (before is None or (int(score), int(post_id)) < before)
+        }
+
+        # The timeline is capped, older pages of a full timeline are served from the database
+        if len(entries) < limit and self.redis_client.zcard(key) >= HOME_TIMELINE_MAX_LENGTH:
+            oldest = min(((score, post_id) for post_id, score in entries.items()), default=before)
+            for score, post_id in self.__query_followed_posts(user, oldest, limit - len(entries)):
+                entries[post_id] = score
+
+        pulled_author_ids = [
+            int(author_id) for author_id in self.redis_client.smembers(HOME_TIMELINE_PULLED_AUTHORS_KEY)
+        ]
+        if pulled_author_ids:
+            followed_pulled_author_ids = list(FollowGraphService().filter_following(user.id, pulled_author_ids))
+            for score, post_id in self.pull_timeline_service.merge(followed_pulled_author_ids, before, limit):
+                entries[post_id] = score
+
+        return sorted(((score, post_id) for post_id, score in entries.items()), reverse=True)
+
+    def __record_read(self, user: User) -> bool:
+        """
+        Counts the reads of a user without a materialised timeline.
+        :return: True if the user reads often enough to get a materialised timeline.
+        """
+        key = f"{HOME_TIMELINE_ACTIVITY_KEY_PREFIX}:{user.id}"
+
+        pipeline = self.redis_client.pipeline()
+        pipeline.incr(key)
+        pipeline.expire(key, HOME_TIMELINE_ACTIVITY_WINDOW, nx=True)
+        reads, _ = pipeline.execute()
+
+        return reads >= HOME_TIMELINE_ACTIVE_READS
+
+    def __query_followed_posts(self, user: User, before: tuple[int, int] | None, limit: int) -> list[tuple[int, int]]:
+        """
+        Queries the most recent posts of the user and of the authors the user follows.
+        :return: Tuples of score and post ID, newest first.
+        """
+        followed_ids = Follow.objects.filter(follower=user).values("followed_id")
+        posts = Post.objects.filter(user_id__in=followed_ids) | Post.objects.filter(user=user)
+        if before is not None:
+            posts = posts.filter(before_position(before))
+
+        return [(to_score(timestamp), post_id) for post_id, timestamp in self.__get_recent_posts(posts, limit)]
+
+    @staticmethod
+    def __get_recent_posts(posts, limit: int = HOME_TIMELINE_MAX_LENGTH) -> list[tuple[int, datetime]]:
+        return list(posts.order_by("-timestamp", "-id").values_list("id", "timestamp")[:limit])
+
+    def __add_to_existing_timelines(self, user_ids: list[int], entries: dict[int, int]) -> None:
+        """
+        Adds the entries to the timelines that are materialised, the timelines of inactive users are not created.
+        """
+        if not user_ids:
+            return
+
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for user_id in user_ids:
+            pipeline.exists(self.get_key(user_id))
+        existing = pipeline.execute()
+
+        self.__add_to_timelines([user_id for user_id, exists in zip(user_ids, existing) if exists], entries)
+
+    def __add_to_timelines(self, user_ids: list[int], entries: dict[int, int]) -> None:
+        if not user_ids or not entries:
+            return
+
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for user_id in user_ids:
+            key = self.get_key(user_id)
+            pipeline.zadd(key, entries)
+            # Keep only the most recent posts
+            pipeline.zremrangebyrank(key, 0, -(HOME_TIMELINE_MAX_LENGTH + 1))
+        pipeline.execute()
+
+    def __remove_from_timelines(self, user_ids: list[int], post_ids: list[int]) -> None:
+        if not user_ids or not post_ids:
+            return
+
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for user_id in user_ids:
+            pipeline.zrem(self.get_key(user_id), *post_ids)
+        pipeline.execute()
@@ -0,0 +1,74 @@
+import heapq
+from itertools import islice
+
+from django.core.cache import caches
+
+from accounts.models import User
+from followers.services.follow_graph_service import FollowGraphService
+from timelines.services.author_posts_cache import AuthorPostsCache
+from timelines.settings.timeline_settings import (
+    PULL_TIMELINE_CACHE_ALIAS,
+    PULL_TIMELINE_CACHE_KEY_PREFIX,
+    PULL_TIMELINE_CACHE_TTL,
+    TIMELINE_PAGE_SIZE,
+)
+
+
+class PullTimelineService:
+    """
+    Home timelines assembled on read, for users without a materialised timeline.
+
+    A page is a k-way merge of the recent posts of the user and of every author the user follows. Assembled
+    pages are cached for PULL_TIMELINE_CACHE_TTL seconds, so refreshing a page does not repeat the merge.
+    """
+
+    def __init__(self):
+        self.author_posts_cache = AuthorPostsCache()
+        self.cache = caches[PULL_TIMELINE_CACHE_ALIAS]
+
+    def get_entries(
+            self, user: User, before: tuple[int, int] = None, limit: int = TIMELINE_PAGE_SIZE
+    ) -> list[tuple[int, int]]:
+        """
+        Returns a page of the user's home timeline.
+
+        :param user: The user whose timeline is read.
+        :param before: Exclusive bound as a tuple of score and post ID, None for the first page.
+        :param limit: Maximum number of posts on the page.
+        :return: Tuples of score and post ID, newest first.
+        :raises RedisError: If Redis is unavailable.
+        """
+        key = self.get_page_key(user.id, before, limit)
+        entries = self.cache.get(key)
+        if entries is not None:
+            return entries
+
+        author_ids = [user.id, *FollowGraphService().get_following_ids(user.id)]
+        entries = self.merge(author_ids, before, limit)
+        self.cache.set(key, entries, PULL_TIMELINE_CACHE_TTL)
+
+        return entries
+
+    @staticmethod
+    def get_page_key(user_id: int, before: tuple[int, int] | None, limit: int) -> str:
+        score, post_id = before or (None, None)
+        return f"{PULL_TIMELINE_CACHE_KEY_PREFIX}:{user_id}:{score}:{post_id}:{limit}"
+
+    def merge(self, author_ids: list[int], before: tuple[int, int] | None, limit: int) -> list[tuple[int, int]]:
+        """
+        Merges the recent posts of the authors into a single page.
+
+        :param author_ids: IDs of the authors.
+        :param before: Exclusive bound as a tuple of score and post ID, None for the newest posts.
+        :param limit: Maximum number of posts on the page.
+        :return: Tuples of score and post ID, newest first.
+        :raises RedisError: If Redis is unavailable.
+        """
+        if not author_ids:
+            return []
+
+        posts_by_author = self.author_posts_cache.get_recent_posts(author_ids, before, limit)
+
+        # Every list is sorted newest first, the heap only holds the head of each list and the merge
+        # stops as soon as the page is full
+        return list(islice(heapq.merge(*posts_by_author.values(), reverse=True), limit))
@@ -0,0 +1,27 @@
+HOME_TIMELINE_KEY_PREFIX = "timeline:home"
+HOME_TIMELINE_MAX_LENGTH = 800  # Number of most recent post IDs kept per home timeline
+HOME_TIMELINE_FANOUT_BATCH_SIZE = 1000  # Followers updated per Redis round trip
+HOME_TIMELINE_TTL = 7 * 24 * 3600  # Seconds a materialised timeline is kept without being read
+
+# Users reading their timeline this many times within the activity window get a materialised timeline,
+# everyone else is served by merging the recent posts of the authors they follow
+HOME_TIMELINE_ACTIVE_READS = 3
+HOME_TIMELINE_ACTIVITY_KEY_PREFIX = "timeline:reads"
+HOME_TIMELINE_ACTIVITY_WINDOW = 24 * 3600  # Seconds
+
+# Authors with more followers are not fanned out on write, their posts are merged into timelines on read
+HOME_TIMELINE_FANOUT_MAX_FOLLOWERS = 10000
+HOME_TIMELINE_PULLED_AUTHORS_KEY = "timeline:pulled_authors"
+
+# Recent posts kept per author for timelines assembled on read
+AUTHOR_POSTS_KEY_PREFIX = "timeline:author"
+AUTHOR_POSTS_MAX_LENGTH = 100
+AUTHOR_POSTS_TTL = 7 * 24 * 3600  # Seconds
+AUTHOR_POSTS_LOAD_BATCH_SIZE = 1000  # Authors loaded from the database per query
+
+PULL_TIMELINE_CACHE_ALIAS = "default"  # Alias of the Django cache holding assembled pages
+PULL_TIMELINE_CACHE_KEY_PREFIX = "timeline:pull"
+PULL_TIMELINE_CACHE_TTL = 15  # Seconds
+
+TIMELINE_PAGE_SIZE = 20
+TIMELINE_MAX_PAGE_SIZE = 100
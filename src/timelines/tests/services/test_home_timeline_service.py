@@ -0,0 +1,220 @@
+from contextlib import nullcontext
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+from redis.exceptions import RedisError
+from rest_framework.exceptions import ValidationError
+
+from accounts.models import User
+from followers.models import Follow
+from followers.services.follow_service import FollowService
+from posts.models import Post
+from posts.services.post_service import PostService
+from timelines.services.author_posts_cache import AuthorPostsCache
+from timelines.services.home_timeline_service import HomeTimelineService
+from timelines.settings.timeline_settings import HOME_TIMELINE_ACTIVE_READS, HOME_TIMELINE_PULLED_AUTHORS_KEY
+
+
+def create_post(user: User, content: str, minutes_ago: int = 0) -> Post:
+    post = Post.objects.create(user=user, content=content)
+    Post.objects.filter(id=post.id).update(timestamp=timezone.now() - timedelta(minutes=minutes_ago))
+    post.refresh_from_db()
+    return post
+
+
+@pytest.fixture
+def users():
+    author = User.objects.create(username="author", email="author@example.com", cognito_id="author-id")
+    follower = User.objects.create(username="follower", email="follower@example.com", cognito_id="follower-id")
+    Follow.objects.create(follower=follower, followed=author)
+    return author, follower
+
+
+@pytest.mark.django_db
+def test_create_post_should_push_post_into_materialised_timelines(redis_client, users):
+    # Assign
+    author, follower = users
+    HomeTimelineService().build_timeline(follower)
+
+    # Act
+    PostService().create_post(author, "Hello followers")
+
+    # Assert
+    post = Post.objects.get(user=author)
+    assert redis_client.zscore(HomeTimelineService.get_key(follower.id), post.id) is not None
+    assert not redis_client.exists(HomeTimelineService.get_key(author.id))
+
+
+@pytest.mark.django_db
+def test_get_home_timeline_for_inactive_user_should_not_materialise_timeline(redis_client, users):
+    # Assign
+    author, follower = users
+    post = create_post(author, "Merged on read")
+
+    # Act
+    posts, _ = HomeTimelineService().get_home_timeline(follower)
+
+    # Assert
+    assert posts == [post]
+    assert not redis_client.exists(HomeTimelineService.get_key(follower.id))
+
+
+@pytest.mark.django_db
+def test_get_home_timeline_for_active_user_should_materialise_timeline(redis_client, users):
+    # Assign
+    author, follower = users
+    post = create_post(author, "Read often")
+    service = HomeTimelineService()
+
+    # Act
+    for _ in range(HOME_TIMELINE_ACTIVE_READS):
+        posts, _ = service.get_home_timeline(follower)
+
+    # Assert
+    assert posts == [post]
+    assert redis_client.zscore(HomeTimelineService.get_key(follower.id), post.id) is not None
+
+
+@pytest.mark.django_db
+def test_fan_out_post_with_many_followers_should_merge_posts_on_read(redis_client, users):
+    # Assign
+    author, follower = users
+    HomeTimelineService().build_timeline(follower)
+    post = create_post(author, "Popular post")
+    AuthorPostsCache().add_post(post)
+
+    # Act
+    with patch("timelines.services.home_timeline_service.HOME_TIMELINE_FANOUT_MAX_FOLLOWERS", 0):
+        HomeTimelineService().fan_out_post(post)
+    posts, _ = HomeTimelineService().get_home_timeline(follower)
+
+    # Assert
+    assert redis_client.sismember(HOME_TIMELINE_PULLED_AUTHORS_KEY, author.id)
+    assert posts == [post]
+
+
+@pytest.mark.django_db
+def test_get_home_timeline_should_page_with_cursor(redis_client, users):
+    # Assign
+    author, follower = users
+    posts = [create_post(author, f"Post {minutes}", minutes_ago=minutes) for minutes in range(5)]
+    service = HomeTimelineService()
+    service.build_timeline(follower)
+
+    # Act
+    first_page, cursor = service.get_home_timeline(follower, limit=3)
+    second_page, last_cursor = service.get_home_timeline(follower, cursor, limit=3)
+
+    # Assert
+    assert first_page == posts[:3]
+    assert second_page == posts[3:]
+    assert last_cursor is None
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("source", ["materialised", "pulled", "database"])
+def test_get_home_timeline_with_same_timestamp_across_pages_should_return_every_post(redis_client, users, source):
+    # Assign
+    author, follower = users
+    for index in range(4):
+        create_post(author, f"Post {index}")
+    Post.objects.update(timestamp=timezone.now())
+    posts = list(Post.objects.order_by("-id"))
+    service = HomeTimelineService()
+    if source == "materialised":
+        service.build_timeline(follower)
+    redis_error = patch.object(service.redis_client, "expire", side_effect=RedisError)
+
+    # Act
+    with redis_error if source == "database" else nullcontext():
+        first_page, cursor = service.get_home_timeline(follower, limit=3)
+        second_page, _ = service.get_home_timeline(follower, cursor, limit=3)
+
+    # Assert
+    assert first_page + second_page == posts
+
+
+@pytest.mark.django_db
+def test_get_home_timeline_with_redis_error_should_query_database(users):
+    # Assign
+    author, follower = users
+    post = create_post(author, "Served without Redis")
+    service = HomeTimelineService()
+
+    # Act
+    with patch.object(service.redis_client, "expire", side_effect=RedisError):
+        posts, _ = service.get_home_timeline(follower)
+
+    # Assert
+    assert posts == [post]
+
+
+@pytest.mark.django_db
+def test_get_home_timeline_with_invalid_cursor_should_raise_validation_error(users):
+    # Assign
+    _, follower = users
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        HomeTimelineService().get_home_timeline(follower, "not-a-cursor")
+
+
+@pytest.mark.django_db
+def test_delete_post_should_remove_post_from_timelines(redis_client, users):
+    # Assign
+    author, follower = users
+    HomeTimelineService().build_timeline(follower)
+    PostService().create_post(author, "Soon deleted")
+    post = Post.objects.get(user=author)
+
+    # Act
+    PostService.delete_post(author, post.id)
+
+    # Assert
+    post_ids = redis_client.zrange(HomeTimelineService.get_key(follower.id), 0, -1)
+    assert str(post.id).encode() not in post_ids
+
+
+@pytest.mark.django_db
+def test_delete_post_of_pulled_author_should_not_load_followers(redis_client, users, django_assert_num_queries):
+    # Assign
+    author, follower = users
+    post = create_post(author, "Never fanned out")
+    redis_client.sadd(HOME_TIMELINE_PULLED_AUTHORS_KEY, author.id)
+
+    # Act & Assert
+    with django_assert_num_queries(0):
+        HomeTimelineService().remove_post(post.id, author.id)
+
+
+@pytest.mark.django_db
+def test_unfollow_user_should_remove_author_posts_from_timeline(redis_client, users):
+    # Assign
+    author, follower = users
+    HomeTimelineService().build_timeline(follower)
+    PostService().create_post(author, "Seen until unfollowed")
+
+    # Act
+    FollowService.unfollow_user(follower, author)
+    posts, _ = HomeTimelineService().get_home_timeline(follower)
+
+    # Assert
+    assert posts == []
+
+
+@pytest.mark.django_db
+def test_follow_user_should_add_author_posts_to_timeline(redis_client, users):
+    # Assign
+    author, follower = users
+    other_author = User.objects.create(username="other", email="other@example.com", cognito_id="other-id")
+    post = create_post(other_author, "Seen after following")
+    HomeTimelineService().build_timeline(follower)
+
+    # Act
+    FollowService.follow_user(follower, other_author)
+    posts, _ = HomeTimelineService().get_home_timeline(follower)
+
+    # Assert
+    assert posts == [post]
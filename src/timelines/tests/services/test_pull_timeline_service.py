@@ -0,0 +1,163 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+
+from accounts.models import User
+from followers.models import Follow
+from posts.models import Post
+from posts.services.post_service import PostService
+from timelines.services.author_posts_cache import AuthorPostsCache
+from timelines.services.pull_timeline_service import PullTimelineService
+
+
+def create_post(user: User, content: str, minutes_ago: int = 0) -> Post:
+    post = Post.objects.create(user=user, content=content)
+    Post.objects.filter(id=post.id).update(timestamp=timezone.now() - timedelta(minutes=minutes_ago))
+    post.refresh_from_db()
+    return post
+
+
+@pytest.fixture
+def follower():
+    return User.objects.create(username="follower", email="follower@example.com", cognito_id="follower-id")
+
+
+@pytest.fixture
+def authors(follower):
+    authors = [
+        User.objects.create(username=f"author{index}", email=f"author{index}@example.com", cognito_id=f"author-{index}")
+        for index in range(3)
+    ]
+    for author in authors:
+        Follow.objects.create(follower=follower, followed=author)
+    return authors
+
+
+@pytest.mark.django_db
+def test_get_entries_should_merge_posts_of_followed_authors_newest_first(redis_client, follower, authors):
+    # Assign
+    posts = [create_post(authors[minutes % 3], f"Post {minutes}", minutes_ago=minutes) for minutes in range(6)]
+
+    # Act
+    entries = PullTimelineService().get_entries(follower, limit=4)
+
+    # Assert
+    assert [post_id for _, post_id in entries] == [post.id for post in posts[:4]]
+
+
+@pytest.mark.django_db
+def test_get_entries_with_max_score_should_continue_after_previous_page(redis_client, follower, authors):
+    # Assign
+    posts = [create_post(authors[minutes % 3], f"Post {minutes}", minutes_ago=minutes) for minutes in range(6)]
+    service = PullTimelineService()
+    first_page = service.get_entries(follower, limit=4)
+
+    # Act
+    second_page = service.get_entries(follower, first_page[-1], limit=4)
+
+    # Assert
+    assert [post_id for _, post_id in second_page] == [post.id for post in posts[4:]]
+
+
+@pytest.mark.django_db
+def test_get_entries_should_cache_assembled_page(redis_client, follower, authors):
+    # Assign
+    create_post(authors[0], "Cached page")
+    service = PullTimelineService()
+    service.get_entries(follower)
+
+    # Act
+    with patch.object(AuthorPostsCache, "get_recent_posts") as mock_get_recent_posts:
+        service.get_entries(follower)
+
+    # Assert
+    mock_get_recent_posts.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_get_entries_should_cache_page_under_page_key(redis_client, follower, authors):
+    # Assign
+    create_post(authors[0], "Cached page")
+    service = PullTimelineService()
+    first_page = service.get_entries(follower, limit=1)
+
+    # Act
+    entries = service.get_entries(follower, first_page[-1], limit=1)
+
+    # Assert
+    assert service.cache.get(PullTimelineService.get_page_key(follower.id, None, 1)) == first_page
+    assert service.cache.get(PullTimelineService.get_page_key(follower.id, first_page[-1], 1)) == entries
+
+
+@pytest.mark.django_db
+def test_get_recent_posts_with_loaded_lists_should_not_query_database(
+        redis_client, authors, django_assert_num_queries
+):
+    # Assign
+    create_post(authors[0], "Loaded once")
+    author_ids = [author.id for author in authors]
+    cache = AuthorPostsCache()
+    cache.get_recent_posts(author_ids, None, 10)
+
+    # Act & Assert
+    with django_assert_num_queries(0):
+        posts_by_author = cache.get_recent_posts(author_ids, None, 10)
+
+    assert len(posts_by_author[authors[0].id]) == 1
+    assert posts_by_author[authors[1].id] == []
+
+
+@pytest.mark.django_db
+def test_create_post_should_add_post_to_loaded_author_list(redis_client, authors):
+    # Assign
+    author = authors[0]
+    cache = AuthorPostsCache()
+    cache.get_recent_posts([author.id], None, 10)
+
+    # Act
+    PostService().create_post(author, "Added to the list")
+
+    # Assert
+    post = Post.objects.get(user=author)
+    assert cache.get_recent_posts([author.id], None, 10)[author.id][0][1] == post.id
+
+
+@pytest.mark.django_db
+def test_get_recent_posts_with_truncated_list_should_read_older_posts_from_database(redis_client, authors):
+    # Assign
+    author = authors[0]
+    posts = [create_post(author, f"Post {minutes}", minutes_ago=minutes) for minutes in range(5)]
+
+    # Act
+    with patch("timelines.services.author_posts_cache.AUTHOR_POSTS_MAX_LENGTH", 2):
+        cache = AuthorPostsCache()
+        cache.get_recent_posts([author.id], None, 2)
+        posts_by_author = cache.get_recent_posts([author.id], None, 4)
+
+    # Assert
+    assert [post_id for _, post_id in posts_by_author[author.id]] == [post.id for post in posts[:4]]
+
+
+@pytest.mark.django_db
+def test_get_recent_posts_with_post_added_while_loading_should_not_store_stale_list(redis_client, authors):
+    # Assign
+    author = authors[0]
+    cache = AuthorPostsCache()
+    query_recent_posts = AuthorPostsCache.query_recent_posts
+
+    def query_then_add_post(*args):
+        posts_by_author = query_recent_posts(*args)
+        PostService().create_post(author, "Added while loading")
+        return posts_by_author
+
+    with patch.object(AuthorPostsCache, "query_recent_posts", side_effect=query_then_add_post):
+        cache.get_recent_posts([author.id], None, 10)
+
+    # Act
+    posts_by_author = cache.get_recent_posts([author.id], None, 10)
+
+    # Assert
+    post = Post.objects.get(user=author)
+    assert [post_id for _, post_id in posts_by_author[author.id]] == [post.id]
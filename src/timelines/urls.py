@@ -0,0 +1,7 @@
+from django.urls import path
+
+from timelines import views
+
+urlpatterns = [
+    path("timeline", views.get_home_timeline, name="home_timeline"),
+]
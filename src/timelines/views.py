@@ -0,0 +1,24 @@
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from posts.serializers import PostSerializer
+from posts.services.post_service import PostService
+from timelines.services.home_timeline_service import HomeTimelineService
+from timelines.settings.timeline_settings import TIMELINE_MAX_PAGE_SIZE, TIMELINE_PAGE_SIZE
+from utils.cursor import get_page_size
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def get_home_timeline(request):
+    limit = get_page_size(request.query_params.get("limit"), TIMELINE_PAGE_SIZE, TIMELINE_MAX_PAGE_SIZE)
+    posts, next_cursor = HomeTimelineService().get_home_timeline(
+        request.user, request.query_params.get("cursor"), limit
+    )
+
+    liked_post_ids = PostService.get_liked_post_ids(request.user, [post.id for post in posts])
+    serializer = PostSerializer(posts, many=True, context={"liked_post_ids": liked_post_ids})
+
+    return Response({"results": serializer.data, "next_cursor": next_cursor}, status=status.HTTP_200_OK)
@@ -0,0 +1,67 @@
+import hashlib
+import math
+
+import redis
+
+
+class RedisBloomFilter:
+    """
+    Bloom filter stored in a Redis bitmap.
+
+    A negative answer is definite, a positive answer can be wrong with a probability close to the configured
+    error rate, as long as the number of added values stays below the capacity.
+    """
+
+    def __init__(self, client: redis.Redis, key: str, capacity: int, error_rate: float):
+        """
+        :param client: Redis client holding the bitmap.
+        :param key: Key of the bitmap.
+        :param capacity: Expected number of values added to the filter.
+        :param error_rate: Accepted probability of false positives.
+        """
+        self.client = client
+        self.key = key
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+
+    def add(self, *values: str) -> None:
+        """
+        Adds the values to the filter, using a single round trip.
+        """
+        pipeline = self.client.pipeline(transaction=False)
+        for value in values:
+            for offset in self.__get_offsets(value):
+                pipeline.setbit(self.key, offset, 1)
+        pipeline.execute()
+
+    def might_contain(self, value: str) -> bool:
+        """
+        :param value: Value to look up.
+        :return: False if the value was definitely never added, True if it probably was.
+        """
+        pipeline = self.client.pipeline(transaction=False)
+        self.queue_lookup(pipeline, value)
+
+        return all(pipeline.execute())
+
+    def queue_lookup(self, pipeline, value: str) -> None:
+        """
+        Queues the lookup of the value on a pipeline, so lookups in several filters share one round trip.
+        The value was probably added if all of the 'hash_count' queued results are set.
+
+        :param pipeline: Pipeline of the Redis client.
+        :param value: Value to look up.
+        """
+        for offset in self.__get_offsets(value):
+            pipeline.getbit(self.key, offset)
+
+    def clear(self) -> None:
+        self.client.delete(self.key)
+
+    def __get_offsets(self, value: str) -> list[int]:
+        # Double hashing derives all the bit offsets from the two halves of a single digest
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first_hash = int.from_bytes(digest[:8], "big")
+        second_hash = int.from_bytes(digest[8:], "big") | 1
+
+        return [(first_hash + i * second_hash) % self.size for i in range(self.hash_count)]
@@ -0,0 +1,58 @@
+import base64
+import json
+
+from rest_framework.exceptions import ValidationError
+
+
+def encode_cursor(*values) -> str:
+    """
+    Encodes the position of the last returned item into an opaque pagination cursor.
+
+    :param values: JSON serializable values identifying the position, e.g. timestamp and ID of the last item.
+    :return: URL-safe cursor.
+    """
+    return base64.urlsafe_b64encode(json.dumps(values, separators=(",", ":")).encode()).decode()
+
+
+def decode_cursor(cursor: str, length: int) -> list:
+    """
+    Decodes a cursor created by encode_cursor.
+
+    :param cursor: Cursor received from the client.
+    :param length: Number of values the cursor is expected to hold.
+    :return: Values stored in the cursor.
+    :raises ValidationError: If the cursor is malformed.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, UnicodeError):
+        raise ValidationError({"cursor": "Invalid cursor."})
+
+    if not isinstance(values, list) or len(values) != length:
+        raise ValidationError({"cursor": "Invalid cursor."})
+
+    return values
+
+
+def get_page_size(limit: str | None, default: int, maximum: int) -> int:
+    """
+    Parses the requested page size.
+
+    :param limit: Value of the 'limit' query parameter, None if it was not provided.
+    :param default: Page size used when no limit was requested.
+    :param maximum: Largest page size a client may request.
+    :return: The page size, capped at the maximum.
+    :raises ValidationError: If the limit is not a positive number.
+    """
+    if limit is None:
+        return default
+
+    try:
+        limit = int(limit)
+    except ValueError:
+        raise ValidationError({"limit": "Limit must be a number."})
+
+    if limit < 1:
+        raise ValidationError({"limit": "Limit must be positive."})
+
+    return min(limit, maximum)
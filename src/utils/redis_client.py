@@ -0,0 +1,26 @@
+import threading
+
+import redis
+from django.conf import settings
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_redis_client() -> redis.Redis:
+    """
+    Returns the Redis client shared by the whole process.
+
+    The Django cache API covers plain key/value caching, this client is meant for the Redis data structures
+    (sets, sorted sets, bitmaps) it does not expose. It connects to the same Redis instance as the cache.
+
+    :return: Redis client backed by a connection pool.
+    """
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = redis.Redis.from_url(settings.REDIS_URL)
+
+    return _client